@@ -3,19 +3,40 @@ Generators translate between a SchemaDefinition and an alternative
 representation such as JsonSchema
 """
 
-from linkml.generators.javagen import JavaGenerator
-from linkml.generators.jsonldcontextgen import ContextGenerator
-from linkml.generators.jsonldgen import JSONLDGenerator
-from linkml.generators.jsonschemagen import JsonSchemaGenerator
-from linkml.generators.owlgen import OwlSchemaGenerator
-from linkml.generators.panderagen import PanderaGenerator
-from linkml.generators.pydanticgen import PydanticGenerator
-from linkml.generators.pythongen import PythonGenerator
-from linkml.generators.rdfgen import RDFGenerator
-from linkml.generators.shaclgen import ShaclGenerator
-from linkml.generators.shexgen import ShExGenerator
-from linkml.generators.sqlalchemygen import SQLAlchemyGenerator
-from linkml.generators.sqltablegen import SQLTableGenerator
+import importlib
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from linkml.generators.javagen import JavaGenerator
+    from linkml.generators.jsonldcontextgen import ContextGenerator
+    from linkml.generators.jsonldgen import JSONLDGenerator
+    from linkml.generators.jsonschemagen import JsonSchemaGenerator
+    from linkml.generators.owlgen import OwlSchemaGenerator
+    from linkml.generators.panderagen import PanderaGenerator
+    from linkml.generators.pydanticgen import PydanticGenerator
+    from linkml.generators.pythongen import PythonGenerator
+    from linkml.generators.rdfgen import RDFGenerator
+    from linkml.generators.shaclgen import ShaclGenerator
+    from linkml.generators.shexgen import ShExGenerator
+    from linkml.generators.sqlalchemygen import SQLAlchemyGenerator
+    from linkml.generators.sqltablegen import SQLTableGenerator
+
+# Generators are imported when first used, so that importing one generator does not import them all
+_GENERATOR_MODULES = {
+    "JavaGenerator": "javagen",
+    "ContextGenerator": "jsonldcontextgen",
+    "JSONLDGenerator": "jsonldgen",
+    "JsonSchemaGenerator": "jsonschemagen",
+    "OwlSchemaGenerator": "owlgen",
+    "PanderaGenerator": "panderagen",
+    "PydanticGenerator": "pydanticgen",
+    "PythonGenerator": "pythongen",
+    "RDFGenerator": "rdfgen",
+    "ShaclGenerator": "shaclgen",
+    "ShExGenerator": "shexgen",
+    "SQLAlchemyGenerator": "sqlalchemygen",
+    "SQLTableGenerator": "sqltablegen",
+}
 
 __all__ = [
     "csvgen",
@@ -56,6 +77,18 @@ __all__ = [
     "RDFGenerator",
 ]
 
+
+def __getattr__(name: str):
+    if name in _GENERATOR_MODULES:
+        value = getattr(importlib.import_module(f"{__name__}.{_GENERATOR_MODULES[name]}"), name)
+    elif name in __all__:
+        value = importlib.import_module(f"{__name__}.{name}")
+    else:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    globals()[name] = value
+    return value
+
+
 # TODO: deprecate usage of these
 # GENERATOR_BASE = "0.9"
 
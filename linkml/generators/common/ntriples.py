@@ -0,0 +1,69 @@
+"""
+Write the triples of RDF generators as N-Triples while they are generated.
+
+Building a complete :class:`rdflib.Graph` before serializing it costs far more memory than the
+triples themselves, as the graph indexes every triple several times. Generators which support
+streaming add their triples to an :class:`NTriplesWriter` instead, which writes each triple
+to a stream as soon as it is added. Generators which need to look up triples they have already
+added can collect the triples of one element in a small graph and write it with
+:meth:`NTriplesWriter.add_graph` once the element is complete.
+"""
+
+from collections.abc import Iterable
+from typing import Any, TextIO
+
+from rdflib import RDF, BNode, Graph
+from rdflib.plugins.serializers.nt import _nt_row
+from rdflib.term import Node
+
+_Triple = tuple[Node, Node, Node]
+
+
+class NTriplesWriter:
+    """A sink for triples which writes them to a stream as N-Triples
+
+    It can be used in place of a :class:`rdflib.Graph` by code which only adds triples. As in a
+    graph, every triple is written once: triples without blank nodes are remembered, while
+    triples with blank nodes are assumed to be new, as blank nodes are created for each element.
+
+    :param stream: Stream to which the triples are written
+    """
+
+    def __init__(self, stream: TextIO) -> None:
+        self.stream = stream
+        self._written: set[_Triple] = set()
+
+    def add(self, triple: _Triple) -> None:
+        if not any(isinstance(term, BNode) for term in triple):
+            if triple in self._written:
+                return
+            self._written.add(triple)
+        self.stream.write(_nt_row(triple))
+
+    def add_graph(self, graph: Graph) -> None:
+        """Write all the triples of a graph"""
+        for triple in graph:
+            self.add(triple)
+
+    def bind(self, prefix: str, namespace: Any, *args, **kwargs) -> None:
+        """Prefixes are not used in N-Triples"""
+
+
+def add_list(graph: Any, node: BNode, items: Iterable[Node]) -> None:
+    """Add an RDF list to a graph or :class:`NTriplesWriter`
+
+    The triples are the same as those added by :class:`rdflib.collection.Collection`, without
+    reading the graph.
+
+    :param graph: Graph or writer to add the list to
+    :param node: Node of the first element of the list
+    :param items: Elements of the list. Nothing is added if there are none.
+    """
+    items = list(items)
+    if not items:
+        return
+    for i, item in enumerate(items):
+        graph.add((node, RDF.first, item))
+        rest = BNode() if i < len(items) - 1 else RDF.nil
+        graph.add((node, RDF.rest, rest))
+        node = rest
@@ -6,7 +6,7 @@ import os
 from csv import DictWriter
 from dataclasses import dataclass
 from io import StringIO
-from typing import Optional
+from typing import Optional, Union
 
 import click
 from linkml_runtime.linkml_model.meta import ClassDefinition, ClassDefinitionName
@@ -43,7 +43,7 @@ class CsvGenerator(Generator):
     """Python dictwriter"""
 
     _str_io: Optional[StringIO] = None
-    """String that the writer outputs to"""
+    """Buffer that the writer outputs to, emptied after every row"""
 
     def __post_init__(self):
         super().__post_init__()
@@ -57,7 +57,7 @@ class CsvGenerator(Generator):
             out = "\n".join([out, f"# version: {self.schema.version}"])
         return out
 
-    def visit_schema(self, classes: list[ClassDefinitionName] = None, **_) -> None:
+    def visit_schema(self, classes: list[ClassDefinitionName] = None, **_) -> str:
         # Note: classes comes from the "root" argument
         self.closure = set()
 
@@ -75,8 +75,9 @@ class CsvGenerator(Generator):
         dialect: str = "excel" if self.format == "csv" else "excel-tab"
         self.writer = DictWriter(self._str_io, ["id", "mappings", "description"], dialect=dialect)
         self.writer.writeheader()
+        return self._take_output()
 
-    def visit_class(self, cls: ClassDefinition) -> bool:
+    def visit_class(self, cls: ClassDefinition) -> Union[str, bool]:
         # TODO: find out what to do with mappings
         if not self.closure or cls.name in self.closure:
             self.writer.writerow(
@@ -87,11 +88,15 @@ class CsvGenerator(Generator):
                     "description": be(cls.description),
                 }
             )
-            return True
+            return self._take_output()
         return False
 
-    def end_schema(self, **kwargs) -> str:
-        return self._str_io.getvalue()
+    def _take_output(self) -> str:
+        """Rows written since the last call, so that each row is emitted as soon as it is visited"""
+        out = self._str_io.getvalue()
+        self._str_io.seek(0)
+        self._str_io.truncate()
+        return out
 
 
 @shared_arguments(CsvGenerator)
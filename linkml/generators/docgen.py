@@ -2,6 +2,7 @@ import importlib.util
 import logging
 import os
 from collections.abc import Iterable, Iterator
+from concurrent.futures import ProcessPoolExecutor, as_completed
 from copy import deepcopy
 from dataclasses import dataclass, field
 from enum import Enum
@@ -31,6 +32,7 @@ from linkml._version import __version__
 from linkml.generators.erdiagramgen import ERDiagramGenerator
 from linkml.generators.plantumlgen import PlantumlGenerator
 from linkml.utils.generator import Generator, shared_arguments
+from linkml.utils.induced_schema import induced_schema
 from linkml.workspaces.example_runner import ExampleRunner
 
 
@@ -59,6 +61,19 @@ TYPE_SUBFOLDER = "types"
 SUBSET_SUBFOLDER = "subsets"
 
 
+_worker_generator: Optional["DocGenerator"] = None
+
+
+def _init_worker(generator: "DocGenerator") -> None:
+    global _worker_generator
+    _worker_generator = generator
+
+
+def _render_pages(kind: str, names: list[str], directory: str, template_vars: dict[str, Any]) -> None:
+    """Render pages with the generator of a worker process, see :meth:`DocGenerator.render_pages`"""
+    _worker_generator.render_pages(kind, names, directory, template_vars)
+
+
 def enshorten(input):
     """
     Custom filters to truncate any long text intended to go in a table
@@ -173,7 +188,12 @@ class DocGenerator(Generator):
     hierarchical_class_view: bool = False
     render_imports: bool = False
 
+    jobs: int = 1
+    """Number of processes in which element pages are rendered"""
+
     def __post_init__(self):
+        if self.jobs < 1:
+            raise ValueError(f"jobs must be at least 1, got {self.jobs}")
         dialect = self.dialect
         if dialect is not None:
             # TODO: simplify this
@@ -217,64 +237,100 @@ class DocGenerator(Generator):
         if self._is_single_file_format(self.format):
             self.logger.info(f"{self.format} is a single-page format, skipping non-index elements")
             return
-        self.logger.debug("Processing Schemas...")
-        template = self._get_template("schema")
-        for schema_name in sv.imports_closure():
-            self.logger.debug(f"  Generating doc for {schema_name}")
-            imported_schema = sv.schema_map.get(schema_name)
-            out_str = template.render(gen=self, schema=imported_schema, schemaview=sv, **template_vars)
-            self._write(
-                out_str,
-                f"{directory}/{SCHEMA_SUBFOLDER}" if self.subfolder_type_separation else directory,
-                imported_schema.name,
+        pages = self._plan_pages(directory)
+        # Each worker receives a copy of this generator and renders a share of the pages of every kind
+        chunks = [
+            (kind, names[i :: self.jobs], page_directory)
+            for kind, names, page_directory in pages
+            for i in range(min(self.jobs, len(names)))
+        ]
+        if self.jobs > 1 and len(chunks) > 1:
+            with ProcessPoolExecutor(
+                max_workers=min(self.jobs, len(chunks)), initializer=_init_worker, initargs=(self,)
+            ) as executor:
+                futures = [
+                    executor.submit(_render_pages, kind, names, page_directory, template_vars)
+                    for kind, names, page_directory in chunks
+                ]
+                for future in as_completed(futures):
+                    future.result()
+        else:
+            for kind, names, page_directory in pages:
+                self.render_pages(kind, names, page_directory, template_vars)
+
+    def _plan_pages(self, directory: str) -> list[tuple[str, list[str], str]]:
+        """
+        Names of the elements which get a page, by kind of element
+
+        :param directory: directory in which documents are to be written
+        :return: list of element kind, element names and directory of the pages
+        """
+        sv = self.schemaview
+        subfolders = {
+            "schema": SCHEMA_SUBFOLDER,
+            "class": CLASS_SUBFOLDER,
+            "slot": SLOT_SUBFOLDER,
+            "enum": ENUM_SUBFOLDER,
+            "type": TYPE_SUBFOLDER,
+            "subset": SUBSET_SUBFOLDER,
+        }
+        elements = {
+            "schema": list(sv.imports_closure()),
+            "class": [cn for cn, c in sv.all_classes().items() if not self._is_external(c)],
+            "slot": [sn for sn, s in sv.all_slots().items() if not self._is_external(s)],
+            "enum": [en for en, e in sv.all_enums().items() if not self._is_external(e)],
+            "type": [tn for tn, t in sv.all_types().items() if not self._exclude_type(t)],
+            "subset": [sn for sn, s in sv.all_subsets().items() if not self._is_external(s)],
+        }
+        return [
+            (
+                kind,
+                names,
+                f"{directory}/{subfolders[kind]}" if self.subfolder_type_separation else directory,
             )
-        self.logger.debug("Processing Classes...")
-        template = self._get_template("class")
-        for cn, c in sv.all_classes().items():
-            if self._is_external(c):
-                continue
-            n = self.name(c)
-            self.logger.debug(f"  Generating doc for {n}")
-            out_str = template.render(gen=self, element=c, schemaview=sv, **template_vars)
-            self._write(out_str, f"{directory}/{CLASS_SUBFOLDER}" if self.subfolder_type_separation else directory, n)
-        self.logger.debug("Processing Slots...")
-        template = self._get_template("slot")
-        for sn, s in sv.all_slots().items():
-            if self._is_external(s):
-                continue
-            n = self.name(s)
-            self.logger.debug(f"  Generating doc for {n}")
-            s = sv.induced_slot(sn)
-            out_str = template.render(gen=self, element=s, schemaview=sv, **template_vars)
-            self._write(out_str, f"{directory}/{SLOT_SUBFOLDER}" if self.subfolder_type_separation else directory, n)
-        self.logger.debug("Processing Enums...")
-        template = self._get_template("enum")
-        for en, e in sv.all_enums().items():
-            if self._is_external(e):
-                continue
-            n = self.name(e)
-            self.logger.debug(f"  Generating doc for {n}")
-            out_str = template.render(gen=self, element=e, schemaview=sv, **template_vars)
-            self._write(out_str, f"{directory}/{ENUM_SUBFOLDER}" if self.subfolder_type_separation else directory, n)
-        self.logger.debug("Processing Types...")
-        template = self._get_template("type")
-        for tn, t in sv.all_types().items():
-            if self._exclude_type(t):
-                continue
-            n = self.name(t)
-            self.logger.debug(f"  Generating doc for {n}")
-            t = sv.induced_type(tn)
-            out_str = template.render(gen=self, element=t, schemaview=sv, **template_vars)
-            self._write(out_str, f"{directory}/{TYPE_SUBFOLDER}" if self.subfolder_type_separation else directory, n)
-        self.logger.debug("Processing Subsets...")
-        template = self._get_template("subset")
-        for _, s in sv.all_subsets().items():
-            if self._is_external(c):
+            for kind, names in elements.items()
+        ]
+
+    def render_pages(self, kind: str, names: list[str], directory: str, template_vars: dict[str, Any]) -> None:
+        """
+        Render and write the pages of elements of one kind
+
+        :param kind: kind of element, e.g. class, slot, schema
+        :param names: names of the elements, or of the schemas for the schema kind
+        :param directory: directory in which the pages are written
+        :param template_vars: additional variables passed to the template
+        """
+        sv = self.schemaview
+        self.logger.debug(f"Processing {kind} pages...")
+        template = self._get_template(kind)
+        for name in names:
+            self.logger.debug(f"  Generating doc for {name}")
+            if kind == "schema":
+                imported_schema = sv.schema_map.get(name)
+                out_str = template.render(gen=self, schema=imported_schema, schemaview=sv, **template_vars)
+                self._write(out_str, directory, imported_schema.name)
                 continue
-            n = self.name(s)
-            self.logger.debug(f"  Generating doc for {n}")
-            out_str = template.render(gen=self, element=s, schemaview=sv, **template_vars)
-            self._write(out_str, f"{directory}/{SUBSET_SUBFOLDER}" if self.subfolder_type_separation else directory, n)
+            element = {
+                "class": sv.get_class,
+                "slot": sv.get_slot,
+                "enum": sv.get_enum,
+                "type": sv.get_type,
+                "subset": sv.get_subset,
+            }[kind](name)
+            # pages are named after the element as declared, rather than the induced element
+            page_name = self.name(element)
+            if kind == "slot":
+                element = induced_schema(sv).induced_slot(name)
+            elif kind == "type":
+                element = sv.induced_type(name)
+            out_str = template.render(gen=self, element=element, schemaview=sv, **template_vars)
+            self._write(out_str, directory, page_name)
+
+    def __getstate__(self) -> dict[str, Any]:
+        # Namespaces cannot be unpickled, and are not needed to render pages in a worker process
+        state = self.__dict__.copy()
+        state["namespaces"] = None
+        return state
 
     def _write(self, out_str: str, directory: str, name: str) -> None:
         """
@@ -288,6 +344,10 @@ class DocGenerator(Generator):
         path = Path(directory)
         path.mkdir(parents=True, exist_ok=True)
         file_name = f"{name}.{self._file_suffix()}"
+        # Files whose content did not change are left alone, so that their modification time is kept
+        if (path / file_name).is_file() and (path / file_name).read_text(encoding="UTF-8") == out_str:
+            self.logger.debug(f"  Unchanged file: {file_name}")
+            return
         self.logger.debug(f"  Writing file: {file_name}")
         with open(path / file_name, "w", encoding="UTF-8") as stream:
             stream.write(out_str)
@@ -758,7 +818,7 @@ class DocGenerator(Generator):
                 raise ValueError(f"Inferred only applicable for classes, not {element.name} {type(element)}")
             # TODO: move this code to schemaview
             c = deepcopy(element)
-            attrs = self.schemaview.class_induced_slots(c.name)
+            attrs = induced_schema(self.schemaview).class_induced_slots(c.name)
             for a in attrs:
                 c.attributes[a.name] = a
             c.slots = []
@@ -773,7 +833,7 @@ class DocGenerator(Generator):
         :param class_name:
         :return: iterator
         """
-        elts = self.schemaview.class_induced_slots(class_name)
+        elts = induced_schema(self.schemaview).class_induced_slots(class_name)
         _ensure_ranked(elts)
         yield from elts
 
@@ -916,7 +976,8 @@ class DocGenerator(Generator):
         :return: list of all own attributes of a class
         """
         return [
-            self.inject_slot_info(self.schemaview.induced_slot(sn, cls.name)) for sn in self.get_direct_slot_names(cls)
+            self.inject_slot_info(induced_schema(self.schemaview).induced_slot(sn, cls.name))
+            for sn in self.get_direct_slot_names(cls)
         ]
 
     def get_indirect_slots(self, cls: ClassDefinition) -> list[SlotDefinition]:
@@ -930,7 +991,7 @@ class DocGenerator(Generator):
         direct_slot_names = self.get_direct_slot_names(cls)
         return [
             self.inject_slot_info(slot)
-            for slot in sv.class_induced_slots(cls.name)
+            for slot in induced_schema(sv).class_induced_slots(cls.name)
             if slot.name not in direct_slot_names
         ]
 
@@ -944,7 +1005,7 @@ class DocGenerator(Generator):
         :return: list of classes
         """
         sv = self.schemaview
-        induced_slot = sv.induced_slot(slot_name, class_name)
+        induced_slot = induced_schema(sv).induced_slot(slot_name, class_name)
         ancestors = sv.class_ancestors(class_name)
         return list(set(induced_slot.domain_of).intersection(ancestors))
 
@@ -1138,6 +1199,14 @@ YAML, and including it when necessary but not by default (e.g. in documentation
 Whether to truncate long (potentially spanning multiple lines) descriptions of classes, slots, etc., in the docs.
 Set to true for truncated descriptions, and false to display full descriptions.""",
 )
+@click.option(
+    "--jobs",
+    "-j",
+    type=click.IntRange(min=1),
+    default=1,
+    show_default=True,
+    help="Number of processes in which class, slot, enum, type and subset pages are rendered",
+)
 @click.version_option(__version__, "-V", "--version")
 @click.command(name="doc")
 def cli(
@@ -1172,6 +1241,9 @@ def cli(
     Person-001.yaml, Person-002.yaml, etc.
 
     Currently examples must be in yaml
+
+    Files whose content is unchanged are not rewritten. For large schemas, pages can be
+    rendered in several processes with the --jobs argument.
     """
     gen = DocGenerator(
         yamlfile,
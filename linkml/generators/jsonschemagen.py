@@ -1,6 +1,7 @@
 import json
 import logging
 import os
+from collections import Counter
 from copy import deepcopy
 from dataclasses import dataclass
 from typing import Any, Optional, Union
@@ -26,6 +27,7 @@ from linkml.generators.common.lifecycle import LifecycleMixin
 from linkml.generators.common.type_designators import get_type_designator_value
 from linkml.utils.generator import Generator, shared_arguments
 from linkml.utils.helpers import get_range_associated_slots
+from linkml.utils.induced_schema import induced_schema
 
 logger = logging.getLogger(__name__)
 
@@ -49,6 +51,7 @@ json_schema_types: dict[str, tuple[str, Optional[str]]] = {
 
 class JsonSchema(dict):
     OPTIONAL_IDENTIFIER_SUFFIX = "__identifier_optional"
+    SHARED_PROPERTY_SUFFIX = "__property"
 
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
@@ -123,6 +126,39 @@ class JsonSchema(dict):
 
             self["not"]["required"].append(canonical_name)
 
+    def deduplicate_properties(self) -> None:
+        """Move property subschemas which are repeated in several definitions to shared ``$defs``
+
+        A repeated subschema is replaced by a ``$ref`` to a definition named after the property,
+        e.g. ``#/$defs/name__property``, when that makes the schema smaller.
+        """
+        properties = [
+            (name, subschemas)
+            for definition in self.get("$defs", {}).values()
+            for subschemas in [definition.get("properties", {})]
+            for name in subschemas
+        ]
+        keys = [json.dumps(subschemas[name], sort_keys=True) for name, subschemas in properties]
+        counts = Counter(keys)
+        shared_names: dict[str, str] = {}
+        for (name, subschemas), key in zip(properties, keys):
+            if counts[key] < 2:
+                continue
+            if key not in shared_names:
+                def_name = name + self.SHARED_PROPERTY_SUFFIX
+                n = 1
+                while def_name in self["$defs"]:
+                    n += 1
+                    def_name = f"{name}{self.SHARED_PROPERTY_SUFFIX}_{n}"
+                ref_size = len(json.dumps({"$ref": f"#/$defs/{def_name}"}))
+                # the definition is written once, and each use becomes a reference
+                if len(key) * counts[key] <= len(key) + ref_size * counts[key]:
+                    counts[key] = 0
+                    continue
+                self["$defs"][def_name] = subschemas[name]
+                shared_names[key] = def_name
+            subschemas[name] = JsonSchema({"$ref": f"#/$defs/{shared_names[key]}"})
+
     def add_keyword(self, keyword: str, value: Any):
         if value is None:
             return
@@ -180,6 +216,14 @@ class JsonSchema(dict):
         return JsonSchema(schema)
 
 
+_CLASS_METASLOTS = ("owner", "domain_of")
+
+
+def _slot_fingerprint(slot: SlotDefinition) -> str:
+    """Definition of an induced slot, without the metaslots which depend on the class it is induced for"""
+    return repr({k: v for k, v in vars(slot).items() if k not in _CLASS_METASLOTS and v not in (None, [], {})})
+
+
 class SchemaResult(build.SchemaResult):
     """Top-level result of building a json schema"""
 
@@ -265,6 +309,10 @@ class JsonSchemaGenerator(Generator, LifecycleMixin):
     include_null: bool = True
     """Whether to include a "null" type in optional slots"""
 
+    deduplicate_properties: bool = False
+    """Whether to move property subschemas which are repeated across classes into shared ``$defs``,
+    which makes the schemas of large models much smaller (see :meth:`JsonSchema.deduplicate_properties`)"""
+
     def __post_init__(self):
         if self.topClass:
             logger.warning("topClass is deprecated - use top_class")
@@ -278,6 +326,8 @@ class JsonSchemaGenerator(Generator, LifecycleMixin):
 
     def start_schema(self, inline: bool = False):
         self.inline = inline
+        # subschemas of class slots, by the definition of the induced slot
+        self._slot_subschemas: dict[tuple, JsonSchema] = {}
 
         self.top_level_schema = JsonSchema(
             {
@@ -314,7 +364,7 @@ class JsonSchemaGenerator(Generator, LifecycleMixin):
             class_subschema["title"] = cls.title
 
         class_slots = self.before_generate_class_slots(
-            self.schemaview.class_induced_slots(cls.name), cls, self.schemaview
+            induced_schema(self.schemaview).class_induced_slots(cls.name), cls, self.schemaview
         )
         for slot_definition in class_slots:
             self.handle_class_slot(subschema=class_subschema, cls=cls, slot=slot_definition)
@@ -490,7 +540,7 @@ class JsonSchemaGenerator(Generator, LifecycleMixin):
                 else:
                     reference = slot.range
             else:
-                id_slot = self.schemaview.get_identifier_slot(slot.range)
+                id_slot = induced_schema(self.schemaview).identifier_slot(slot.range)
                 return self.get_type_info_for_slot_subschema(id_slot)
 
         return (typ, fmt, reference)
@@ -654,14 +704,18 @@ class JsonSchemaGenerator(Generator, LifecycleMixin):
 
     def handle_class_slot(self, subschema: JsonSchema, cls: ClassDefinition, slot: SlotDefinition) -> None:
         slot = self.before_generate_class_slot(slot, cls, self.schemaview)
-        class_id_slot = self.schemaview.get_identifier_slot(cls.name, use_key=True)
+        class_id_slot = induced_schema(self.schemaview).identifier_slot(cls.name, use_key=True)
         value_required = (
             slot.required or slot == class_id_slot or slot.value_presence == PresenceEnum(PresenceEnum.PRESENT)
         )
         value_disallowed = slot.value_presence == PresenceEnum(PresenceEnum.ABSENT)
 
         aliased_slot_name = self.aliased_slot_name(slot)
-        prop = self.get_subschema_for_slot(slot, include_null=self.include_null)
+        # slots used by many classes are usually induced to the same definition, whose subschema is built once
+        key = (_slot_fingerprint(slot), self.include_null)
+        if key not in self._slot_subschemas:
+            self._slot_subschemas[key] = self.get_subschema_for_slot(slot, include_null=self.include_null)
+        prop = deepcopy(self._slot_subschemas[key])
         prop = self.after_generate_class_slot(
             SlotResult.model_construct(schema_=prop, source=slot), cls, self.schemaview
         ).schema_
@@ -685,6 +739,9 @@ class JsonSchemaGenerator(Generator, LifecycleMixin):
         for class_definition in all_classes:
             self.handle_class(class_definition)
 
+        if self.deduplicate_properties:
+            self.top_level_schema.deduplicate_properties()
+
         self.top_level_schema = self.after_generate_schema(
             SchemaResult.model_construct(schema_=self.top_level_schema, source=self.schema), self.schemaview
         ).schema_
@@ -757,6 +814,15 @@ Include LinkML Schema outside of imports mechanism.  Helpful in including deprec
 YAML, and including it when necessary but not by default (e.g. in documentation or for backwards compatibility)
 """,
 )
+@click.option(
+    "--deduplicate-properties/--no-deduplicate-properties",
+    default=False,
+    show_default=True,
+    help="""
+Move property subschemas which are repeated across classes into shared $defs, which makes the schemas of
+large models much smaller
+""",
+)
 @click.option(
     "--materialize-patterns/--no-materialize-patterns",
     default=True,  # Default set to True
@@ -2,12 +2,14 @@
 
 import logging
 import os
+import sys
 from collections import defaultdict
-from collections.abc import Mapping
+from collections.abc import Iterator, Mapping
 from copy import copy
 from dataclasses import dataclass, field
 from enum import Enum, unique
-from typing import Any, Optional, Union
+from io import StringIO
+from typing import Any, Optional, TextIO, Union
 
 import click
 import rdflib
@@ -39,6 +41,7 @@ from rdflib.plugin import plugins as rdflib_plugins
 
 from linkml import METAMODEL_NAMESPACE_NAME
 from linkml._version import __version__
+from linkml.generators.common.ntriples import NTriplesWriter
 from linkml.utils.generator import Generator, shared_arguments
 
 logger = logging.getLogger(__name__)
@@ -180,43 +183,63 @@ class OwlSchemaGenerator(Generator):
 
         :return:
         """
-        sv = self.schemaview
-        schema = sv.schema
-        owl_id = schema.id
-        if self.ontology_uri_suffix:
-            owl_id = f"{owl_id}{self.ontology_uri_suffix}"
-        mergeimports = self.mergeimports
-        base = URIRef(owl_id)
+        schema = self.schemaview.schema
         # initialize the rdflib Graph where all axiom triples will be added
-        graph = Graph(identifier=base)
+        graph = Graph(identifier=self._ontology_uri())
         self.graph = graph
         for prefix in self.metamodel.schema.emit_prefixes:
             self.graph.bind(prefix, self.metamodel.namespaces[prefix])
         for pfx in schema.prefixes.values():
             self.graph.namespace_manager.bind(pfx.prefix_prefix, URIRef(pfx.prefix_reference))
-        graph.add((base, RDF.type, OWL.Ontology))
+        for _ in self._add_elements():
+            pass
+        return graph
+
+    def _ontology_uri(self) -> URIRef:
+        owl_id = self.schemaview.schema.id
+        if self.ontology_uri_suffix:
+            owl_id = f"{owl_id}{self.ontology_uri_suffix}"
+        return URIRef(owl_id)
+
+    def _add_elements(self) -> Iterator[None]:
+        """
+        Add the triples of every element of the schema to :attr:`graph`.
+
+        Yields each time an element is complete: the triples added for an element are not
+        looked up or removed once the next element is added.
+        """
+        sv = self.schemaview
+        schema = sv.schema
+        mergeimports = self.mergeimports
+        base = self.graph.identifier
+        self.graph.add((base, RDF.type, OWL.Ontology))
+        yield
 
         # Add main schema elements
         for cls in sv.all_classes(imports=mergeimports).values():
             self.add_class(cls)
             for a in cls.attributes.values():
                 self.add_slot(a, attribute=True)
+            yield
         for slot in sv.all_slots(imports=mergeimports, attributes=False).values():
             self.add_slot(slot, attribute=False)
+            yield
         for typ in sv.all_types(imports=mergeimports).values():
             self.add_type(typ)
+            yield
         for enm in sv.all_enums(imports=mergeimports).values():
             self.add_enum(enm)
+            yield
 
         if not mergeimports:
             for imp in schema.imports:
                 if imp == "linkml:types":
                     continue
-                graph.add((base, OWL.imports, self._schema_uri(imp)))
+                self.graph.add((base, OWL.imports, self._schema_uri(imp)))
 
         # Add metadata as annotation properties
         self.add_metadata(schema, base)
-        return graph
+        yield
 
     def serialize(self, **kwargs) -> str:
         """
@@ -225,10 +248,34 @@ class OwlSchemaGenerator(Generator):
         :param kwargs:
         :return:
         """
+        if self.format == "nt":
+            out = StringIO()
+            self.serialize_to(out, **kwargs)
+            return out.getvalue()
         self.as_graph()
         data = self.graph.serialize(format="turtle" if self.format in ["owl", "ttl"] else self.format)
         return data
 
+    def serialize_to(self, stream: TextIO, **kwargs) -> None:
+        """
+        Serialize the OWL triples to a stream.
+
+        In the ``nt`` format, the triples of each element are written as N-Triples as soon as
+        the element is complete, rather than building the graph of the whole ontology first.
+
+        :param stream: Stream to which the output is written
+        :param kwargs:
+        """
+        if self.format != "nt":
+            super().serialize_to(stream, **kwargs)
+            return
+        writer = NTriplesWriter(stream)
+        # triples are collected in a graph for one element at a time, as they are looked up while it is added
+        self.graph = Graph(identifier=self._ontology_uri())
+        for _ in self._add_elements():
+            writer.add_graph(self.graph)
+            self.graph.remove((None, None, None))
+
     def add_metadata(self, e: Definition, uri: URIRef) -> None:
         """
         Add annotation properties.
@@ -1376,7 +1423,10 @@ def cli(yamlfile, metadata_profile: str, **kwargs):
     else:
         metadata_profiles = [MetadataProfile.linkml]
     gen = OwlSchemaGenerator(yamlfile, metadata_profiles=metadata_profiles, **kwargs)
-    print(gen.serialize(**kwargs))
+    if gen.format == "nt":
+        gen.serialize_to(sys.stdout, **kwargs)
+    else:
+        print(gen.serialize(**kwargs))
 
 
 if __name__ == "__main__":
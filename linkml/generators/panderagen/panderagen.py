@@ -113,6 +113,12 @@ class PanderaGenerator(OOCodeGenerator, EnumGeneratorMixin, ClassGeneratorMixin,
 
         return compile_python(pandera_code)
 
+    def compile_module(self, **kwargs) -> ModuleType:
+        """
+        Compiles generated Pandera code to a module
+        """
+        return compile_python(self.serialize(**kwargs))
+
     def serialize(self, rendered_module: Optional[OODocument] = None) -> str:
         """
         Serialize the schema to a Pandera module as a string
@@ -1,13 +1,19 @@
+import json
 import logging
 import os
+import tempfile
 from collections import defaultdict
+from collections.abc import Iterator
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from contextlib import contextmanager
 from dataclasses import dataclass, field
 from functools import lru_cache
 from pathlib import Path
-from typing import Any
+from typing import Any, TextIO, Union
 
 import click
 import yaml
+from linkml_runtime import SchemaView
 
 from linkml._version import __version__
 from linkml.generators.excelgen import ExcelGenerator
@@ -23,11 +29,16 @@ from linkml.generators.pythongen import PythonGenerator
 from linkml.generators.shaclgen import ShaclGenerator
 from linkml.generators.shexgen import ShExGenerator
 from linkml.generators.sqltablegen import SQLTableGenerator
+from linkml.utils.artifact_cache import artifact_key, schema_fingerprint
 from linkml.utils.cli_utils import log_level_option
 from linkml.utils.generator import Generator
+from linkml.utils.watch import watch_schema
 
 logger = logging.getLogger(__name__)
 
+#: Name of the file in the project directory which records how each output was built
+MANIFEST_FILE = ".gen-project-manifest.json"
+
 PATH_FSTRING = str
 GENERATOR_NAME = str
 ARG_DICT = dict[str, Any]
@@ -89,6 +100,28 @@ class ProjectConfiguration:
     includes: list[str] = None
     excludes: list[str] = None
     mergeimports: bool = None
+    jobs: int = 1
+    """Number of generators to run at the same time, each in its own process"""
+    incremental: bool = False
+    """Only run generators whose schema, imports or arguments changed since the previous build"""
+
+
+def _run_generator(
+    gen_cls: type[Generator], local_path: str, gen_args: ARG_DICT, serialize_args: ARG_DICT, gen_path_full: str
+) -> None:
+    """
+    Run one generator on one schema, streaming its output to a file
+
+    This is a module-level function so that it can be run in a worker process.
+    """
+    gen = gen_cls(local_path, **gen_args)
+    # markdowngen writes to a directory, and excelgen writes its own file
+    if gen_path_full.endswith("/") or gen_cls is ExcelGenerator:
+        gen.serialize(**serialize_args)
+        return
+    logger.info(f"  WRITING TO: {gen_path_full}")
+    with _atomic_writer(gen_path_full) as stream:
+        gen.serialize_to(stream, **serialize_args)
 
 
 class ProjectGenerator:
@@ -108,6 +141,13 @@ class ProjectGenerator:
         else:
             all_schemas = get_local_imports(schema_path, os.path.dirname(schema_path))
         logger.debug(f"ALL_SCHEMAS = {all_schemas}")
+        manifest_path = Path(config.directory) / MANIFEST_FILE
+        manifest = _read_manifest(manifest_path) if config.incremental else None
+        fingerprints = {}
+        # (generator name, output path, generator class, schema path, generator args, serialize args)
+        tasks = []
+        # manifest entry and build key of each (output path, schema path)
+        keys = {}
         for gen_name, (gen_cls, gen_path_fmt, default_gen_args) in GEN_MAP.items():
             if config.includes is not None and config.includes != [] and gen_name not in config.includes:
                 logger.info(f"Skipping {gen_name} as not in inclusion list: {config.includes}")
@@ -115,9 +155,7 @@ class ProjectGenerator:
             if config.excludes is not None and gen_name in config.excludes:
                 logger.info(f"Skipping {gen_name} as it is in exclusion list")
                 continue
-            logger.info(f"Generating: {gen_name}")
             for local_path in all_schemas:
-                logger.info(f" SCHEMA: {local_path}")
                 name = os.path.basename(local_path).replace(".yaml", "")
                 gen_path = gen_path_fmt.format(name=name)
                 gen_path_full = f"{config.directory}/{gen_path}"
@@ -125,40 +163,107 @@ class ProjectGenerator:
                 parent_dir = "/".join(parts[0:-1])
                 logger.info(f" PARENT={parent_dir}")
                 Path(parent_dir).mkdir(parents=True, exist_ok=True)
-                gen_path_full = "/".join(parts)
                 all_gen_args = {
                     **default_gen_args,
                     **config.generator_args.get(gen_name, {}),
                 }
-                gen: Generator
 
                 # special check for output key because ExcelGenerator and
                 # SSSOMGenerator read in output file name during initialization
                 if "output" in all_gen_args:
                     all_gen_args["output"] = all_gen_args["output"].format(name=name, parent=parent_dir)
 
-                gen = gen_cls(local_path, **all_gen_args)
-
                 serialize_args = {"mergeimports": config.mergeimports}
                 for k, v in all_gen_args.items():
                     # all ARG_DICT values are interpolatable
                     if isinstance(v, str):
                         v = v.format(name=name, parent=parent_dir)
                     serialize_args[k] = v
-                logger.info(f" {gen_name} ARGS: {serialize_args}")
-                gen_dump = gen.serialize(**serialize_args)
-
-                if gen_name != "excel":
-                    if parts[-1] != "":
-                        # markdowngen does not write to a file
-                        logger.info(f"  WRITING TO: {gen_path_full}")
-                        with open(gen_path_full, "w", encoding="UTF-8") as stream:
-                            stream.write(gen_dump)
-                else:
-                    # special handling for excel generator
-                    # we do not need to route the output
-                    # into a file like the other generators
-                    gen.serialize(**serialize_args)
+
+                if manifest is not None:
+                    if local_path not in fingerprints:
+                        fingerprints[local_path] = schema_fingerprint(SchemaView(local_path))
+                    key = artifact_key(
+                        fingerprints[local_path],
+                        gen_path,
+                        schema=str(local_path),
+                        generator=f"{gen_cls.__module__}.{gen_cls.__qualname__}",
+                        gen_args=all_gen_args,
+                        serialize_args=serialize_args,
+                    )
+                    # generators which write to a directory, such as markdown, write one set of files per schema
+                    entry = f"{gen_path}{name}" if gen_path.endswith("/") else gen_path
+                    keys[(gen_path_full, local_path)] = (entry, key)
+                    if manifest.get(entry) == key and os.path.exists(gen_path_full):
+                        logger.info(f"Skipping {gen_name} for {local_path} as {gen_path} is up to date")
+                        continue
+                tasks.append((gen_name, gen_path_full, gen_cls, local_path, all_gen_args, serialize_args))
+
+        def done(gen_name: str, gen_path_full: str, local_path: str) -> None:
+            logger.info(f"Generated: {gen_name}")
+            if manifest is not None:
+                entry, key = keys[(gen_path_full, local_path)]
+                manifest[entry] = key
+
+        try:
+            if config.jobs > 1 and len(tasks) > 1:
+                with ProcessPoolExecutor(max_workers=min(config.jobs, len(tasks))) as executor:
+                    futures = {
+                        executor.submit(_run_generator, gen_cls, local_path, gen_args, serialize_args, gen_path_full): (
+                            gen_name,
+                            gen_path_full,
+                            local_path,
+                        )
+                        for gen_name, gen_path_full, gen_cls, local_path, gen_args, serialize_args in tasks
+                    }
+                    try:
+                        for future in as_completed(futures):
+                            future.result()
+                            done(*futures[future])
+                    except BaseException:
+                        executor.shutdown(wait=True, cancel_futures=True)
+                        raise
+            else:
+                for gen_name, gen_path_full, gen_cls, local_path, gen_args, serialize_args in tasks:
+                    logger.info(f"Generating: {gen_name}")
+                    logger.info(f" SCHEMA: {local_path}")
+                    logger.info(f" {gen_name} ARGS: {serialize_args}")
+                    _run_generator(gen_cls, local_path, gen_args, serialize_args, gen_path_full)
+                    done(gen_name, gen_path_full, local_path)
+        finally:
+            # outputs which were written before any failure are recorded, so they are not rebuilt
+            if manifest is not None:
+                _write_atomic(manifest_path, json.dumps(manifest, indent=2, sort_keys=True))
+
+
+def _read_manifest(path: Path) -> dict[str, str]:
+    try:
+        with open(path, encoding="UTF-8") as stream:
+            return json.load(stream)
+    except FileNotFoundError:
+        return {}
+    except ValueError:
+        logger.warning(f"Ignoring invalid build manifest {path}")
+        return {}
+
+
+@contextmanager
+def _atomic_writer(path: Union[str, Path]) -> Iterator[TextIO]:
+    """Write a file in a temporary file which replaces it in one step, so that readers never see a partial file"""
+    fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(path) or ".", prefix=".tmp-")
+    try:
+        with os.fdopen(fd, "w", encoding="UTF-8") as stream:
+            yield stream
+        os.replace(tmp_path, path)
+    except BaseException:
+        Path(tmp_path).unlink(missing_ok=True)
+        raise
+
+
+def _write_atomic(path: Union[str, Path], content: str) -> None:
+    """Replace a file in one step, so that readers never see a partially written file"""
+    with _atomic_writer(path) as stream:
+        stream.write(content)
 
 
 @click.command(name="project")
@@ -182,6 +287,24 @@ class ProjectGenerator:
     show_default=True,
     help="Merge imports into source file",
 )
+@click.option(
+    "--incremental/--no-incremental",
+    default=None,
+    help="Only rerun generators whose schema, imports or arguments changed since the previous run,"
+    f" as recorded in {MANIFEST_FILE} in the output directory. Defaults to false",
+)
+@click.option(
+    "--watch/--no-watch",
+    default=False,
+    show_default=True,
+    help="Keep running, and generate again whenever the schema or one of its local imports changes",
+)
+@click.option(
+    "--jobs",
+    "-j",
+    type=click.IntRange(min=1),
+    help="Number of generators to run in parallel, each in its own process. Defaults to 1",
+)
 @log_level_option
 @click.argument("yamlfile")
 @click.version_option(__version__, "-V", "--version")
@@ -193,6 +316,9 @@ def cli(
     config_file,
     mergeimports,
     generator_arguments: str,
+    jobs: int,
+    incremental: bool,
+    watch: bool,
     **kwargs,
 ):
     """
@@ -216,6 +342,24 @@ def cli(
 
        gen-project -I python -I jsonschema -d . personinfo.yaml
 
+    Running up to four generators at the same time:
+
+    .. code-block: bash
+
+        gen-project --jobs 4 -d . personinfo.yaml
+
+    Only regenerating the artefacts whose inputs changed since the last run:
+
+    .. code-block: bash
+
+        gen-project --incremental -d . personinfo.yaml
+
+    Regenerating whenever the schema is saved, only rebuilding the artefacts that changed:
+
+    .. code-block: bash
+
+        gen-project --watch --incremental -d . personinfo.yaml
+
     Configuration, on command line:
 
     .. code-block: bash
@@ -255,8 +399,15 @@ def cli(
     if dir is not None:
         project_config.directory = dir
     project_config.mergeimports = mergeimports
+    if jobs is not None:
+        project_config.jobs = jobs
+    if incremental is not None:
+        project_config.incremental = incremental
     gen = ProjectGenerator()
-    gen.generate(yamlfile, project_config)
+    if watch:
+        watch_schema(yamlfile, lambda: gen.generate(yamlfile, project_config))
+    else:
+        gen.generate(yamlfile, project_config)
 
 
 if __name__ == "__main__":
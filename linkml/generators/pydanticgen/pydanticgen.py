@@ -4,6 +4,7 @@ import os
 import re
 import textwrap
 from collections import defaultdict
+from concurrent.futures import ProcessPoolExecutor
 from dataclasses import dataclass, field
 from enum import Enum
 from pathlib import Path
@@ -19,6 +20,7 @@ from linkml_runtime.linkml_model.meta import (
     SlotDefinition,
     TypeDefinition,
 )
+from linkml_runtime.utils import schemaview as schemaview_module
 from linkml_runtime.utils.compile_python import compile_python
 from linkml_runtime.utils.formatutils import camelcase, remove_empty_items, underscore
 from linkml_runtime.utils.schemaview import SchemaView
@@ -44,6 +46,8 @@ from linkml.generators.pydanticgen.template import (
 from linkml.generators.python.python_ifabsent_processor import PythonIfAbsentProcessor
 from linkml.utils import deprecation_warning
 from linkml.utils.generator import shared_arguments
+from linkml.utils.induced_schema import induced_schema
+from linkml.utils.schema_cache import SchemaCache, cached_schema_loading
 
 logger = logging.getLogger(__name__)
 
@@ -435,7 +439,7 @@ class PydanticGenerator(OOCodeGenerator, LifecycleMixin):
         result = ClassResult(cls=pyclass, source=cls, imports=imports)
 
         # Gather slots
-        slots = [self.schemaview.induced_slot(sn, cls.name) for sn in self.schemaview.class_slots(cls.name)]
+        slots = induced_schema(self.schemaview).class_induced_slots(cls.name)
         slots = self.before_generate_slots(slots, self.schemaview)
 
         slot_results = []
@@ -540,8 +544,7 @@ class PydanticGenerator(OOCodeGenerator, LifecycleMixin):
             ifabsent_processor = PythonIfAbsentProcessor(sv)
             slot_values = defaultdict(dict)
             for class_def in sv.all_classes().values():
-                for slot_name in sv.class_slots(class_def.name):
-                    slot = sv.induced_slot(slot_name, class_def.name)
+                for slot in induced_schema(sv).class_induced_slots(class_def.name):
                     if slot.designates_type:
                         target_value = get_type_designator_value(sv, slot, class_def)
                         slot_values[camelcase(class_def.name)][slot.name] = f'"{target_value}"'
@@ -617,7 +620,7 @@ class PydanticGenerator(OOCodeGenerator, LifecycleMixin):
             or (sv.get_identifier_slot(range_cls.name, use_key=True) is None and not sv.is_mixin(range_cls.name))
         ):
             if (
-                len([x for x in sv.class_induced_slots(slot_range) if x.designates_type]) > 0
+                len([x for x in induced_schema(sv).class_induced_slots(slot_range) if x.designates_type]) > 0
                 and len(sv.class_descendants(slot_range)) > 1
             ):
                 return "Union[" + ",".join([camelcase(c) for c in sv.class_descendants(slot_range)]) + "]"
@@ -750,7 +753,7 @@ class PydanticGenerator(OOCodeGenerator, LifecycleMixin):
             if slot_def.range in self.schemaview.all_classes():
                 id_slot = self.schemaview.get_identifier_slot(slot_def.range, use_key=True)
                 if id_slot is not None:
-                    range_cls_slots = self.schemaview.class_induced_slots(slot_def.range)
+                    range_cls_slots = induced_schema(self.schemaview).class_induced_slots(slot_def.range)
                     if len(range_cls_slots) == 2:
                         non_id_slots = [slot for slot in range_cls_slots if slot.name != id_slot.name]
                         if len(non_id_slots) == 1:
@@ -1024,6 +1027,7 @@ class PydanticGenerator(OOCodeGenerator, LifecycleMixin):
         split_pattern: Optional[str] = None,
         split_context: Optional[dict] = None,
         split_mode: SplitMode = SplitMode.AUTO,
+        jobs: int = 1,
         **kwargs,
     ) -> list[SplitResult]:
         """
@@ -1050,11 +1054,17 @@ class PydanticGenerator(OOCodeGenerator, LifecycleMixin):
         ``__init__.py`` files are generated for any directories that are between
         the generated modules and their highest common directory.
 
+        Each schema file of the import closure is parsed once and shared by the generators
+        of all the modules. Modules whose generated code is unchanged are not rewritten,
+        so that their modification time is kept.
+
         Args:
             schema (str, :class:`.Path` , :class:`.SchemaDefinition` ): Main schema to generate
             output_path (str, :class:`.Path` ): Python ``.py`` module to generate main schema to
             split_pattern (str): Pattern to use to generate module names, see :attr:`.PydanticGenerator.split_pattern`
             split_context (dict): Additional variables to pass into jinja context when generating module import names.
+            jobs (int): Number of processes used to generate the modules of the imported schemas.
+                The generator class and its arguments must be picklable when greater than 1.
 
         Returns:
             list[:class:`.SplitResult`]
@@ -1069,46 +1079,57 @@ class PydanticGenerator(OOCodeGenerator, LifecycleMixin):
         # Main schema
         # --------------------------------------------------
         gen_kwargs = kwargs
+        if split_pattern is None:
+            split_pattern = cls.split_pattern
         gen_kwargs.update(
             {"split": True, "split_pattern": split_pattern, "split_context": split_context, "split_mode": split_mode}
         )
-        generator = cls(schema, **gen_kwargs)
-        # Generate the initial schema to figure out which of the imported schema actually need
-        # to be generated
-        rendered = generator.render()
-        # write schema - we use the ``output_path`` for the main schema, and then
-        # interpret all imported schema paths as relative to that
-        output_path.parent.mkdir(parents=True, exist_ok=True)
-        serialized = generator.serialize(rendered_module=rendered)
-        with open(output_path, "w", encoding="utf-8") as ofile:
-            ofile.write(serialized)
-
-        results.append(
-            SplitResult(main=True, source=generator.schemaview.schema, path=output_path, serialized_module=serialized)
-        )
+        # every schema file of the import closure is parsed once, here, and reused by the generators
+        # of the imported schemas
+        with cached_schema_loading() as cache:
+            generator = cls(schema, **gen_kwargs)
+            # Generate the initial schema to figure out which of the imported schema actually need
+            # to be generated
+            rendered = generator.render()
+            # write schema - we use the ``output_path`` for the main schema, and then
+            # interpret all imported schema paths as relative to that
+            serialized = generator.serialize(rendered_module=rendered)
+            _write_module(output_path, serialized)
 
-        # --------------------------------------------------
-        # Imported schemas
-        # --------------------------------------------------
-        imported_schema = {
-            generator.generate_module_import(sch): sch for sch in generator.schemaview.schema_map.values()
-        }
-        for generated_import in [i for i in rendered.python_imports if i.is_schema]:
-            import_generator = cls(imported_schema[generated_import.module], **gen_kwargs)
-            serialized = import_generator.serialize()
-            rel_path = _import_to_path(generated_import.module)
-            abs_path = (output_path.parent / rel_path).resolve()
-            abs_path.parent.mkdir(parents=True, exist_ok=True)
-            with open(abs_path, "w", encoding="utf-8") as ofile:
-                ofile.write(serialized)
+            results.append(
+                SplitResult(
+                    main=True, source=generator.schemaview.schema, path=output_path, serialized_module=serialized
+                )
+            )
+
+            # --------------------------------------------------
+            # Imported schemas
+            # --------------------------------------------------
+            imported_schema = {
+                generator.generate_module_import(sch): sch for sch in generator.schemaview.schema_map.values()
+            }
+            modules = [i.module for i in rendered.python_imports if i.is_schema]
+            if jobs > 1 and len(modules) > 1:
+                with ProcessPoolExecutor(
+                    max_workers=min(jobs, len(modules)), initializer=_init_split_worker, initargs=(cache.schemas,)
+                ) as executor:
+                    serialized_modules = list(
+                        executor.map(_serialize_module, [(cls, imported_schema[m], gen_kwargs) for m in modules])
+                    )
+            else:
+                serialized_modules = [_serialize_module((cls, imported_schema[m], gen_kwargs)) for m in modules]
+
+        for module, serialized in zip(modules, serialized_modules):
+            abs_path = (output_path.parent / _import_to_path(module)).resolve()
+            _write_module(abs_path, serialized)
 
             results.append(
                 SplitResult(
                     main=False,
-                    source=imported_schema[generated_import.module],
+                    source=imported_schema[module],
                     path=abs_path,
                     serialized_module=serialized,
-                    module_import=generated_import.module,
+                    module_import=module,
                 )
             )
 
@@ -1123,6 +1144,27 @@ def _subclasses(cls: type):
 _TEMPLATE_NAMES = sorted(list(set([c.template for c in _subclasses(PydanticTemplateModel)])))
 
 
+def _init_split_worker(schemas: dict) -> None:
+    """Share the schema files parsed by the parent process with a worker of :meth:`.PydanticGenerator.generate_split`"""
+    schemaview_module.load_schema_wrap = SchemaCache(schemaview_module.load_schema_wrap, schemas).load
+
+
+def _serialize_module(args: tuple[type[PydanticGenerator], SchemaDefinition, dict]) -> str:
+    """Generate the module of an imported schema in :meth:`.PydanticGenerator.generate_split`"""
+    cls, schema, gen_kwargs = args
+    return cls(schema, **gen_kwargs).serialize()
+
+
+def _write_module(path: Path, serialized: str) -> None:
+    """Write a generated module, unless it already has the same content"""
+    if path.is_file() and path.read_text(encoding="utf-8") == serialized:
+        logger.debug(f"Unchanged module: {path}")
+        return
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with open(path, "w", encoding="utf-8") as ofile:
+        ofile.write(serialized)
+
+
 def _import_to_path(module: str) -> Path:
     """Make a (relative) ``Path`` object from a python module import string"""
     # handle leading .'s separately..
@@ -1,7 +1,9 @@
 import logging
 import os
+import sys
 from dataclasses import dataclass
-from typing import Callable
+from io import StringIO
+from typing import Callable, TextIO, Union
 
 import click
 from jsonasobj2 import JsonObj, as_dict
@@ -10,10 +12,10 @@ from linkml_runtime.utils.formatutils import underscore
 from linkml_runtime.utils.schemaview import SchemaView
 from linkml_runtime.utils.yamlutils import TypedNode, extended_float, extended_int, extended_str
 from rdflib import BNode, Graph, Literal, URIRef
-from rdflib.collection import Collection
 from rdflib.namespace import RDF, SH, XSD
 
 from linkml._version import __version__
+from linkml.generators.common.ntriples import NTriplesWriter, add_list
 from linkml.generators.shacl.shacl_data_type import ShaclDataType
 from linkml.generators.shacl.shacl_ifabsent_processor import ShaclIfAbsentProcessor
 from linkml.utils.generator import Generator, shared_arguments
@@ -34,7 +36,7 @@ class ShaclGenerator(Generator):
     """If True, elements from imported ontologies won't be included in the generator's output"""
     generatorname = os.path.basename(__file__)
     generatorversion = "0.0.1"
-    valid_formats = ["ttl"]
+    valid_formats = ["ttl", "nt"]
     file_extension = "shacl.ttl"
     visit_all_class_slots = False
     uses_schemaloader = True
@@ -51,19 +53,38 @@ class ShaclGenerator(Generator):
         return out
 
     def serialize(self, **args) -> str:
+        if self.format == "nt":
+            out = StringIO()
+            self.serialize_to(out, **args)
+            return out.getvalue()
         g = self.as_graph()
         data = g.serialize(format="turtle" if self.format in ["owl", "ttl"] else self.format)
         return data
 
+    def serialize_to(self, stream: TextIO, **args) -> None:
+        """
+        Write the shapes to a stream.
+
+        In the ``nt`` format, each triple is written as N-Triples as soon as it is generated,
+        rather than building the graph of all the shapes first.
+        """
+        if self.format != "nt":
+            super().serialize_to(stream, **args)
+            return
+        self._add_shapes(NTriplesWriter(stream))
+
     def as_graph(self) -> Graph:
-        sv = self.schemaview
         g = Graph()
         g.bind("sh", SH)
-
-        ifabsent_processor = ShaclIfAbsentProcessor(sv)
-
         for pfx in self.schema.prefixes.values():
             g.bind(str(pfx.prefix_prefix), pfx.prefix_reference)
+        self._add_shapes(g)
+        return g
+
+    def _add_shapes(self, g: Union[Graph, NTriplesWriter]) -> None:
+        """Add the triples of all shapes to a graph, or write them with an :class:`NTriplesWriter`"""
+        sv = self.schemaview
+        ifabsent_processor = ShaclIfAbsentProcessor(sv)
 
         for c in sv.all_classes(imports=not self.exclude_imports).values():
 
@@ -184,7 +205,7 @@ class ShaclGenerator(Generator):
 
                             add_simple_data_type(st_node_pv, r)
                             range_list.append(st_node)
-                    Collection(g, or_node, range_list)
+                    add_list(g, or_node, range_list)
                 else:
                     prop_pv_literal(SH.hasValue, s.equals_number)
                     r = s.range
@@ -224,18 +245,16 @@ class ShaclGenerator(Generator):
                 if default_value:
                     prop_pv(SH.defaultValue, default_value)
 
-        return g
-
     def _add_class(self, func: Callable, r: ElementName) -> None:
         sv = self.schemaview
         range_ref = sv.get_uri(r, expand=True)
         func(SH["class"], URIRef(range_ref))
 
-    def _add_enum(self, g: Graph, func: Callable, r: ElementName) -> None:
+    def _add_enum(self, g: Union[Graph, NTriplesWriter], func: Callable, r: ElementName) -> None:
         sv = self.schemaview
         enum = sv.get_enum(r)
         pv_node = BNode()
-        Collection(
+        add_list(
             g,
             pv_node,
             [
@@ -258,9 +277,9 @@ class ShaclGenerator(Generator):
         else:
             logger.error(f"No URI for type {rt.name}")
 
-    def _and_equals_string(self, g: Graph, func: Callable, values: list) -> None:
+    def _and_equals_string(self, g: Union[Graph, NTriplesWriter], func: Callable, values: list) -> None:
         pv_node = BNode()
-        Collection(
+        add_list(
             g,
             pv_node,
             [Literal(v) for v in values],
@@ -304,16 +323,16 @@ class ShaclGenerator(Generator):
         else:
             return None
 
-    def _and_equals_string(self, g: Graph, func: Callable, values: list) -> None:
+    def _and_equals_string(self, g: Union[Graph, NTriplesWriter], func: Callable, values: list) -> None:
         pv_node = BNode()
-        Collection(
+        add_list(
             g,
             pv_node,
             [Literal(v) for v in values],
         )
         func(SH["in"], pv_node)
 
-    def _build_ignored_properties(self, g: Graph, c: ClassDefinition) -> BNode:
+    def _build_ignored_properties(self, g: Union[Graph, NTriplesWriter], c: ClassDefinition) -> BNode:
         def collect_child_properties(class_name: str, output: set) -> None:
             for childName in self.schemaview.class_children(class_name, imports=True, mixins=False, is_a=True):
                 output.update(
@@ -334,7 +353,7 @@ class ShaclGenerator(Generator):
 
         list_node = BNode()
         ignored_properties.add(RDF.type)
-        Collection(g, list_node, list(ignored_properties))
+        add_list(g, list_node, ignored_properties)
 
         return list_node
 
@@ -377,7 +396,10 @@ def add_simple_data_type(func: Callable, r: ElementName) -> None:
 def cli(yamlfile, **args):
     """Generate SHACL turtle from a LinkML model"""
     gen = ShaclGenerator(yamlfile, **args)
-    print(gen.serialize())
+    if gen.format == "nt":
+        gen.serialize_to(sys.stdout)
+    else:
+        print(gen.serialize())
 
 
 if __name__ == "__main__":
@@ -80,6 +80,20 @@ def get_yaml_files(root: Path, accept_dot_files: bool) -> Iterable[str]:
     help="Do not exit with an error status if up to this number of warnings (and no errors) are found.",
 )
 @click.option("--fix/--no-fix", default=False)
+@click.option(
+    "-j",
+    "--jobs",
+    type=click.IntRange(min=1),
+    default=1,
+    show_default=True,
+    help="Number of schema files linted at the same time.",
+)
+@click.option(
+    "--cache-dir",
+    type=click.Path(file_okay=False, path_type=Path),
+    help="Directory in which results are cached, so that files which have not changed since the last run "
+    "(nor the files they import, nor the configuration) are not linted again. Not used with --fix.",
+)
 @click.version_option(__version__, "-V", "--version")
 def main(
     schema: Path,
@@ -93,6 +107,8 @@ def main(
     ignore_warnings: bool,
     max_warnings: int,
     verbose: bool,
+    jobs: int,
+    cache_dir: Path,
 ):
     """Run linter on SCHEMA.
 
@@ -127,9 +143,16 @@ def main(
     error_count = 0
     warning_count = 0
     formatter.start_report()
-    for path in get_yaml_files(schema, all):
+    reports = linter.lint_files(
+        get_yaml_files(schema, all),
+        fix=fix,
+        validate_schema=validate,
+        validate_only=validate_only,
+        jobs=jobs,
+        cache_dir=cache_dir,
+    )
+    for path, report in reports:
         formatter.start_schema(path)
-        report = linter.lint(path, fix=fix, validate_schema=validate, validate_only=validate_only)
         for problem in report:
             if str(problem.level) is RuleLevel.error.text:
                 error_count += 1
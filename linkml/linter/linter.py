@@ -1,24 +1,39 @@
+import hashlib
 import inspect
-from collections.abc import Iterable
+import json
+import logging
+import os
+from collections.abc import Iterable, Iterator
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import ExitStack
 from copy import deepcopy
-from dataclasses import dataclass
-from functools import lru_cache
+from dataclasses import asdict, dataclass
+from functools import cached_property, lru_cache
 from pathlib import Path
-from typing import Any, Union
+from typing import TYPE_CHECKING, Any, Callable, Optional, Union
 
 import jsonschema
 import yaml
 from jsonschema.exceptions import best_match
-from jsonschema.protocols import Validator
 from linkml_runtime import SchemaView
 from linkml_runtime.dumpers import yaml_dumper
 from linkml_runtime.linkml_model import SchemaDefinition
+from linkml_runtime.utils import schemaview as schemaview_module
 
-from linkml.generators.jsonschemagen import JsonSchemaGenerator
+from linkml.utils.artifact_cache import ArtifactCache, default_cache_dir
+from linkml.utils.induced_schema import InducedSchema, induced_schema
+from linkml.utils.schema_cache import SchemaCache, cached_schema_loading
 
 from .. import LOCAL_METAMODEL_YAML_FILE
 from .config.datamodel.config import Config, ExtendableConfigs, RuleLevel
 
+if TYPE_CHECKING:
+    from linkml.validator.jsonschema_compiler import CompiledJsonSchemaValidator
+
+    from .rules import LinterRule
+
+logger = logging.getLogger(__name__)
+
 
 @dataclass
 class LinterProblem:
@@ -28,6 +43,14 @@ class LinterProblem:
     schema_source: Union[str, None] = None
     rule_name: Union[str, None] = None
 
+    def to_dict(self) -> dict[str, Any]:
+        return {**asdict(self), "level": None if self.level is None else str(self.level)}
+
+    @classmethod
+    def from_dict(cls, problem: dict[str, Any]) -> "LinterProblem":
+        level = problem["level"]
+        return cls(**{**problem, "level": None if level is None else RuleLevel(level)})
+
 
 @lru_cache
 def get_named_config(name: str) -> dict[str, Any]:
@@ -36,13 +59,52 @@ def get_named_config(name: str) -> dict[str, Any]:
         return yaml.safe_load(config_file)
 
 
+def _metamodel_fingerprint() -> str:
+    """Hash of the schema files of the metamodel"""
+    digest = hashlib.sha256()
+    for path in sorted(Path(LOCAL_METAMODEL_YAML_FILE).parent.glob("*.yaml")):
+        digest.update(path.name.encode("utf-8"))
+        digest.update(path.read_bytes())
+    return digest.hexdigest()
+
+
+def _cached_artifact(cache: ArtifactCache, key: str, build: Callable[[], str]) -> str:
+    content = cache.get(key)
+    if content is None:
+        content = build()
+        try:
+            cache.put(key, content)
+        except OSError as e:
+            logger.warning(f"Could not cache {key} in {cache.directory}: {e}")
+    return content
+
+
 @lru_cache
-def get_metamodel_validator() -> Validator:
-    meta_json_gen = JsonSchemaGenerator(LOCAL_METAMODEL_YAML_FILE, not_closed=False)
-    meta_json_schema = meta_json_gen.generate()
+def get_metamodel_validator() -> "CompiledJsonSchemaValidator":
+    """Validator of schemas against the JSON Schema of the metamodel
+
+    The JSON Schema and the validation functions compiled from it are generated once for each
+    version of LinkML and of the metamodel, and stored in :func:`default_cache_dir`.
+    """
+    from linkml.validator.jsonschema_compiler import CompiledJsonSchemaValidator, compile_json_schema
+
+    cache = ArtifactCache(default_cache_dir())
+    fingerprint = _metamodel_fingerprint()
+
+    def generate_json_schema() -> str:
+        from linkml.generators.jsonschemagen import JsonSchemaGenerator
+
+        return json.dumps(JsonSchemaGenerator(LOCAL_METAMODEL_YAML_FILE, not_closed=False).generate())
+
+    meta_json_schema = json.loads(
+        _cached_artifact(cache, cache.key(fingerprint, "metamodel.schema.json"), generate_json_schema)
+    )
     validator_cls = jsonschema.validators.validator_for(meta_json_schema, default=jsonschema.Draft7Validator)
     validator = validator_cls(meta_json_schema, format_checker=validator_cls.FORMAT_CHECKER)
-    return validator
+    source = _cached_artifact(
+        cache, cache.key(fingerprint, "metamodel.schema_compiled.py"), lambda: compile_json_schema(meta_json_schema)
+    )
+    return CompiledJsonSchemaValidator(source, validator)
 
 
 def merge_configs(original: dict, other: dict):
@@ -67,6 +129,73 @@ def _format_path(path):
     return " > ".join(_format_path_component(p) for p in path)
 
 
+class LintContext:
+    """The schema checked by the linter rules, with the lookups they share
+
+    :param schema_view: View of the schema
+    :param fix: Whether the rules fix the problems they find
+    """
+
+    def __init__(self, schema_view: SchemaView, fix: bool = False) -> None:
+        self.schema_view = schema_view
+        self.fix = fix
+
+    @cached_property
+    def induced_schema(self) -> InducedSchema:
+        return induced_schema(self.schema_view)
+
+    @cached_property
+    def all_ranges(self) -> set[str]:
+        """Names of the classes, enums and types of the schema and its imports"""
+        sv = self.schema_view
+        return {*sv.all_types(), *sv.all_enums(), *sv.all_classes()}
+
+
+#: Kinds of elements visited by :func:`check_rules`, and the :class:`SchemaView` methods listing them
+ELEMENT_KINDS = {
+    "class": "all_classes",
+    "slot": "all_slots",
+    "enum": "all_enums",
+    "type": "all_types",
+    "subset": "all_subsets",
+}
+
+
+def check_rules(
+    schema_view: SchemaView, rules: list["LinterRule"], fix: bool = False
+) -> dict["LinterRule", list[LinterProblem]]:
+    """Check a schema against several rules, visiting each element of the schema once
+
+    Each element is passed to the ``visit_*`` method of every rule, see
+    :class:`~linkml.linter.rules.LinterRule`. Elements of imported schemas are only passed to
+    the rules which set ``visit_imports``.
+
+    :param schema_view: View of the schema
+    :param rules: Rules to check
+    :param fix: Whether the rules fix the problems they find
+    :return: Problems found by each rule
+    """
+    context = LintContext(schema_view, fix=fix)
+    problems = {rule: list(rule.visit_schema(context)) for rule in rules}
+    for kind, all_elements in ELEMENT_KINDS.items():
+        visitors = [rule for rule in rules if rule.visits_elements(kind)]
+        if not visitors:
+            continue
+        local = getattr(schema_view, all_elements)(imports=False)
+        elements = local
+        if any(rule.visit_imports for rule in visitors):
+            elements = getattr(schema_view, all_elements)(imports=True)
+        for name, element in elements.items():
+            imported = name not in local
+            element = local.get(name, element)
+            for rule in visitors:
+                if rule.visit_imports or not imported:
+                    problems[rule].extend(getattr(rule, f"visit_{kind}")(element, context))
+    for rule in rules:
+        problems[rule].extend(rule.end_schema(context))
+    return problems
+
+
 class Linter:
     def __init__(self, config: dict[str, Any] = {}) -> None:
         default_config = deepcopy(get_named_config("default"))
@@ -129,6 +258,7 @@ class Linter:
                 )
             return
 
+        rules = []
         for rule_id, rule_config in self.config.rules.__dict__.items():
             rule_cls = self._rules_map.get(rule_id, None)
             if rule_cls is None:
@@ -137,9 +267,12 @@ class Linter:
             if str(rule_config.level) is RuleLevel.disabled.text:
                 continue
 
-            rule = rule_cls(rule_config)
+            rules.append(rule_cls(rule_config))
 
-            for problem in rule.check(schema_view, fix=fix):
+        # rules which fix problems change the schema, so each of them checks the schema fixed by the previous ones
+        found = {} if fix else check_rules(schema_view, [rule for rule in rules if rule.visits_elements()])
+        for rule in rules:
+            for problem in found[rule] if rule in found else rule.check(schema_view, fix=fix):
                 problem.level = rule.config.level
                 problem.rule_name = rule.id
                 problem.schema_name = schema_view.schema.name
@@ -149,3 +282,115 @@ class Linter:
 
         if fix and schema_view.schema.source_file:
             yaml_dumper.dump(schema_view.schema, schema_view.schema.source_file)
+
+    def lint_files(
+        self,
+        paths: Iterable[str],
+        fix: bool = False,
+        validate_schema: bool = False,
+        validate_only: bool = False,
+        jobs: int = 1,
+        cache_dir: Optional[Union[str, os.PathLike]] = None,
+    ) -> Iterator[tuple[str, list[LinterProblem]]]:
+        """Lint many schema files, see :meth:`lint`
+
+        Schema files imported by several of the files are parsed once (once per worker with several
+        jobs).
+
+        :param paths: Schema files
+        :param fix: Fix the problems which can be fixed, see :meth:`lint`
+        :param validate_schema: Validate the schemas against the metamodel, see :meth:`lint`
+        :param validate_only: Only validate the schemas against the metamodel, see :meth:`lint`
+        :param jobs: Number of processes linting files at the same time
+        :param cache_dir: If given, the problems found in a file are stored in this directory and reused
+            while the file, the files it imports and the configuration are unchanged. Not used with ``fix``.
+        :return: Iterator over the files and the problems found in them, in the order of ``paths``
+        """
+        paths = list(paths)
+        options = {
+            "config": yaml.safe_load(yaml_dumper.dumps(self.config)),
+            "fix": fix,
+            "validate_schema": validate_schema,
+            "validate_only": validate_only,
+        }
+        cache = ArtifactCache(cache_dir) if cache_dir is not None and not fix else None
+        hashes: dict[str, str] = {}
+        keys = {}
+        cached = {}
+        if cache is not None:
+            for path in paths:
+                keys[path] = cache.key(_file_hash(path, hashes), "lint.json", path=path, **options)
+                entry = cache.get(keys[path])
+                if entry is not None:
+                    entry = json.loads(entry)
+                    if all(_file_hash(file, hashes) == digest for file, digest in entry["files"].items()):
+                        cached[path] = entry["problems"]
+        todo = [path for path in paths if path not in cached]
+
+        with ExitStack() as stack:
+            if jobs > 1 and len(todo) > 1:
+                executor = stack.enter_context(
+                    ProcessPoolExecutor(
+                        max_workers=min(jobs, len(todo)), initializer=_init_lint_worker, initargs=(options["config"],)
+                    )
+                )
+                linted = executor.map(_lint_file_in_worker, [(path, options) for path in todo])
+            else:
+                schemas = stack.enter_context(cached_schema_loading())
+                linted = (_lint_file(self, schemas, path, options) for path in todo)
+
+            for path in paths:
+                if path in cached:
+                    problems = cached[path]
+                else:
+                    problems, files = next(linted)
+                    if cache is not None:
+                        digests = {file: _file_hash(file, hashes) for file in files}
+                        cache.put(keys[path], json.dumps({"files": digests, "problems": problems}, default=str))
+                yield path, [LinterProblem.from_dict(problem) for problem in problems]
+
+
+def _file_hash(path: str, hashes: dict[str, str]) -> Optional[str]:
+    if path not in hashes:
+        try:
+            hashes[path] = hashlib.sha256(Path(path).read_bytes()).hexdigest()
+        except OSError:
+            hashes[path] = None
+    return hashes[path]
+
+
+_worker_linter: Optional[Linter] = None
+_worker_schemas: Optional[SchemaCache] = None
+
+
+def _init_lint_worker(config: dict[str, Any]) -> None:
+    """Set up a worker process of :meth:`Linter.lint_files`"""
+    global _worker_linter, _worker_schemas
+    _worker_linter = Linter(config)
+    _worker_schemas = SchemaCache(schemaview_module.load_schema_wrap)
+    schemaview_module.load_schema_wrap = _worker_schemas.load
+
+
+def _lint_file_in_worker(args: tuple[str, dict[str, Any]]) -> tuple[list[dict[str, Any]], list[str]]:
+    path, options = args
+    return _lint_file(_worker_linter, _worker_schemas, path, options)
+
+
+def _lint_file(
+    linter: Linter, schemas: SchemaCache, path: str, options: dict[str, Any]
+) -> tuple[list[dict[str, Any]], list[str]]:
+    """Lint a file in :meth:`Linter.lint_files`
+
+    :return: The problems found, and the files of the schema and its imports
+    """
+    with schemas.recording() as files:
+        problems = [
+            problem.to_dict()
+            for problem in linter.lint(
+                path,
+                fix=options["fix"],
+                validate_schema=options["validate_schema"],
+                validate_only=options["validate_only"],
+            )
+        ]
+    return problems, sorted({str(Path(path).resolve()), *(str(file) for file in files)})
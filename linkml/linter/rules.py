@@ -5,7 +5,7 @@ from __future__ import annotations
 import re
 from abc import ABC, abstractmethod
 from collections.abc import Callable, Iterable
-from functools import cache
+from functools import cache, cached_property
 
 from linkml_runtime.linkml_model import (
     ClassDefinition,
@@ -13,10 +13,9 @@ from linkml_runtime.linkml_model import (
     Element,
     ElementName,
     EnumDefinition,
-    EnumDefinitionName,
     SlotDefinition,
+    SubsetDefinition,
     TypeDefinition,
-    TypeDefinitionName,
 )
 from linkml_runtime.utils.schemaview import SchemaView
 from prefixmaps.io.parser import load_multi_context
@@ -29,7 +28,7 @@ from linkml.linter.config.datamodel.config import (
     StandardNamingConfig,
     TreeRootClassRuleConfig,
 )
-from linkml.linter.linter import LinterProblem
+from linkml.linter.linter import LintContext, LinterProblem, check_rules
 
 
 class LinterRule(ABC):
@@ -51,9 +50,56 @@ class LinterRule(ABC):
     def id(self) -> str:
         pass
 
-    @abstractmethod
-    def check(self, schema_view: SchemaView, fix: bool) -> Iterable[LinterProblem]:
-        pass
+    #: Whether the elements of imported schemas are visited too
+    visit_imports = False
+
+    def check(self, schema_view: SchemaView, fix: bool = False) -> Iterable[LinterProblem]:
+        """Check a schema against this rule
+
+        Rules either override this method, or the ``visit_*`` methods which :func:`check_rules` calls
+        for the schema and each of its elements, so that the :class:`Linter` visits the schema once
+        for all of its rules.
+        """
+        return check_rules(schema_view, [self], fix=fix)[self]
+
+    def visits_elements(self, kind: str | None = None) -> bool:
+        """Whether this rule is checked by visiting the schema
+
+        :param kind: If given, whether this rule visits the elements of this kind (e.g. ``"class"``)
+        """
+        cls = type(self)
+        if cls.check is not LinterRule.check:
+            return False
+        if kind is None:
+            return True
+        return cls.visit_element is not LinterRule.visit_element or (
+            getattr(cls, f"visit_{kind}") is not getattr(LinterRule, f"visit_{kind}")
+        )
+
+    def visit_schema(self, context: LintContext) -> Iterable[LinterProblem]:
+        return ()
+
+    def visit_element(self, element: Element, context: LintContext) -> Iterable[LinterProblem]:
+        """Visit any element, unless the rule overrides the method for the kind of element"""
+        return ()
+
+    def visit_class(self, class_definition: ClassDefinition, context: LintContext) -> Iterable[LinterProblem]:
+        return self.visit_element(class_definition, context)
+
+    def visit_slot(self, slot_definition: SlotDefinition, context: LintContext) -> Iterable[LinterProblem]:
+        return self.visit_element(slot_definition, context)
+
+    def visit_enum(self, enum_definition: EnumDefinition, context: LintContext) -> Iterable[LinterProblem]:
+        return self.visit_element(enum_definition, context)
+
+    def visit_type(self, type_definition: TypeDefinition, context: LintContext) -> Iterable[LinterProblem]:
+        return self.visit_element(type_definition, context)
+
+    def visit_subset(self, subset_definition: SubsetDefinition, context: LintContext) -> Iterable[LinterProblem]:
+        return self.visit_element(subset_definition, context)
+
+    def end_schema(self, context: LintContext) -> Iterable[LinterProblem]:
+        return ()
 
     @staticmethod
     def uncamel(n: str) -> str:
@@ -70,53 +116,56 @@ class NoEmptyTitleRule(LinterRule):
 
     # todo PVs are not checked for titles yet
 
-    def check(self, schema_view: SchemaView, fix: bool = False) -> Iterable[LinterProblem]:
-        excluded_types = [t.text if hasattr(t, "text") else str(t) for t in getattr(self.config, "exclude_type", [])]
-        for e in schema_view.all_elements(imports=False).values():
-            element_type_name = type(e).class_name
-            if element_type_name in excluded_types:
-                continue
-            if fix and e.title is None:
-                title = e.name.replace("_", " ")
-                title = self.uncamel(title).lower()
-                e.title = title
-            if e.title is None:
-                problem = LinterProblem(message=f"{self.format_element(e)} has no title")
-                yield problem
+    @cached_property
+    def excluded_types(self) -> list[str]:
+        return [t.text if hasattr(t, "text") else str(t) for t in getattr(self.config, "exclude_type", [])]
+
+    def visit_element(self, e: Element, context: LintContext) -> Iterable[LinterProblem]:
+        element_type_name = type(e).class_name
+        if element_type_name in self.excluded_types:
+            return
+        if context.fix and e.title is None:
+            title = e.name.replace("_", " ")
+            title = self.uncamel(title).lower()
+            e.title = title
+        if e.title is None:
+            problem = LinterProblem(message=f"{self.format_element(e)} has no title")
+            yield problem
 
 
 class NoXsdIntTypeRule(LinterRule):
     id = "no_xsd_int_type"
 
-    def check(self, schema_view: SchemaView, fix: bool = False):
-        for type_definition in schema_view.all_types(imports=False).values():
-            if type_definition.uri == "xsd:int":
-                if fix:
-                    type_definition.uri = "xsd:integer"
-                else:
-                    yield LinterProblem(f"{self.format_element(type_definition)} has uri xsd:int")
+    def visit_type(self, type_definition: TypeDefinition, context: LintContext) -> Iterable[LinterProblem]:
+        if type_definition.uri == "xsd:int":
+            if context.fix:
+                type_definition.uri = "xsd:integer"
+            else:
+                yield LinterProblem(f"{self.format_element(type_definition)} has uri xsd:int")
 
 
 class PermissibleValuesFormatRule(LinterRule):
     id = "permissible_values_format"
 
-    def check(self, schema_view: SchemaView, fix: bool = False) -> Iterable[LinterProblem]:
-        pattern = self.PATTERNS.get(self.config.format, re.compile(self.config.format))
-        for enum_def in schema_view.all_enums(imports=False).values():
-            for value in enum_def.permissible_values:
-                if pattern.fullmatch(value) is None:
-                    yield LinterProblem(f"{self.format_element(enum_def)} has permissible value '{value}'")
+    @cached_property
+    def pattern(self) -> re.Pattern:
+        return self.PATTERNS.get(self.config.format, re.compile(self.config.format))
+
+    def visit_enum(self, enum_def: EnumDefinition, context: LintContext) -> Iterable[LinterProblem]:
+        for value in enum_def.permissible_values:
+            if self.pattern.fullmatch(value) is None:
+                yield LinterProblem(f"{self.format_element(enum_def)} has permissible value '{value}'")
 
 
 @cache
-def _get_recommended_metamodel_slots() -> list[str]:
+def _get_recommended_metamodel_slots() -> set[str]:
     meta_schema_view = SchemaView(LOCAL_METAMODEL_YAML_FILE)
-    recommended_meta_slots = []
+    recommended_meta_slots = set()
     for class_name in meta_schema_view.all_classes(imports=False).keys():
         class_slots = meta_schema_view.class_induced_slots(class_name)
         for slot in class_slots:
             if slot.recommended:
-                recommended_meta_slots.append(f"{class_name}__{slot.name}")
+                recommended_meta_slots.add(f"{class_name}__{slot.name}")
     return recommended_meta_slots
 
 
@@ -128,23 +177,26 @@ class RecommendedRule(LinterRule):
     def __init__(self, config: RecommendedRuleConfig) -> None:
         self.config = config
 
-    def check(self, schema_view: SchemaView, fix: bool = False):
+    @cached_property
+    def excluded_types(self) -> list[str]:
+        return [t.text if hasattr(t, "text") else str(t) for t in getattr(self.config, "exclude_type", [])]
+
+    def visit_element(self, element_definition: Element, context: LintContext) -> Iterable[LinterProblem]:
         recommended_meta_slots = _get_recommended_metamodel_slots()
-        excluded_types = [t.text if hasattr(t, "text") else str(t) for t in getattr(self.config, "exclude_type", [])]
-        for element_name, element_definition in schema_view.all_elements(imports=False).items():
-            element_type_name = type(element_definition).class_name
-            if self.config.include and element_name not in self.config.include:
-                continue
-            if element_name in self.config.exclude:
-                continue
-            if element_type_name in excluded_types:
-                continue
-            for meta_slot_name, meta_slot_value in vars(element_definition).items():
-                key = f"{element_definition.class_name}__{meta_slot_name}"
-                if key in recommended_meta_slots and not meta_slot_value:
-                    yield LinterProblem(
-                        f"{self.format_element(element_definition)} does not have recommended slot '{meta_slot_name}'"
-                    )
+        element_name = element_definition.name
+        element_type_name = type(element_definition).class_name
+        if self.config.include and element_name not in self.config.include:
+            return
+        if element_name in self.config.exclude:
+            return
+        if element_type_name in self.excluded_types:
+            return
+        for meta_slot_name, meta_slot_value in vars(element_definition).items():
+            key = f"{element_definition.class_name}__{meta_slot_name}"
+            if key in recommended_meta_slots and not meta_slot_value:
+                yield LinterProblem(
+                    f"{self.format_element(element_definition)} does not have recommended slot '{meta_slot_name}'"
+                )
 
 
 class TreeRootClassRule(LinterRule):
@@ -153,8 +205,18 @@ class TreeRootClassRule(LinterRule):
     def __init__(self, config: TreeRootClassRuleConfig) -> None:
         super().__init__(config)
 
-    def check(self, schema_view: SchemaView, fix: bool = False) -> Iterable[LinterProblem]:
-        tree_roots = [c for c in schema_view.all_classes(imports=False).values() if c.tree_root]
+    def visit_schema(self, context: LintContext) -> Iterable[LinterProblem]:
+        self._tree_roots: list[ClassDefinition] = []
+        return ()
+
+    def visit_class(self, class_definition: ClassDefinition, context: LintContext) -> Iterable[LinterProblem]:
+        if class_definition.tree_root:
+            self._tree_roots.append(class_definition)
+        return ()
+
+    def end_schema(self, context: LintContext) -> Iterable[LinterProblem]:
+        schema_view = context.schema_view
+        tree_roots = self._tree_roots
         if len(tree_roots) > 0:
             if self.config.validate_existing_class_name:
                 for tree_root in tree_roots:
@@ -162,7 +224,7 @@ class TreeRootClassRule(LinterRule):
                         yield LinterProblem(message=f"Tree root class has an invalid name '{tree_root.name}'")
             if len(tree_roots) > 1:
                 yield LinterProblem("Schema has more than one class with `tree_root: true`")
-        elif fix:
+        elif context.fix:
             container = ClassDefinition(self.config.root_class_name, tree_root=True)
             schema_view.add_class(container)
             self.add_index_slots(schema_view, container.name)
@@ -219,66 +281,62 @@ class NoUndeclaredSlotsRule(LinterRule):
     """Linter rule to check that all slots from a class have been declared in the `slots` section."""
 
     id = "no_undeclared_slots"
+    visit_imports = True
 
-    def check(self, schema_view: SchemaView, fix: bool = False) -> Iterable[LinterProblem]:
+    def visit_class(self, class_definition: ClassDefinition, context: LintContext) -> Iterable[LinterProblem]:
         """Perform the check for undeclared slots.
 
-        :param schema_view: schema to be checked in a SchemaView object.
-        :type schema_view: SchemaView
-        :param fix: whether or not to fix, defaults to False
-        :type fix: bool, optional
+        :param class_definition: class to be checked, of the schema or its imports.
+        :type class_definition: ClassDefinition
+        :param context: schema being checked.
+        :type context: LintContext
         :yield: iterable of error messages about non-compliant slots.
         :rtype: Iterator[Iterable[LinterProblem]]
         """
+        schema_view = context.schema_view
         all_slots = schema_view.all_slots()
-        for class_name in schema_view.all_classes():
-            for slot_name in schema_view.class_slots(class_name):
-                if slot_name not in all_slots:
-                    yield LinterProblem(
-                        f"Slot '{slot_name}' from class '{class_name}' not found in schema 'slots' declaration."
-                    )
+        class_name = class_definition.name
+        for slot_name in schema_view.class_slots(class_name):
+            if slot_name not in all_slots:
+                yield LinterProblem(
+                    f"Slot '{slot_name}' from class '{class_name}' not found in schema 'slots' declaration."
+                )
 
 
 class NoInvalidSlotUsageRule(LinterRule):
     id = "no_invalid_slot_usage"
 
-    def check(self, schema_view: SchemaView, fix: bool = False) -> Iterable[LinterProblem]:
-        for class_name, class_definition in schema_view.all_classes(imports=False).items():
-            slot_usage = class_definition.slot_usage
-            if not slot_usage:
-                continue
-            class_slots = schema_view.class_slots(class_name)
-            for slot_usage_name in slot_usage:
-                if slot_usage_name not in class_slots:
-                    yield LinterProblem(f"Slot '{slot_usage_name}' not found on class '{class_name}'")
+    def visit_class(self, class_definition: ClassDefinition, context: LintContext) -> Iterable[LinterProblem]:
+        class_name = class_definition.name
+        slot_usage = class_definition.slot_usage
+        if not slot_usage:
+            return
+        class_slots = context.schema_view.class_slots(class_name)
+        for slot_usage_name in slot_usage:
+            if slot_usage_name not in class_slots:
+                yield LinterProblem(f"Slot '{slot_usage_name}' not found on class '{class_name}'")
 
 
 class NoUndeclaredRangesRule(LinterRule):
     id = "no_undeclared_ranges"
 
-    def check(self, schema_view: SchemaView, fix: bool = False) -> Iterable[LinterProblem]:
-        all_types: dict[TypeDefinitionName, TypeDefinition] = schema_view.all_types()
-        all_enums: dict[EnumDefinitionName, EnumDefinition] = schema_view.all_enums()
-        all_classes: dict[ClassDefinitionName, ClassDefinition] = schema_view.all_classes()
-        all_possible_ranges: set[TypeDefinitionName | EnumDefinitionName | ClassDefinitionName] = (
-            set(all_types) | set(all_enums) | set(all_classes)
-        )
+    visit_imports = True
 
+    def visit_schema(self, context: LintContext) -> Iterable[LinterProblem]:
         # check that the default_range has a valid value
-        default_range = schema_view.schema.default_range
-        if default_range and default_range not in all_possible_ranges:
+        default_range = context.schema_view.schema.default_range
+        if default_range and default_range not in context.all_ranges:
             yield LinterProblem(f"Schema default_range '{default_range}' is not defined.")
 
-        for class_name in schema_view.all_classes():
-            for slot in schema_view.class_induced_slots(class_name):
-                slot_range: set[ElementName] = set(schema_view.slot_range_as_union(slot))
+    def visit_class(self, class_definition: ClassDefinition, context: LintContext) -> Iterable[LinterProblem]:
+        class_name = class_definition.name
+        for slot in context.induced_schema.class_induced_slots(class_name):
+            slot_range: set[ElementName] = set(context.schema_view.slot_range_as_union(slot))
 
-                # check slot range is valid
-                for range_name in slot_range:
-                    if range_name not in all_possible_ranges:
-                        yield LinterProblem(
-                            f"Class '{class_name}' slot '{slot.name}' range '{range_name}' is not defined."
-                        )
+            # check slot range is valid
+            for range_name in slot_range:
+                if range_name not in context.all_ranges:
+                    yield LinterProblem(f"Class '{class_name}' slot '{slot.name}' range '{range_name}' is not defined.")
 
 
 class StandardNamingRule(LinterRule):
@@ -287,45 +345,48 @@ class StandardNamingRule(LinterRule):
     def __init__(self, config: StandardNamingConfig) -> None:
         self.config = config
 
-    def check(self, schema_view: SchemaView, fix: bool = False) -> Iterable[LinterProblem]:
-        excluded_types = [t.text if hasattr(t, "text") else str(t) for t in getattr(self.config, "exclude_type", [])]
-        class_pattern = (
-            self.PATTERNS["uppercamel"]
-            if not self.config.class_pattern
-            else self.PATTERNS.get(self.config.class_pattern, re.compile(self.config.class_pattern))
-        )
-        slot_pattern = (
-            self.PATTERNS["snake"]
-            if not self.config.slot_pattern
-            else self.PATTERNS.get(self.config.slot_pattern, re.compile(self.config.slot_pattern))
-        )
-
-        enum_pattern = self.PATTERNS["uppercamel"]
-        permissible_value_pattern = (
-            self.PATTERNS["uppersnake"] if self.config.permissible_values_upper_case else self.PATTERNS["snake"]
-        )
-
-        if "class_definition" not in excluded_types:
-            for class_name in schema_view.all_classes(imports=False):
-                if class_pattern.fullmatch(class_name) is None:
-                    yield LinterProblem(f"Class has name '{class_name}'")
-
-        if "slot_definition" not in excluded_types:
-            for slot_name in schema_view.all_slots(imports=False):
-                if slot_pattern.fullmatch(slot_name) is None:
-                    yield LinterProblem(f"Slot has name '{slot_name}'")
-
-        for enum_name, enum_definition in schema_view.all_enums(imports=False).items():
-            if "enum_definition" not in excluded_types and enum_pattern.fullmatch(enum_name) is None:
-                yield LinterProblem(f"Enum has name '{enum_name}'")
-
-            if "permissible_value" not in excluded_types:
-                for permissible_value_name in enum_definition.permissible_values:
-                    if permissible_value_pattern.fullmatch(permissible_value_name) is None:
-                        yield LinterProblem(
-                            f"Permissible value of {self.format_element(enum_definition)} "
-                            f"has name '{permissible_value_name}'"
-                        )
+    @cached_property
+    def excluded_types(self) -> list[str]:
+        return [t.text if hasattr(t, "text") else str(t) for t in getattr(self.config, "exclude_type", [])]
+
+    @cached_property
+    def class_pattern(self) -> re.Pattern:
+        if not self.config.class_pattern:
+            return self.PATTERNS["uppercamel"]
+        return self.PATTERNS.get(self.config.class_pattern, re.compile(self.config.class_pattern))
+
+    @cached_property
+    def slot_pattern(self) -> re.Pattern:
+        if not self.config.slot_pattern:
+            return self.PATTERNS["snake"]
+        return self.PATTERNS.get(self.config.slot_pattern, re.compile(self.config.slot_pattern))
+
+    @cached_property
+    def permissible_value_pattern(self) -> re.Pattern:
+        return self.PATTERNS["uppersnake"] if self.config.permissible_values_upper_case else self.PATTERNS["snake"]
+
+    def visit_class(self, class_definition: ClassDefinition, context: LintContext) -> Iterable[LinterProblem]:
+        class_name = class_definition.name
+        if "class_definition" not in self.excluded_types and self.class_pattern.fullmatch(class_name) is None:
+            yield LinterProblem(f"Class has name '{class_name}'")
+
+    def visit_slot(self, slot_definition: SlotDefinition, context: LintContext) -> Iterable[LinterProblem]:
+        slot_name = slot_definition.name
+        if "slot_definition" not in self.excluded_types and self.slot_pattern.fullmatch(slot_name) is None:
+            yield LinterProblem(f"Slot has name '{slot_name}'")
+
+    def visit_enum(self, enum_definition: EnumDefinition, context: LintContext) -> Iterable[LinterProblem]:
+        enum_name = enum_definition.name
+        if "enum_definition" not in self.excluded_types and self.PATTERNS["uppercamel"].fullmatch(enum_name) is None:
+            yield LinterProblem(f"Enum has name '{enum_name}'")
+
+        if "permissible_value" not in self.excluded_types:
+            for permissible_value_name in enum_definition.permissible_values:
+                if self.permissible_value_pattern.fullmatch(permissible_value_name) is None:
+                    yield LinterProblem(
+                        f"Permissible value of {self.format_element(enum_definition)} "
+                        f"has name '{permissible_value_name}'"
+                    )
 
 
 class CanonicalPrefixesRule(LinterRule):
@@ -334,11 +395,11 @@ class CanonicalPrefixesRule(LinterRule):
     def __init__(self, config: CanonicalPrefixesConfig) -> None:
         self.config = config
 
-    def check(self, schema_view: SchemaView, fix: bool = False) -> Iterable[LinterProblem]:
-        context = load_multi_context(self.config.prefixmaps_contexts)
-        prefix_to_namespace = context.as_dict()
-        namespace_to_prefix = context.as_inverted_dict()
-        for prefix in schema_view.schema.prefixes.values():
+    def visit_schema(self, context: LintContext) -> Iterable[LinterProblem]:
+        prefixmaps_context = load_multi_context(self.config.prefixmaps_contexts)
+        prefix_to_namespace = prefixmaps_context.as_dict()
+        namespace_to_prefix = prefixmaps_context.as_inverted_dict()
+        for prefix in context.schema_view.schema.prefixes.values():
             if (
                 prefix.prefix_prefix in prefix_to_namespace
                 and prefix.prefix_reference != prefix_to_namespace[prefix.prefix_prefix]
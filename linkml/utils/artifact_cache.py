@@ -0,0 +1,205 @@
+"""
+A content-addressed, on-disk cache for artifacts derived from a schema.
+
+Generating artifacts such as JSON Schema, Pydantic source code or a SHACL shapes graph
+is expensive and, for a given schema, generator version and set of generator options,
+always produces the same result. :class:`ArtifactCache` stores those results in a
+directory so that later processes can reuse them. Entries are keyed on:
+
+- a hash of the schema itself
+- a hash of every schema in its import closure
+- the LinkML version and the options passed to the generator
+
+The cache is bounded in size. When it grows past ``max_size`` bytes the least recently
+used entries are deleted.
+"""
+
+import hashlib
+import json
+import logging
+import os
+import tempfile
+from pathlib import Path
+from stat import S_ISREG
+from typing import Any, Optional, Union
+
+from linkml_runtime import SchemaView
+from linkml_runtime.dumpers import json_dumper
+from linkml_runtime.linkml_model import SchemaDefinition
+
+from linkml._version import __version__
+
+logger = logging.getLogger(__name__)
+
+#: Default upper bound on the total size of a cache directory (256 MiB)
+DEFAULT_MAX_SIZE = 256 * 1024 * 1024
+
+#: Environment variable which overrides :func:`default_cache_dir`
+CACHE_DIR_ENV = "LINKML_CACHE_DIR"
+
+
+def default_cache_dir() -> Path:
+    """Directory in which LinkML tools cache artifacts which do not depend on the user's schema
+
+    This is the directory set by the ``LINKML_CACHE_DIR`` environment variable, or else the
+    ``linkml`` directory of the user cache directory (``$XDG_CACHE_HOME``, ``~/.cache`` by default).
+    """
+    if os.environ.get(CACHE_DIR_ENV):
+        return Path(os.environ[CACHE_DIR_ENV])
+    return Path(os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache") / "linkml"
+
+
+def _hash_schema(schema: SchemaDefinition) -> str:
+    return hashlib.sha256(json_dumper.dumps(schema).encode("utf-8")).hexdigest()
+
+
+def schema_fingerprint(schema: Union[SchemaDefinition, SchemaView]) -> str:
+    """Compute a fingerprint of a schema and its import closure
+
+    Two schemas have the same fingerprint only if the schema itself and every schema it
+    (transitively) imports serialize identically.
+
+    :param schema: The schema, or a ``SchemaView`` over it
+    :return: Hex digest identifying the schema and its imports
+    """
+    schema_view = schema if isinstance(schema, SchemaView) else SchemaView(schema)
+    # Resolving the import closure annotates elements with from_schema, so it is done before
+    # hashing to get the same fingerprint whether or not the closure was resolved already.
+    imports = schema_view.imports_closure()
+    schema_hash = _hash_schema(schema_view.schema)
+    imports_hash = hashlib.sha256()
+    for name in sorted(imports):
+        if name == schema_view.schema.name:
+            continue
+        imports_hash.update(name.encode("utf-8"))
+        imports_hash.update(_hash_schema(schema_view.schema_map[name]).encode("utf-8"))
+    return hashlib.sha256(f"{schema_hash}:{imports_hash.hexdigest()}".encode()).hexdigest()
+
+
+def artifact_key(fingerprint: str, artifact: str, **options: Any) -> str:
+    """Build the cache key of an artifact, see :meth:`ArtifactCache.key`"""
+    options_json = json.dumps(options, sort_keys=True, default=str)
+    digest = hashlib.sha256(f"{__version__}:{fingerprint}:{options_json}".encode()).hexdigest()
+    return f"{digest}-{artifact}"
+
+
+class ArtifactCache:
+    """A size-bounded directory of generated artifacts
+
+    :param directory: Directory to store cached artifacts in. It is created if it does
+        not exist.
+    :param max_size: Maximum total size in bytes of the cached artifacts. Defaults to
+        :data:`DEFAULT_MAX_SIZE`.
+    """
+
+    def __init__(self, directory: Union[str, os.PathLike], *, max_size: int = DEFAULT_MAX_SIZE) -> None:
+        self.directory = Path(directory)
+        self.max_size = max_size
+
+    def key(self, fingerprint: str, artifact: str, **options: Any) -> str:
+        """Build the cache key of an artifact
+
+        :param fingerprint: Fingerprint of the source schema, see :func:`schema_fingerprint`
+        :param artifact: Name of the artifact, including a file extension, e.g. ``jsonschema.json``
+        :param options: Generator options that affect the artifact's content
+        :return: A key which can be passed to :meth:`get` and :meth:`put`
+        """
+        return artifact_key(fingerprint, artifact, **options)
+
+    def get(self, key: str) -> Optional[str]:
+        """Look up a cached artifact
+
+        :param key: Key from :meth:`key`
+        :return: The content of the artifact, or ``None`` if it is not cached
+        """
+        path = self.directory / key
+        try:
+            content = path.read_text(encoding="utf-8")
+        except FileNotFoundError:
+            return None
+        try:
+            # Record the access so that eviction removes least recently used entries first
+            os.utime(path)
+        except OSError:
+            pass
+        logger.debug(f"Artifact cache hit: {key}")
+        return content
+
+    def put(self, key: str, content: str) -> None:
+        """Store an artifact in the cache, evicting old entries if needed
+
+        The write is atomic, so concurrent readers never observe a partially written entry.
+
+        :param key: Key from :meth:`key`
+        :param content: The content of the artifact
+        """
+        self.directory.mkdir(parents=True, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=self.directory, prefix=".tmp-")
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as stream:
+                stream.write(content)
+            os.replace(tmp_path, self.directory / key)
+        except BaseException:
+            Path(tmp_path).unlink(missing_ok=True)
+            raise
+        logger.debug(f"Artifact cache store: {key}")
+        self.evict()
+
+    def evict(self) -> None:
+        """Delete least recently used entries until the cache fits within ``max_size``
+
+        The bytecode which Python modules cached here have in ``__pycache__`` (see
+        :mod:`linkml.utils.module_cache`) counts towards the size of their entry, and is deleted
+        with it.
+        """
+        bytecode = _bytecode_files(self.directory / "__pycache__")
+        entries = []
+        total_size = 0
+        for path in self.directory.iterdir():
+            if path.name.startswith(".tmp-"):
+                continue
+            try:
+                stat = path.stat()
+            except FileNotFoundError:
+                continue
+            if not S_ISREG(stat.st_mode):
+                continue
+            files = [path, *bytecode.pop(path.stem, [])] if path.suffix == ".py" else [path]
+            size = stat.st_size + sum(_file_size(f) for f in files[1:])
+            entries.append((stat.st_mtime, size, files))
+            total_size += size
+        # bytecode left over from entries deleted earlier
+        for files in bytecode.values():
+            for f in files:
+                size = _file_size(f)
+                entries.append((0, size, [f]))
+                total_size += size
+        if total_size <= self.max_size:
+            return
+        for _, size, files in sorted(entries):
+            for f in files:
+                f.unlink(missing_ok=True)
+            total_size -= size
+            if total_size <= self.max_size:
+                break
+
+
+def _bytecode_files(pycache: Path) -> dict[str, list[Path]]:
+    """Bytecode files of a ``__pycache__`` directory, by the stem of their source file"""
+    files = {}
+    try:
+        paths = list(pycache.iterdir())
+    except FileNotFoundError:
+        return files
+    for path in paths:
+        if path.suffix == ".pyc":
+            # e.g. <stem>.cpython-312.pyc
+            files.setdefault(path.name.rsplit(".", 2)[0], []).append(path)
+    return files
+
+
+def _file_size(path: Path) -> int:
+    try:
+        return path.stat().st_size
+    except FileNotFoundError:
+        return 0
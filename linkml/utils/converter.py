@@ -24,6 +24,7 @@ from linkml.utils.datautils import (
     infer_index_slot,
     infer_root_class,
 )
+from linkml.utils.module_cache import compile_module_cached
 
 logger = logging.getLogger(__name__)
 
@@ -111,7 +112,7 @@ def cli(
         if schema is None:
             raise Exception("must pass one of module OR schema")
         else:
-            python_module = PythonGenerator(schema).compile_module()
+            python_module = compile_module_cached(PythonGenerator(schema))
     else:
         python_module = compile_python(module)
     prefix_map = {}
@@ -8,8 +8,6 @@ from linkml_runtime.loaders import CSVLoader, JSONLoader, RDFLibLoader, TSVLoade
 from linkml_runtime.loaders.loader_root import Loader
 from linkml_runtime.utils.schemaview import SchemaView
 
-from linkml.generators.jsonldcontextgen import ContextGenerator
-
 dumpers_loaders = {
     "yml": (YAMLDumper, YAMLLoader),
     "yaml": (YAMLDumper, YAMLLoader),
@@ -63,6 +61,8 @@ def get_dumper(fmt: str) -> Loader:
 
 
 def _get_context(schema) -> str:
+    from linkml.generators.jsonldcontextgen import ContextGenerator
+
     return ContextGenerator(schema).serialize()
 
 
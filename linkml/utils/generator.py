@@ -22,7 +22,8 @@ import re
 import sys
 from collections.abc import Mapping
 from dataclasses import dataclass, field
-from functools import lru_cache
+from functools import lru_cache, wraps
+from io import StringIO
 from pathlib import Path
 from typing import Callable, ClassVar, Optional, TextIO, Union, cast
 
@@ -285,14 +286,36 @@ class Generator(metaclass=abc.ABCMeta):
         :param kwargs: Generator specific parameters
         :return: Generated output
         """
-        out = ""
+        out = StringIO()
+        self._visit_elements(out, **kwargs)
+        return out.getvalue()
 
+    def serialize_to(self, stream: TextIO, **kwargs) -> None:
+        """
+        Generate output in the required format, writing it to a stream
+
+        Generators which use the visitor pattern write the output of each visit to the stream as soon
+        as it is produced, rather than building the complete output in memory. Generators which
+        override :meth:`serialize` write its result.
+
+        :param stream: Stream to which the output is written, e.g. an open file
+        :param kwargs: Generator specific parameters
+        """
+        if type(self).serialize is not Generator.serialize:
+            out = self.serialize(**kwargs)
+            if out is not None:
+                stream.write(out)
+            return
+        self._visit_elements(stream, **kwargs)
+
+    def _visit_elements(self, stream: TextIO, **kwargs) -> None:
+        """Visit the elements of the schema, writing the output of every visit to a stream"""
         # the default is to use the Visitor Pattern; each individual generator may
         # choose to override methods {visit,end}_{element}.
         # See https://github.com/linkml/linkml/issues/923
         sub_out = self.visit_schema(**kwargs)
         if sub_out is not None:
-            out += sub_out
+            stream.write(sub_out)
         for sn, ss in (
             sorted(self.schema.subsets.items(), key=lambda s: s[0].lower())
             if self.visits_are_sorted
@@ -300,7 +323,7 @@ class Generator(metaclass=abc.ABCMeta):
         ):
             sub_out = self.visit_subset(ss)
             if sub_out is not None:
-                out += sub_out
+                stream.write(sub_out)
         for tn, typ in (
             sorted(self.schema.types.items(), key=lambda s: s[0].lower())
             if self.visits_are_sorted
@@ -308,7 +331,7 @@ class Generator(metaclass=abc.ABCMeta):
         ):
             sub_out = self.visit_type(typ)
             if sub_out is not None:
-                out += sub_out
+                stream.write(sub_out)
         for enum in (
             sorted(self.schema.enums.values(), key=lambda e: e.name.lower())
             if self.visits_are_sorted
@@ -316,7 +339,7 @@ class Generator(metaclass=abc.ABCMeta):
         ):
             sub_out = self.visit_enum(enum)
             if sub_out is not None:
-                out += sub_out
+                stream.write(sub_out)
         for sn, slot in (
             sorted(self.schema.slots.items(), key=lambda c: c[0].lower())
             if self.visits_are_sorted
@@ -324,7 +347,7 @@ class Generator(metaclass=abc.ABCMeta):
         ):
             sub_out = self.visit_slot(self.aliased_slot_name(slot), slot)
             if sub_out is not None:
-                out += sub_out
+                stream.write(sub_out)
         for cls in (
             sorted(self.schema.classes.values(), key=lambda c: c.name.lower())
             if self.visits_are_sorted
@@ -333,18 +356,17 @@ class Generator(metaclass=abc.ABCMeta):
             cls_out = self.visit_class(cls)
             if cls_out:
                 if isinstance(cls_out, str):
-                    out += cls_out
+                    stream.write(cls_out)
                 for slot in self.all_slots(cls) if self.visit_all_class_slots else self.own_slots(cls):
                     sub_out = self.visit_class_slot(cls, self.aliased_slot_name(slot), slot)
                     if sub_out is not None:
-                        out += sub_out
+                        stream.write(sub_out)
                 sub_out = self.end_class(cls)
                 if sub_out is not None:
-                    out += sub_out
+                    stream.write(sub_out)
         sub_out = self.end_schema(**kwargs)
         if sub_out is not None:
-            out += sub_out
-        return out
+            stream.write(sub_out)
 
     def visit_schema(self, **kwargs) -> Optional[str]:
         """Visited once at the beginning of generation
@@ -913,6 +935,40 @@ class Generator(metaclass=abc.ABCMeta):
         return cls.class_uri == "linkml:Any"
 
 
+def _watchable(callback: Callable) -> Callable:
+    """Wrap a generator command so that it reruns on schema changes when called with ``watch=True``"""
+
+    @wraps(callback)
+    def wrapper(*args, watch: bool = False, **kwargs):
+        if not watch:
+            return callback(*args, **kwargs)
+        from linkml.utils.watch import watch_schema
+
+        watch_schema(kwargs["yamlfile"], lambda: callback(*args, **kwargs))
+
+    return wrapper
+
+
+def _profiled(callback: Callable) -> Callable:
+    """Wrap a generator command so that it reports where the time went when called with ``profile=True``"""
+
+    @wraps(callback)
+    def wrapper(*args, profile: bool = False, profile_trace: Optional[str] = None, **kwargs):
+        if not profile and not profile_trace:
+            return callback(*args, **kwargs)
+        from linkml.utils.profiling import profile_generation
+
+        with profile_generation() as generation_profile:
+            try:
+                return callback(*args, **kwargs)
+            finally:
+                click.echo(generation_profile.summary(), err=True)
+                if profile_trace:
+                    generation_profile.write_trace(profile_trace)
+
+    return wrapper
+
+
 def shared_arguments(g: type[Generator]) -> Callable[[Command], Command]:
     def verbosity_callback(ctx, param, verbose):
         if verbose >= 2:
@@ -977,6 +1033,31 @@ def shared_arguments(g: type[Generator]) -> Callable[[Command], Command]:
                 callback=stacktrace_callback,
             )
         )
+        f.params.append(
+            Option(
+                ("--watch/--no-watch",),
+                default=False,
+                show_default=True,
+                help="Keep running, and generate again whenever the schema or one of its local imports changes",
+            )
+        )
+        f.params.append(
+            Option(
+                ("--profile/--no-profile",),
+                default=False,
+                show_default=True,
+                help="Print the time spent in each phase of the generator, and in SchemaView, to stderr",
+            )
+        )
+        f.params.append(
+            Option(
+                ("--profile-trace",),
+                type=click.Path(dir_okay=False, writable=True),
+                help="Write every call recorded by --profile to this file, as a JSON trace for speedscope or "
+                "Chrome tracing. Implies --profile.",
+            )
+        )
+        f.callback = _watchable(_profiled(f.callback))
 
         return f
 
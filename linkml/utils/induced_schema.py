@@ -0,0 +1,211 @@
+"""
+The induced slots of every class of a schema, computed once.
+
+:meth:`SchemaView.induced_slot` derives a slot in the context of a class by walking the ancestors
+of the class once for every metaslot, and the classes of the schema once more to find the
+``domain_of`` of the slot. Generators and validation plugins which induce every slot of every
+class pay this cost for each pair of class and slot, and each tool pays it again.
+
+:class:`InducedSchema` computes the same induced slots in a single pass: the ``domain_of`` of
+each slot, the ``slot_usage`` declared by the ancestors of each class and the values inherited
+from slot ancestors are each collected once and shared by all the slots which use them. Use
+:func:`induced_schema` to share one index between all the tools which use the same
+:class:`SchemaView`.
+
+The induced slots are the same as those of :meth:`SchemaView.induced_slot`, which is checked
+against the metamodel and the kitchen sink schemas, with one intended difference. SchemaView
+makes the definition of an identifier or key slot required only once it has induced the slot,
+so the first class the slot is induced for gets a slot which is not required. The index makes
+these definitions required up front, so that the result does not depend on the order in which
+slots are induced.
+"""
+
+from copy import copy
+from functools import lru_cache
+from typing import Optional
+
+from linkml_runtime import SchemaView
+from linkml_runtime.linkml_model import SlotDefinition
+from linkml_runtime.linkml_model.meta import ClassDefinitionName, SlotDefinitionName
+from linkml_runtime.utils.formatutils import is_empty, underscore
+
+# Metaslots which are combined with the value of ancestors rather than overridden
+_COMBINE = {
+    "maximum_value": min,
+    "minimum_value": max,
+}
+
+
+def _complete(slot: Optional[SlotDefinition]) -> Optional[SlotDefinition]:
+    """Make identifier and key slot definitions required
+
+    :meth:`SchemaView.induced_slot` sets this on the definition of every slot it induces, so the
+    result of inducing a slot depends on whether it was induced before. It is set before inducing
+    here, which gives the same result as SchemaView does once the slot was induced.
+    """
+    if slot is not None and (slot.identifier or slot.key):
+        slot.required = True
+    return slot
+
+
+class InducedSchema:
+    """Index of the induced slots of every class of a schema
+
+    The slots are the same as the ones returned by :meth:`SchemaView.induced_slot` and
+    :meth:`SchemaView.class_induced_slots`, and are computed the first time a class is used.
+    As with those methods, the returned slots must not be modified.
+
+    :param schemaview: View of the schema. The index reflects the schema at the time it is
+        created, so create a new index after modifying the schema.
+    """
+
+    def __init__(self, schemaview: SchemaView) -> None:
+        self.schemaview = schemaview
+        self._classes = schemaview.all_classes()
+        self._metaslots = list(vars(SlotDefinition("_")).keys())
+        self._domains: dict[SlotDefinitionName, list[ClassDefinitionName]] = {}
+        for class_name, cls in self._classes.items():
+            for slot_name in [*cls.slots, *cls.attributes]:
+                domain = self._domains.setdefault(slot_name, [])
+                if class_name not in domain:
+                    domain.append(class_name)
+        self._ancestors: dict[SlotDefinitionName, list[Optional[SlotDefinition]]] = {}
+        self._class_slots: dict[Optional[ClassDefinitionName], dict[SlotDefinitionName, SlotDefinition]] = {}
+
+    def class_induced_slots(self, class_name: ClassDefinitionName) -> list[SlotDefinition]:
+        """All slots of a class, induced in the context of the class
+
+        :param class_name: Name of the class
+        :return: Induced slots, in the order of :meth:`SchemaView.class_slots`
+        """
+        return list(self._induced_slots(class_name).values())
+
+    def induced_slot(
+        self, slot_name: SlotDefinitionName, class_name: Optional[ClassDefinitionName] = None
+    ) -> SlotDefinition:
+        """A slot induced in the context of a class
+
+        :param slot_name: Name of the slot
+        :param class_name: Name of the class. If not given, the slot is induced from its own
+            definition and ancestors only.
+        :return: Induced slot
+        """
+        slots = self._induced_slots(class_name)
+        if slot_name not in slots:
+            slots[slot_name] = self._induce(slot_name, class_name)
+        return slots[slot_name]
+
+    def identifier_slot(self, class_name: ClassDefinitionName, use_key: bool = False) -> Optional[SlotDefinition]:
+        """The induced identifier slot of a class, as :meth:`SchemaView.get_identifier_slot`
+
+        :param class_name: Name of the class
+        :param use_key: If the class has no identifier, return its key slot
+        :return: Induced identifier (or key) slot, if the class has one
+        """
+        slots = self.class_induced_slots(class_name)
+        for slot in slots:
+            if slot.identifier:
+                return slot
+        if use_key:
+            for slot in slots:
+                if slot.key:
+                    return slot
+        return None
+
+    def _induced_slots(self, class_name: Optional[ClassDefinitionName]) -> dict[SlotDefinitionName, SlotDefinition]:
+        if class_name not in self._class_slots:
+            if class_name is None:
+                self._class_slots[None] = {}
+            else:
+                self._class_slots[class_name] = {
+                    slot_name: self._induce(slot_name, class_name)
+                    for slot_name in self.schemaview.class_slots(class_name)
+                }
+        return self._class_slots[class_name]
+
+    def _slot_ancestors(self, slot_name: SlotDefinitionName) -> list[Optional[SlotDefinition]]:
+        """Definitions of a slot and its ancestors, most specific last"""
+        if slot_name not in self._ancestors:
+            sv = self.schemaview
+            self._ancestors[slot_name] = [
+                _complete(sv.get_slot(ancestor_name, attributes=False))
+                for ancestor_name in reversed(sv.slot_ancestors(slot_name, reflexive=True))
+            ]
+        return self._ancestors[slot_name]
+
+    def _induce(self, slot_name: SlotDefinitionName, class_name: Optional[ClassDefinitionName]) -> SlotDefinition:
+        """Induce a slot in the same way as :meth:`SchemaView.induced_slot`"""
+        sv = self.schemaview
+        slot_comes_from_attribute = False
+        usages = []
+        if class_name is not None:
+            sv.get_class(class_name, strict=True)
+            slot = sv.get_slot(slot_name, attributes=False)
+            for ancestor_name in sv.class_ancestors(class_name):
+                attributes = self._classes[ancestor_name].attributes
+                if slot_name in attributes:
+                    slot = attributes[slot_name]
+                    slot_comes_from_attribute = True
+                    break
+            # slot_usage of more specific classes takes precedence
+            for ancestor_name in reversed(sv.class_ancestors(class_name, reflexive=True, mixins=True)):
+                slot_usage = self._classes[ancestor_name].slot_usage
+                if slot_name in slot_usage:
+                    usages.append(slot_usage[slot_name])
+        else:
+            slot = sv.get_slot(slot_name, attributes=True)
+        if slot is None:
+            raise ValueError(
+                f"No such slot {slot_name} as an attribute of {class_name} ancestors "
+                "or as a slot definition in the schema"
+            )
+
+        induced = copy(_complete(slot))
+        if not slot_comes_from_attribute:
+            # values are read for every slot, as inducing a slot may set required or inlined on a definition
+            for ancestor in self._slot_ancestors(slot_name):
+                for metaslot_name in SlotDefinition._inherited_slots:
+                    value = getattr(ancestor, metaslot_name, None)
+                    if value:
+                        setattr(induced, metaslot_name, copy(value))
+        if class_name is not None:
+            induced.owner = class_name
+        for metaslot_name in self._metaslots:
+            v = getattr(induced, metaslot_name, None)
+            for usage in usages:
+                v2 = getattr(usage, metaslot_name, None)
+                if v is None:
+                    v = v2
+                elif metaslot_name in _COMBINE:
+                    if v2 is not None:
+                        v = _COMBINE[metaslot_name](v, v2)
+                elif not is_empty(v2):
+                    v = v2
+            if v is None and metaslot_name == "range":
+                v = sv.schema.default_range
+            if v is not None:
+                setattr(induced, metaslot_name, v)
+        if class_name is not None:
+            induced.owner = class_name
+        # as SchemaView does, this is set on the definition after inducing
+        if slot.inlined_as_list:
+            slot.inlined = True
+        if not induced.alias:
+            induced.alias = underscore(slot_name)
+        for domain_class in self._domains.get(induced.name, []):
+            if domain_class not in induced.domain_of:
+                induced.domain_of.append(domain_class)
+        return induced
+
+
+@lru_cache(maxsize=16)
+def induced_schema(schemaview: SchemaView) -> InducedSchema:
+    """The :class:`InducedSchema` of a schema view, shared by every caller using the same view
+
+    Views are compared in the same way as in the caches of :class:`SchemaView`, so a view which
+    has been modified since (see :meth:`SchemaView.set_modified`) gets a new index.
+
+    :param schemaview: View of the schema
+    :return: Index of the induced slots of the schema
+    """
+    return InducedSchema(schemaview)
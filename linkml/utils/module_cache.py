@@ -0,0 +1,136 @@
+"""
+A cache of Python modules compiled from generated code.
+
+Generators such as :class:`linkml.generators.PythonGenerator` and
+:class:`linkml.generators.PydanticGenerator` can compile their output into a module with
+``compile_module``, which renders the code and executes it on every call.
+:func:`compile_module_cached` keys the module on the fingerprint of the schema and its imports
+(see :func:`linkml.utils.artifact_cache.schema_fingerprint`), the generator class and its
+options, and reuses it:
+
+- in memory, for the :data:`MAX_MODULES` most recently used modules of the process, so that
+  regenerating an edited schema (e.g. in ``--watch`` mode) does not keep every earlier module
+- on disk, if a cache directory is given or the ``LINKML_MODULE_CACHE_DIR`` environment
+  variable is set. The generated code is stored as a ``.py`` file in that directory, and its
+  bytecode in the ``__pycache__`` directory next to it, so that other processes neither
+  generate nor compile it again. The bytecode counts towards the size bound of
+  :class:`~linkml.utils.artifact_cache.ArtifactCache`.
+"""
+
+import dataclasses
+import importlib.util
+import logging
+import os
+import py_compile
+import sys
+from importlib.machinery import SourceFileLoader
+from pathlib import Path
+from types import ModuleType
+from typing import Any, Optional, Union
+
+from linkml.utils.artifact_cache import ArtifactCache, artifact_key, schema_fingerprint
+from linkml.utils.generator import Generator
+
+logger = logging.getLogger(__name__)
+
+#: Environment variable naming the default on-disk cache directory
+MODULE_CACHE_DIR_ENV = "LINKML_MODULE_CACHE_DIR"
+
+_OPTION_TYPES = (type(None), str, int, float, bool, Path, list, tuple, set, dict)
+
+#: Number of compiled modules kept in memory
+MAX_MODULES = 32
+
+# Compiled modules by key, least recently used first
+_modules: dict[str, ModuleType] = {}
+
+
+def _generator_options(generator: Generator) -> dict[str, Any]:
+    """Public dataclass fields of a generator which are plain values, excluding the schema"""
+    options = {}
+    for f in dataclasses.fields(generator):
+        value = getattr(generator, f.name, None)
+        if f.name == "schema" or f.name.startswith("_") or not isinstance(value, _OPTION_TYPES):
+            continue
+        # Sets are sorted so that the key does not depend on hash randomization
+        options[f.name] = sorted(value, key=str) if isinstance(value, set) else value
+    return options
+
+
+def _exec_file(name: str, path: Path, source: str) -> ModuleType:
+    """Execute a cached file as a module, compiling its bytecode the first time it is used"""
+    bytecode = Path(importlib.util.cache_from_source(str(path)))
+    try:
+        if not bytecode.exists():
+            # The key of a cached file changes with its content, so the bytecode does not need to
+            # be checked against the source, whose modification time ArtifactCache.get updates
+            py_compile.compile(
+                str(path),
+                cfile=str(bytecode),
+                doraise=True,
+                invalidation_mode=py_compile.PycInvalidationMode.UNCHECKED_HASH,
+            )
+        code = SourceFileLoader(name, str(path)).get_code(name)
+    except OSError:
+        # e.g. the entry was evicted by another process, or the directory is read-only
+        code = compile(source, str(path), "exec")
+    module = ModuleType(name)
+    module.__file__ = str(path)
+    # Generated dataclasses look up their module in sys.modules
+    sys.modules[name] = module
+    try:
+        exec(code, module.__dict__)
+    except BaseException:
+        del sys.modules[name]
+        raise
+    return module
+
+
+def _remember(key: str, module: ModuleType) -> None:
+    """Keep a module in memory, forgetting the least recently used module if there are too many"""
+    _modules[key] = module
+    while len(_modules) > MAX_MODULES:
+        evicted = _modules.pop(next(iter(_modules)))
+        if sys.modules.get(evicted.__name__) is evicted:
+            del sys.modules[evicted.__name__]
+
+
+def compile_module_cached(
+    generator: Generator, *, cache_dir: Optional[Union[str, os.PathLike]] = None, **kwargs
+) -> ModuleType:
+    """Compile the code produced by a generator into a module, reusing a cached module if possible
+
+    :param generator: A generator which produces Python code from its ``serialize`` method,
+        e.g. :class:`linkml.generators.PythonGenerator`
+    :param cache_dir: Directory in which to cache the generated code. Defaults to the value
+        of the ``LINKML_MODULE_CACHE_DIR`` environment variable. If neither is set, modules
+        are only cached in memory.
+    :param kwargs: Arguments passed to the generator's ``compile_module`` or ``serialize`` method
+    :return: The compiled module
+    """
+    key = artifact_key(
+        schema_fingerprint(generator.schemaview),
+        f"{type(generator).__name__.lower()}.py",
+        generator=f"{type(generator).__module__}.{type(generator).__qualname__}",
+        options=_generator_options(generator),
+        serialize_args=kwargs,
+    )
+    if key in _modules:
+        logger.debug(f"Module cache hit: {key}")
+        # Move the module to the end, as the most recently used
+        module = _modules[key] = _modules.pop(key)
+        return module
+
+    cache_dir = cache_dir or os.environ.get(MODULE_CACHE_DIR_ENV)
+    if cache_dir:
+        cache = ArtifactCache(cache_dir)
+        source = cache.get(key)
+        if source is None:
+            source = generator.serialize(**kwargs)
+            cache.put(key, source)
+        module = _exec_file(f"linkml_cached_module_{key.split('-', 1)[0]}", cache.directory / key, source)
+    else:
+        module = generator.compile_module(**kwargs)
+
+    _remember(key, module)
+    return module
@@ -0,0 +1,181 @@
+"""
+Where the time goes when generating from a schema.
+
+Within :func:`profile_generation`, the wall time and number of calls of the phases of every
+generator are recorded:
+
+* the ``serialize``, ``visit_*`` and ``end_*`` methods of :class:`~linkml.utils.generator.Generator`,
+* the ``before_*`` and ``after_*`` methods of :class:`~linkml.generators.common.lifecycle.LifecycleMixin`,
+* the :class:`~linkml_runtime.utils.schemaview.SchemaView` and
+  :class:`~linkml.utils.induced_schema.InducedSchema` methods in which generators spend most of their time,
+  such as ``induced_slot`` and ``class_ancestors``.
+
+It is used by the ``--profile`` and ``--profile-trace`` options of the generator command line tools.
+Times are inclusive: the time of a phase includes the time of the SchemaView calls made from it.
+"""
+
+import json
+import os
+import threading
+import time
+from collections.abc import Iterator
+from contextlib import contextmanager
+from dataclasses import dataclass
+from functools import wraps
+from pathlib import Path
+from typing import Callable, Union
+
+from linkml_runtime import SchemaView
+
+#: SchemaView methods which are recorded, in addition to the phases of the generators
+SCHEMAVIEW_METHODS = [
+    "imports_closure",
+    "all_classes",
+    "all_slots",
+    "all_types",
+    "all_enums",
+    "all_elements",
+    "get_class",
+    "get_slot",
+    "get_type",
+    "get_enum",
+    "get_element",
+    "get_uri",
+    "expand_curie",
+    "class_parents",
+    "class_children",
+    "class_ancestors",
+    "class_descendants",
+    "slot_ancestors",
+    "slot_descendants",
+    "class_slots",
+    "class_induced_slots",
+    "induced_slot",
+    "induced_type",
+    "induced_enum",
+    "get_identifier_slot",
+    "is_inlined",
+]
+
+_GENERATOR_PREFIXES = ("serialize", "visit_", "end_")
+_LIFECYCLE_PREFIXES = ("before_", "after_")
+
+
+@dataclass
+class PhaseStats:
+    """Calls of one phase"""
+
+    calls: int = 0
+    seconds: float = 0.0
+
+
+class GenerationProfile:
+    """Wall time and calls of the phases of a generator run, see :func:`profile_generation`"""
+
+    def __init__(self) -> None:
+        self.phases: dict[str, PhaseStats] = {}
+        self._events: list[tuple[str, float, float, int]] = []
+        self._start = time.perf_counter()
+
+    def record(self, name: str, start: float, end: float) -> None:
+        stats = self.phases.get(name)
+        if stats is None:
+            stats = self.phases[name] = PhaseStats()
+        stats.calls += 1
+        stats.seconds += end - start
+        self._events.append((name, start, end, threading.get_ident()))
+
+    def summary(self, limit: int = 40) -> str:
+        """Table of the phases which took the most time
+
+        :param limit: Maximum number of phases in the table
+        :return: Table, one phase per line
+        """
+        rows = sorted(self.phases.items(), key=lambda item: item[1].seconds, reverse=True)[:limit]
+        width = max([len("Phase")] + [len(name) for name, _ in rows])
+        lines = [f"{'Phase':<{width}}  {'Calls':>9}  {'Total (s)':>10}  {'Mean (ms)':>10}"]
+        for name, stats in rows:
+            mean = 1000 * stats.seconds / stats.calls
+            lines.append(f"{name:<{width}}  {stats.calls:>9}  {stats.seconds:>10.3f}  {mean:>10.3f}")
+        return "\n".join(lines)
+
+    def trace(self) -> dict:
+        """Every recorded call in the Chrome trace event format, which can also be loaded by speedscope"""
+        pid = os.getpid()
+        return {
+            "traceEvents": [
+                {
+                    "name": name,
+                    "ph": "X",
+                    "ts": (start - self._start) * 1e6,
+                    "dur": (end - start) * 1e6,
+                    "pid": pid,
+                    "tid": tid,
+                }
+                for name, start, end, tid in self._events
+            ],
+            "displayTimeUnit": "ms",
+        }
+
+    def write_trace(self, path: Union[str, os.PathLike]) -> None:
+        """Write :meth:`trace` to a JSON file"""
+        Path(path).write_text(json.dumps(self.trace()), encoding="utf-8")
+
+
+def _subclasses(cls: type) -> list[type]:
+    subclasses = []
+    for subclass in cls.__subclasses__():
+        subclasses.append(subclass)
+        subclasses.extend(_subclasses(subclass))
+    return subclasses
+
+
+def _instrumented_methods() -> Iterator[tuple[type, str]]:
+    """Classes and names of the methods which are recorded"""
+    from linkml.generators.common.lifecycle import LifecycleMixin
+    from linkml.utils.generator import Generator
+    from linkml.utils.induced_schema import InducedSchema
+
+    methods = []
+    for base, prefixes in ((Generator, _GENERATOR_PREFIXES), (LifecycleMixin, _LIFECYCLE_PREFIXES)):
+        for cls in [base, *_subclasses(base)]:
+            methods.extend((cls, name) for name in vars(cls) if name.startswith(prefixes))
+    methods.extend((SchemaView, name) for name in SCHEMAVIEW_METHODS)
+    methods.extend((InducedSchema, name) for name in ("class_induced_slots", "induced_slot", "identifier_slot"))
+    seen = set()
+    for cls, name in methods:
+        value = vars(cls).get(name)
+        # static and class methods would be bound to the instance once wrapped in a function
+        if callable(value) and not isinstance(value, (staticmethod, classmethod)) and (cls, name) not in seen:
+            seen.add((cls, name))
+            yield cls, name
+
+
+def _timed(profile: GenerationProfile, name: str, func: Callable) -> Callable:
+    @wraps(func)
+    def wrapper(*args, **kwargs):
+        start = time.perf_counter()
+        try:
+            return func(*args, **kwargs)
+        finally:
+            profile.record(name, start, time.perf_counter())
+
+    return wrapper
+
+
+@contextmanager
+def profile_generation() -> Iterator[GenerationProfile]:
+    """Record the phases of every generator run within the context
+
+    Generators which are imported while profiling, and work done in other processes (e.g.
+    ``DocGenerator`` with several jobs) are not recorded.
+    """
+    profile = GenerationProfile()
+    originals = [(cls, name, vars(cls)[name]) for cls, name in _instrumented_methods()]
+    for cls, name, func in originals:
+        setattr(cls, name, _timed(profile, f"{cls.__name__}.{name}", func))
+    try:
+        yield profile
+    finally:
+        for cls, name, func in originals:
+            setattr(cls, name, func)
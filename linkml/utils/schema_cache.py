@@ -0,0 +1,80 @@
+"""
+Parse every schema file once, however many :class:`SchemaView` instances load it.
+
+Each :class:`SchemaView` parses the schema files of its import closure again, so tools which
+create a view per schema of a closure (such as :meth:`PydanticGenerator.generate_split`) or
+per run (such as the ``--watch`` option of the generators) parse the same files many times.
+Within :func:`cached_schema_loading`, a file is parsed again only once it has been modified.
+"""
+
+import copy
+from collections.abc import Iterator
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any, Callable, Optional
+
+from linkml_runtime import SCHEMA_DIRECTORY
+from linkml_runtime.linkml_model import SchemaDefinition
+from linkml_runtime.utils import schemaview
+
+_METAMODEL_DIRECTORY = Path(SCHEMA_DIRECTORY).resolve()
+
+
+class SchemaCache:
+    """Parsed schema files, reused for as long as the file is not modified
+
+    Generators may modify the schema they are given, so a copy is returned on every load.
+
+    :param load: Function which parses a schema file, with the signature of ``load_schema_wrap``
+    :param schemas: Schemas parsed by another cache (see :attr:`schemas`), e.g. in another process
+    """
+
+    def __init__(self, load: Callable[..., SchemaDefinition], schemas: Optional[dict[tuple, SchemaDefinition]] = None):
+        self._load = load
+        #: Parsed schemas, by file, modification time, size and the arguments they were loaded with
+        self.schemas: dict[tuple, SchemaDefinition] = dict(schemas or {})
+        #: Schema files loaded since the cache was created, except those distributed with LinkML
+        self.files: set[Path] = set()
+        self._recorders: list[set[Path]] = []
+
+    def load(self, path: str, **kwargs: Any) -> SchemaDefinition:
+        base_dir = kwargs.get("base_dir")
+        file = Path(base_dir or "", path) if isinstance(path, str) and "\n" not in path else None
+        if file is None or not file.is_file():
+            return self._load(path, **kwargs)
+        file = file.resolve()
+        if not file.is_relative_to(_METAMODEL_DIRECTORY):
+            self.files.add(file)
+            for recorded in self._recorders:
+                recorded.add(file)
+        stat = file.stat()
+        key = (str(file), stat.st_mtime_ns, stat.st_size, path, base_dir)
+        if key not in self.schemas:
+            self.schemas = {k: v for k, v in self.schemas.items() if k[0] != str(file)}
+            self.schemas[key] = self._load(path, **kwargs)
+        return copy.deepcopy(self.schemas[key])
+
+    @contextmanager
+    def recording(self) -> Iterator[set[Path]]:
+        """Record the schema files loaded within the context, as :attr:`files` does since the cache was created"""
+        recorded: set[Path] = set()
+        self._recorders.append(recorded)
+        try:
+            yield recorded
+        finally:
+            self._recorders.remove(recorded)
+
+
+@contextmanager
+def cached_schema_loading(schemas: Optional[dict[tuple, SchemaDefinition]] = None) -> Iterator[SchemaCache]:
+    """Reuse parsed schema files which have not changed in every ``SchemaView`` created within the context
+
+    :param schemas: Schemas already parsed by another cache, see :attr:`SchemaCache.schemas`
+    """
+    load = schemaview.load_schema_wrap
+    cache = SchemaCache(load, schemas)
+    schemaview.load_schema_wrap = cache.load
+    try:
+        yield cache
+    finally:
+        schemaview.load_schema_wrap = load
@@ -1,7 +1,8 @@
 import csv
-import inspect
 import logging
 import os
+from collections import defaultdict
+from collections.abc import Iterator
 from dataclasses import dataclass
 from pathlib import Path
 from types import ModuleType
@@ -18,10 +19,11 @@ from linkml_runtime.utils.formatutils import underscore
 from linkml_runtime.utils.introspection import package_schemaview
 from linkml_runtime.utils.yamlutils import YAMLRoot
 from pydantic import BaseModel
-from sqlalchemy import create_engine
+from sqlalchemy import Table, create_engine, func, select
+from sqlalchemy import inspect as sqla_inspect
 from sqlalchemy.engine import Engine
-from sqlalchemy.ext.associationproxy import _AssociationCollection
-from sqlalchemy.orm import sessionmaker
+from sqlalchemy.ext.associationproxy import AssociationProxy, _AssociationCollection
+from sqlalchemy.orm import MANYTOMANY, MANYTOONE, ONETOMANY, selectinload, sessionmaker
 from sqlalchemy.pool import StaticPool
 
 from linkml._version import __version__
@@ -39,9 +41,16 @@ from linkml.utils.datautils import (
     infer_index_slot,
     infer_root_class,
 )
+from linkml.utils.module_cache import compile_module_cached
 
 logger = logging.getLogger(__name__)
 
+#: Default number of rows inserted per statement by :meth:`SQLStore.dump_bulk`
+DEFAULT_BULK_BATCH_SIZE = 10000
+
+#: Default number of rows fetched at a time by :meth:`SQLStore.iter_load`
+DEFAULT_LOAD_BATCH_SIZE = 1000
+
 
 @dataclass
 class SQLStore:
@@ -76,6 +85,8 @@ class SQLStore:
             raise ValueError("Must have database path or use_memory must be True")
         if self.schema is not None and self.schemaview is None:
             self.schemaview = SchemaView(self.schema)
+        # names of the slots of each class, keyed by the name of its SQLAlchemy class
+        self._slot_names: Optional[dict[str, list[str]]] = None
 
     def db_exists(self, create=True, force=False) -> Optional[str]:
         """
@@ -134,7 +145,7 @@ class SQLStore:
         :return: compiled module
         """
         gen = PythonGenerator(yaml_dumper.dumps(self.schema))
-        self.native_module = gen.compile_module()
+        self.native_module = compile_module_cached(gen)
         return self.native_module
 
     def load(self, target_class: Union[str, type[YAMLRoot]] = None) -> YAMLRoot:
@@ -147,6 +158,22 @@ class SQLStore:
         return self.load_all(target_class=target_class)[0]
 
     def load_all(self, target_class: Union[str, type[YAMLRoot]] = None) -> list[YAMLRoot]:
+        return list(self.iter_load(target_class=target_class))
+
+    def iter_load(
+        self, target_class: Union[str, type[YAMLRoot]] = None, batch_size: int = DEFAULT_LOAD_BATCH_SIZE
+    ) -> Iterator[YAMLRoot]:
+        """
+        Lazily load LinkML objects from the wrapped SQLite database
+
+        Rows are fetched and translated to native objects ``batch_size`` at a time, so that
+        only one batch is held in memory. To stream a large database, iterate over the
+        objects of the class that holds most of the data rather than over a container class.
+
+        :param target_class: class of the objects to load. Defaults to the root class of the schema
+        :param batch_size: number of rows fetched at a time
+        :return: iterator over native objects
+        """
         if target_class is None:
             target_class_name = infer_root_class(self.schemaview)
             target_class = self.native_module.__dict__[target_class_name]
@@ -155,10 +182,11 @@ class SQLStore:
         session_class = sessionmaker(bind=self.engine)
         with session_class.begin() as session:
             typ = self.to_sqla_type(target_class)
-            q = session.query(typ)
-            all_objs = q.all()
-            tmp = self.from_sqla(all_objs)
-        return tmp
+            # Collections of each batch are fetched with one query per relationship
+            stmt = select(typ).options(selectinload("*")).execution_options(yield_per=batch_size)
+            for batch in session.scalars(stmt).partitions():
+                # The session only holds weak references, so each batch can be freed once converted
+                yield from [self.from_sqla(obj) for obj in batch]
 
     def dump(self, element: YAMLRoot, append=True) -> None:
         """
@@ -178,16 +206,53 @@ class SQLStore:
             session.add(nu_obj)
             session.commit()
 
+    def dump_bulk(self, element: YAMLRoot, append=True, batch_size: int = DEFAULT_BULK_BATCH_SIZE) -> None:
+        """
+        Store an element in the database using bulk inserts
+
+        Produces the same rows as :meth:`dump`, but rather than translating the objects to
+        SQLAlchemy ORM objects and adding them to a session, their rows are built per table and
+        inserted with one ``executemany`` per batch. Autoincrement keys and foreign keys are
+        assigned here, so this is much faster for large numbers of objects.
+
+        Each batch is committed separately, so if an insert fails the rows of earlier batches
+        remain in the database.
+
+        :param element:
+        :param append:
+        :param batch_size: maximum number of rows inserted and committed at a time
+        :return:
+        """
+        if batch_size < 1:
+            raise ValueError(f"batch_size must be a positive integer, got {batch_size}")
+        if self.engine is None:
+            raise ValueError("Must set self.engine")
+        if self.module is None:
+            self.compile()
+        roots = element if isinstance(element, list) else [element]
+        with self.engine.connect() as con:
+            rows = _BulkRows(con, self.module)
+            if not append:
+                for root_table in {sqla_inspect(self.to_sqla_type(type(root))).local_table for root in roots}:
+                    con.execute(root_table.delete())
+                con.commit()
+            for root in roots:
+                rows.add(root)
+            for table in rows.tables():
+                table_rows = rows.rows[table]
+                for start in range(0, len(table_rows), batch_size):
+                    con.execute(table.insert(), table_rows[start : start + batch_size])
+                    con.commit()
+                logger.info(f"Inserted {len(table_rows)} rows into {table.name}")
+
     def to_sqla_type(self, target_class: type[YAMLRoot]) -> Any:
-        for n, nu_typ in inspect.getmembers(self.module):
-            if n == target_class.__name__:
-                return nu_typ
+        if self.module is not None and target_class.__name__ in self.module.__dict__:
+            return self.module.__dict__[target_class.__name__]
         raise ValueError(f"Could not find: {target_class}")
 
     def from_sqla_type(self, typ) -> Any:
-        for n, nu_typ in inspect.getmembers(self.native_module):
-            if n == typ.__name__:
-                return nu_typ
+        if self.native_module is not None and typ.__name__ in self.native_module.__dict__:
+            return self.native_module.__dict__[typ.__name__]
         raise ValueError(f"Could not find: {typ}")
 
     def to_sqla(self, obj: Union[YAMLRoot, list]) -> Any:
@@ -226,11 +291,8 @@ class SQLStore:
                 v2 = self.to_sqla(v)
                 if v2 is not None:
                     inst_args[k] = v2
-            for n, nu_typ in inspect.getmembers(self.module):
-                # TODO: make more efficient
-                if n == typ.__name__:
-                    nu_obj = nu_typ(**inst_args)
-                    return nu_obj
+            if typ.__name__ in self.module.__dict__:
+                return self.module.__dict__[typ.__name__](**inst_args)
             raise ValueError(f"Cannot find {typ.__name__} in {self.module}")
         else:
             return obj
@@ -243,35 +305,142 @@ class SQLStore:
         :return: native dataclass object
         """
         typ = type(obj)
-        nm = self.schemaview.class_name_mappings()
-        if typ.__name__ in nm:
-            cls = nm[typ.__name__]
-        else:
-            cls = None
+        if self._slot_names is None:
+            self._slot_names = {
+                name: [underscore(sn) for sn in self.schemaview.class_slots(cls.name)]
+                for name, cls in self.schemaview.class_name_mappings().items()
+            }
+        slot_names = self._slot_names.get(typ.__name__)
         if isinstance(obj, list) or isinstance(obj, _AssociationCollection):
             nu_obj = [self.from_sqla(x) for x in obj]
             if nu_obj:
                 return nu_obj
             else:
                 return None
-        elif cls:
+        elif slot_names is not None:
             inst_args = {}
-            for sn in self.schemaview.class_slots(cls.name):
-                sn = underscore(sn)
+            for sn in slot_names:
                 v = getattr(obj, sn, None)
                 v2 = self.from_sqla(v)
                 if v2 is not None and v2 != [] and v2 != {}:
                     inst_args[sn] = v2
-            for n, nu_typ in inspect.getmembers(self.native_module):
-                # TODO: make more efficient
-                if n == typ.__name__:
-                    nu_obj = nu_typ(**inst_args)
-                    return nu_obj
+            if typ.__name__ in self.native_module.__dict__:
+                return self.native_module.__dict__[typ.__name__](**inst_args)
             raise ValueError(f"Cannot find {typ.__name__} in {self.native_module}")
         else:
             return obj
 
 
+class _BulkRows:
+    """
+    Rows for a tree of native LinkML objects, grouped by table of the SQLAlchemy ORM model
+
+    Rows are built directly from the native objects, without creating ORM objects. Keys are
+    copied between rows following the foreign keys of each relationship, as the ORM would do
+    on flush, and autoincrement keys are numbered after the highest key already present.
+
+    :param con: connection used to look up the highest existing autoincrement keys
+    :param module: compiled SQLAlchemy declarative module
+    """
+
+    def __init__(self, con, module: ModuleType) -> None:
+        self.con = con
+        self.module = module
+        self.rows: dict[Table, list[dict[str, Any]]] = defaultdict(list)
+        self._rows_by_object: dict[int, dict[str, Any]] = {}
+        self._next_keys: dict[Table, int] = {}
+        self._mappers: dict[type, tuple] = {}
+
+    def tables(self) -> list[Table]:
+        """Tables with rows, ordered so that referenced tables come first"""
+        if not self.rows:
+            return []
+        metadata = next(iter(self.rows)).metadata
+        return [t for t in metadata.sorted_tables if t in self.rows]
+
+    def add(self, obj: Union[YAMLRoot, BaseModel]) -> dict[str, Any]:
+        """
+        Add the row of a native object and, recursively, of the objects it relates to
+
+        :param obj: native LinkML object
+        :return: row of the object
+        """
+        if id(obj) in self._rows_by_object:
+            return self._rows_by_object[id(obj)]
+        typ = type(obj)
+        if typ.__name__ not in self.module.__dict__:
+            raise ValueError(f"Cannot find {typ.__name__} in {self.module}")
+        mapper = sqla_inspect(self.module.__dict__[typ.__name__])
+        columns, relationships, proxies = self._attributes(mapper)
+        row = self._new_row(mapper.local_table)
+        self._rows_by_object[id(obj)] = row
+        # (relationship, value column of an association proxy or None, value)
+        related = []
+        for k, v in vars(obj).items():
+            if v is None or v == [] or v == {}:
+                continue
+            if k in columns:
+                row[columns[k]] = str(v) if isinstance(v, EnumDefinitionImpl) else v
+            elif k in relationships:
+                related.append((relationships[k], None, v))
+            elif k in proxies:
+                related.append((*proxies[k], v))
+            else:
+                raise ValueError(f"{typ.__name__} has no attribute {k} in {self.module}")
+        for rel, value_column, v in related:
+            values = list(v.values()) if isinstance(v, dict) else v if isinstance(v, list) else [v]
+            for value in values:
+                if value_column is None:
+                    other_row = self.add(value)
+                else:
+                    other_row = self._new_row(rel.mapper.local_table)
+                    other_row[value_column] = str(value) if isinstance(value, EnumDefinitionImpl) else value
+                self._link(rel, row, other_row)
+        return row
+
+    def _attributes(self, mapper) -> tuple[dict[str, str], dict[str, Any], dict[str, tuple[Any, str]]]:
+        """Column keys, relationships and association proxies of a mapper, by attribute name"""
+        if mapper not in self._mappers:
+            columns = {attr.key: attr.columns[0].key for attr in mapper.column_attrs}
+            relationships = {rel.key: rel for rel in mapper.relationships}
+            proxies = {}
+            for key, descriptor in mapper.all_orm_descriptors.items():
+                if isinstance(descriptor, AssociationProxy):
+                    rel = relationships[descriptor.target_collection]
+                    value_column = sqla_inspect(rel.mapper).attrs[descriptor.value_attr].columns[0].key
+                    proxies[key] = (rel, value_column)
+            self._mappers[mapper] = columns, relationships, proxies
+        return self._mappers[mapper]
+
+    def _new_row(self, table: Table) -> dict[str, Any]:
+        row = {c.key: None for c in table.columns}
+        if table.autoincrement_column is not None:
+            row[table.autoincrement_column.key] = self._next_key(table)
+        self.rows[table].append(row)
+        return row
+
+    def _link(self, rel, row: dict[str, Any], other_row: dict[str, Any]) -> None:
+        """Copy keys between the rows of two objects joined by a relationship"""
+        if rel.direction == MANYTOONE:
+            for local, remote in rel.local_remote_pairs:
+                row[local.key] = other_row[remote.key]
+        elif rel.direction == ONETOMANY:
+            for local, remote in rel.local_remote_pairs:
+                other_row[remote.key] = row[local.key]
+        elif rel.direction == MANYTOMANY:
+            link = {col.key: row[parent_col.key] for parent_col, col in rel.synchronize_pairs}
+            link.update({col.key: other_row[child_col.key] for child_col, col in rel.secondary_synchronize_pairs})
+            self.rows[rel.secondary].append(link)
+
+    def _next_key(self, table: Table) -> int:
+        if table not in self._next_keys:
+            current = self.con.execute(select(func.max(table.autoincrement_column))).scalar()
+            self._next_keys[table] = (current or 0) + 1
+        key = self._next_keys[table]
+        self._next_keys[table] += 1
+        return key
+
+
 @click.group(name="sqldb")
 @click.option("-v", "--verbose", count=True)
 @click.option("-q", "--quiet")
@@ -331,6 +500,11 @@ def main(verbose: int, quiet: bool, csv_field_size_limit: int):
     show_default=True,
     help="Treat input as a quoted glob expression, e.g. 'data/*.json'",
 )
+@click.option(
+    "--batch-size",
+    type=click.IntRange(min=1),
+    help="Insert rows in bulk, this many at a time, committing after each batch. Faster for large inputs",
+)
 @click.argument("inputs", nargs=-1)
 def dump(
     inputs,
@@ -343,6 +517,7 @@ def dump(
     force: bool = None,
     glob: bool = None,
     index_slot=None,
+    batch_size: Optional[int] = None,
 ) -> None:
     """
     Dumps data to a SQL store
@@ -401,7 +576,10 @@ def dump(
                 raise Exception("--schema must be passed in order to validate. Suppress with --no-validate")
             # TODO: use validator framework
             validation.validate_object(obj, schema)
-        endpoint.dump(obj)
+        if batch_size:
+            endpoint.dump_bulk(obj, batch_size=batch_size)
+        else:
+            endpoint.dump(obj)
 
 
 @main.command()
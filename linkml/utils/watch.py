@@ -0,0 +1,91 @@
+"""
+Rerun a generator whenever a schema or one of its imports changes.
+
+:func:`watch_schema` runs a function once, then again every time one of the local files in
+the import closure of a schema is modified, until interrupted. It is used by the ``--watch``
+option of the generator command line tools. Because the process stays alive, the LinkML
+modules, the metamodel and the parsed imports which did not change are reused on every run,
+so regenerating after a save is much faster than starting a new command.
+"""
+
+import logging
+import os
+import threading
+from pathlib import Path
+from typing import Any, Callable, Optional, Union
+
+from linkml_runtime import SchemaView
+
+from linkml.utils.schema_cache import cached_schema_loading
+
+logger = logging.getLogger(__name__)
+
+#: Seconds to wait after a change before rerunning, so that several saves trigger one run
+DEFAULT_DEBOUNCE = 0.2
+
+
+def watch_schema(
+    schema_path: Union[str, os.PathLike],
+    run: Callable[[], Any],
+    *,
+    debounce: float = DEFAULT_DEBOUNCE,
+    stop_event: Optional[threading.Event] = None,
+) -> None:
+    """Call a function now and every time the schema or a local file it imports changes
+
+    Errors raised by the function are logged rather than raised, so that the schema can be
+    fixed and saved again.
+
+    :param schema_path: Path to the schema
+    :param run: Function which generates the outputs from the schema
+    :param debounce: Seconds to wait for further changes before calling the function again
+    :param stop_event: If given, watching stops when this event is set. Otherwise, it stops
+        on keyboard interrupt.
+    """
+    from watchdog.events import FileSystemEventHandler
+    from watchdog.observers import Observer
+
+    stop_event = stop_event or threading.Event()
+    changed = threading.Event()
+    watched_files: set[Path] = set()
+
+    class Handler(FileSystemEventHandler):
+        def on_any_event(self, event) -> None:
+            paths = [event.src_path, getattr(event, "dest_path", "")]
+            if any(p and Path(os.fsdecode(p)).resolve() in watched_files for p in paths):
+                changed.set()
+
+    observer = Observer()
+    watched_dirs = set()
+    with cached_schema_loading() as cache:
+        observer.start()
+        try:
+            while not stop_event.is_set():
+                try:
+                    run()
+                except (Exception, SystemExit) as e:
+                    logger.error(f"Generation failed: {e}")
+                try:
+                    # generators which do not use SchemaView do not record the files they read
+                    SchemaView(str(schema_path)).imports_closure()
+                except Exception as e:
+                    logger.error(f"Cannot resolve imports of {schema_path}: {e}")
+                watched_files.clear()
+                watched_files.update(cache.files | {Path(schema_path).resolve()})
+                for directory in {f.parent for f in watched_files} - watched_dirs:
+                    observer.schedule(Handler(), str(directory), recursive=False)
+                    watched_dirs.add(directory)
+                logger.info(f"Watching {len(watched_files)} schema files for changes")
+                while not changed.wait(0.1):
+                    if stop_event.is_set():
+                        return
+                # wait until the files stop changing, e.g. for editors which save in several steps
+                while changed.is_set() and not stop_event.is_set():
+                    changed.clear()
+                    stop_event.wait(debounce)
+                logger.info("Schema changed, regenerating")
+        except KeyboardInterrupt:
+            pass
+        finally:
+            observer.stop()
+            observer.join()
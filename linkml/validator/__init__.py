@@ -21,6 +21,7 @@ def _get_default_validator(
     schema: Union[str, dict, Path, SchemaDefinition],
     *,
     strict: bool = False,
+    cache_dir: Optional[os.PathLike] = None,
 ) -> Validator:
     try:
         if isinstance(schema, Path):
@@ -37,7 +38,7 @@ def _get_default_validator(
 
     validation_plugins = [JsonschemaValidationPlugin(closed=True)]
 
-    return Validator(schema, validation_plugins=validation_plugins, strict=strict)
+    return Validator(schema, validation_plugins=validation_plugins, strict=strict, cache_dir=cache_dir)
 
 
 def validate(
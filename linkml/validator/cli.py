@@ -88,6 +88,20 @@ DEPRECATED = "[DEPRECATED: only used in legacy mode]"
     default=False,
     help="Exit after the first validation failure is found. If not specified all validation failures are reported.",
 )
+@click.option(
+    "--jobs",
+    "-j",
+    type=click.IntRange(min=1),
+    default=1,
+    show_default=True,
+    help="Number of worker processes used to validate instances in parallel.",
+)
+@click.option(
+    "--cache-dir",
+    type=click.Path(file_okay=False, dir_okay=True, resolve_path=True, path_type=Path),
+    help="Directory in which artifacts generated from the schema (JSON Schema, Pydantic models, "
+    "SHACL shapes) are cached and reused across invocations.",
+)
 @click.option(
     "--legacy-mode",
     is_flag=True,
@@ -126,6 +140,8 @@ def cli(
     config: Optional[str],
     data_sources: tuple[str],
     exit_on_first_failure: bool,
+    jobs: int,
+    cache_dir: Optional[Path],
     legacy_mode: bool,
     module: Optional[str],
     input_format: Optional[str],
@@ -189,7 +205,13 @@ def cli(
 
     plugins = _resolve_plugins(config.plugins) if config.plugins else []
     loaders = _resolve_loaders(config.data_sources)
-    validator = Validator(config.schema_path, validation_plugins=plugins, strict=exit_on_first_failure)
+    validator = Validator(
+        config.schema_path,
+        validation_plugins=plugins,
+        strict=exit_on_first_failure,
+        workers=jobs,
+        cache_dir=cache_dir,
+    )
     severity_counter = Counter()
     for loader in loaders:
         for result in validator.iter_results_from_source(loader, config.target_class):
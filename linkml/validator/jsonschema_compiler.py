@@ -0,0 +1,355 @@
+"""
+Compile a JSON Schema into specialised Python validation functions.
+
+The ``jsonschema`` library validates an instance by walking the schema and dispatching on
+each keyword it finds. :func:`compile_json_schema` does that walk once, ahead of time, and
+emits Python source with one function per subschema. Each ``$defs`` entry (i.e. each class
+of a schema produced by :class:`linkml.generators.JsonSchemaGenerator`) gets a function named
+``validate_<name>`` and the root schema gets a function named ``validate``.
+
+The generated functions only answer whether an instance is valid. Detailed errors for the
+(usually few) invalid instances are still produced by a ``jsonschema`` validator, so they are
+identical to those of the interpretive validator. Subschemas which use keywords that the
+compiler does not handle are delegated to that validator as well.
+"""
+
+import json
+import numbers
+import re
+from collections.abc import Iterator
+from typing import Any, Union
+
+from jsonschema import FormatChecker
+from jsonschema.exceptions import ValidationError
+from jsonschema.protocols import Validator
+
+#: Keywords which do not affect validation
+_ANNOTATION_KEYWORDS = frozenset(
+    {
+        "$schema",
+        "$id",
+        "$defs",
+        "$comment",
+        "definitions",
+        "title",
+        "description",
+        "default",
+        "examples",
+        "deprecated",
+        "readOnly",
+        "writeOnly",
+        "metamodel_version",
+        "version",
+    }
+)
+
+_SUPPORTED_KEYWORDS = _ANNOTATION_KEYWORDS | {
+    "$ref",
+    "type",
+    "enum",
+    "const",
+    "format",
+    "properties",
+    "required",
+    "additionalProperties",
+    "minProperties",
+    "maxProperties",
+    "pattern",
+    "minLength",
+    "maxLength",
+    "minimum",
+    "maximum",
+    "exclusiveMinimum",
+    "exclusiveMaximum",
+    "items",
+    "minItems",
+    "maxItems",
+    "contains",
+    "anyOf",
+    "allOf",
+    "oneOf",
+    "not",
+    "if",
+    "then",
+    "else",
+}
+
+_TYPE_CHECKS = {
+    "string": "isinstance(data, str)",
+    "integer": "_is_integer(data)",
+    "number": "_is_number(data)",
+    "boolean": "isinstance(data, bool)",
+    "null": "data is None",
+    "object": "isinstance(data, dict)",
+    "array": "isinstance(data, list)",
+}
+
+_DEF_REF_PREFIX = "#/$defs/"
+
+
+def _is_number(data: Any) -> bool:
+    return isinstance(data, numbers.Number) and not isinstance(data, bool)
+
+
+def _is_integer(data: Any) -> bool:
+    if isinstance(data, float):
+        return data.is_integer()
+    return isinstance(data, int) and not isinstance(data, bool)
+
+
+def _json_equal(one: Any, two: Any) -> bool:
+    """Compare two JSON values the way JSON Schema ``enum`` and ``const`` do"""
+    if isinstance(one, str) or isinstance(two, str):
+        return one == two
+    if isinstance(one, bool) or isinstance(two, bool):
+        return isinstance(one, bool) and isinstance(two, bool) and one == two
+    if isinstance(one, dict) and isinstance(two, dict):
+        return one.keys() == two.keys() and all(_json_equal(one[key], two[key]) for key in one)
+    if isinstance(one, list) and isinstance(two, list):
+        return len(one) == len(two) and all(_json_equal(a, b) for a, b in zip(one, two))
+    return one == two
+
+
+class _Compiler:
+    def __init__(self, root: Union[dict, bool]) -> None:
+        self.root = root
+        self.functions: list[str] = []
+        self.constants: list[str] = []
+        self.fallbacks: list[Union[dict, bool]] = []
+        self.names: dict[str, str] = {}
+
+    def compile(self) -> str:
+        defs = self.root.get("$defs", {}) if isinstance(self.root, dict) else {}
+        used_names = {"validate"}
+        for def_name in defs:
+            name = "validate_" + re.sub(r"\W", "_", def_name)
+            while name in used_names:
+                name += "_"
+            used_names.add(name)
+            self.names[_DEF_REF_PREFIX + def_name] = name
+        for def_name, subschema in defs.items():
+            self._define(self.names[_DEF_REF_PREFIX + def_name], subschema)
+        self._define("validate", self.root)
+
+        header = [
+            "# Generated by linkml.validator.jsonschema_compiler. Do not edit.",
+            f"_fallback_schemas = json.loads({json.dumps(self.fallbacks)!r})",
+            *self.constants,
+        ]
+        return "\n".join(header) + "\n\n\n" + "\n\n\n".join(self.functions) + "\n"
+
+    def _constant(self, expression: str) -> str:
+        name = f"_c{len(self.constants)}"
+        self.constants.append(f"{name} = {expression}")
+        return name
+
+    def _json_constant(self, value: Any, wrapper: str = "") -> str:
+        literal = f"json.loads({json.dumps(value)!r})"
+        return self._constant(f"{wrapper}({literal})" if wrapper else literal)
+
+    def _function(self, schema: Union[dict, bool]) -> str:
+        """Name of a function which validates against ``schema``, compiling it if needed"""
+        if isinstance(schema, dict) and set(schema) - {"title", "description"} == {"$ref"}:
+            ref_name = self.names.get(schema["$ref"])
+            if ref_name:
+                return ref_name
+        key = json.dumps(schema, sort_keys=True)
+        if key not in self.names:
+            self.names[key] = f"_schema_{len(self.names)}"
+            self._define(self.names[key], schema)
+        return self.names[key]
+
+    def _define(self, name: str, schema: Union[dict, bool]) -> None:
+        body = self._body(schema)
+        self.functions.append(f"def {name}(data):\n" + "\n".join("    " + line for line in body))
+
+    def _fallback(self, schema: Union[dict, bool]) -> list[str]:
+        self.fallbacks.append(schema)
+        return [f"return _fallbacks[{len(self.fallbacks) - 1}].is_valid(data)"]
+
+    def _body(self, schema: Union[dict, bool]) -> list[str]:
+        if schema is True or schema == {}:
+            return ["return True"]
+        if schema is False:
+            return ["return False"]
+        if not isinstance(schema, dict) or set(schema) - _SUPPORTED_KEYWORDS:
+            return self._fallback(schema)
+        if "$ref" in schema and schema["$ref"] not in self.names:
+            return self._fallback(schema)
+        if isinstance(schema.get("items", {}), list):
+            return self._fallback(schema)
+
+        lines = []
+
+        def check(condition: str, indent: str = "") -> None:
+            lines.append(f"{indent}if {condition}:")
+            lines.append(f"{indent}    return False")
+
+        if "$ref" in schema:
+            check(f"not {self.names[schema['$ref']]}(data)")
+
+        if "type" in schema:
+            types = schema["type"] if isinstance(schema["type"], list) else [schema["type"]]
+            if any(t not in _TYPE_CHECKS for t in types):
+                return self._fallback(schema)
+            check(f"not ({' or '.join(_TYPE_CHECKS[t] for t in types)})")
+
+        if "enum" in schema:
+            values = schema["enum"]
+            if all(isinstance(v, str) for v in values):
+                check(f"not (isinstance(data, str) and data in {self._json_constant(values, 'frozenset')})")
+            else:
+                check(f"not any(_json_equal(data, value) for value in {self._json_constant(values)})")
+
+        if "const" in schema:
+            check(f"not _json_equal(data, {self._json_constant(schema['const'])})")
+
+        if "format" in schema:
+            check(f"not _format_checker.conforms(data, {schema['format']!r})")
+
+        object_lines = self._object_checks(schema)
+        if object_lines:
+            lines.append("if isinstance(data, dict):")
+            lines.extend("    " + line for line in object_lines)
+
+        string_lines = []
+        if "pattern" in schema:
+            pattern = self._constant(f"re.compile({schema['pattern']!r})")
+            string_lines += [f"if {pattern}.search(data) is None:", "    return False"]
+        if "minLength" in schema:
+            string_lines += [f"if len(data) < {schema['minLength']!r}:", "    return False"]
+        if "maxLength" in schema:
+            string_lines += [f"if len(data) > {schema['maxLength']!r}:", "    return False"]
+        if string_lines:
+            lines.append("if isinstance(data, str):")
+            lines.extend("    " + line for line in string_lines)
+
+        number_lines = []
+        for keyword, operator in (
+            ("minimum", "<"),
+            ("maximum", ">"),
+            ("exclusiveMinimum", "<="),
+            ("exclusiveMaximum", ">="),
+        ):
+            if keyword in schema:
+                number_lines += [f"if data {operator} {schema[keyword]!r}:", "    return False"]
+        if number_lines:
+            lines.append("if _is_number(data):")
+            lines.extend("    " + line for line in number_lines)
+
+        array_lines = []
+        if "items" in schema:
+            array_lines += [
+                "for item in data:",
+                f"    if not {self._function(schema['items'])}(item):",
+                "        return False",
+            ]
+        if "minItems" in schema:
+            array_lines += [f"if len(data) < {schema['minItems']!r}:", "    return False"]
+        if "maxItems" in schema:
+            array_lines += [f"if len(data) > {schema['maxItems']!r}:", "    return False"]
+        if "contains" in schema:
+            array_lines += [
+                f"if not any({self._function(schema['contains'])}(item) for item in data):",
+                "    return False",
+            ]
+        if array_lines:
+            lines.append("if isinstance(data, list):")
+            lines.extend("    " + line for line in array_lines)
+
+        if "anyOf" in schema:
+            check(f"not ({' or '.join(f'{self._function(s)}(data)' for s in schema['anyOf'])})")
+        if "allOf" in schema:
+            check(f"not ({' and '.join(f'{self._function(s)}(data)' for s in schema['allOf'])})")
+        if "oneOf" in schema:
+            check(f"({' + '.join(f'{self._function(s)}(data)' for s in schema['oneOf'])}) != 1")
+        if "not" in schema:
+            check(f"{self._function(schema['not'])}(data)")
+        if "if" in schema and ("then" in schema or "else" in schema):
+            lines.append(f"if {self._function(schema['if'])}(data):")
+            if "then" in schema:
+                check(f"not {self._function(schema['then'])}(data)", indent="    ")
+            else:
+                lines.append("    pass")
+            if "else" in schema:
+                lines.append("else:")
+                check(f"not {self._function(schema['else'])}(data)", indent="    ")
+
+        lines.append("return True")
+        return lines
+
+    def _object_checks(self, schema: dict) -> list[str]:
+        lines = []
+        for key in schema.get("required", []):
+            lines += [f"if {key!r} not in data:", "    return False"]
+        properties = schema.get("properties", {})
+        for key, subschema in properties.items():
+            lines += [f"if {key!r} in data and not {self._function(subschema)}(data[{key!r}]):", "    return False"]
+        additional = schema.get("additionalProperties", True)
+        if additional is not True:
+            known = self._json_constant(list(properties), "frozenset")
+            if additional is False:
+                lines += ["for key in data:", f"    if key not in {known}:", "        return False"]
+            else:
+                lines += [
+                    "for key, value in data.items():",
+                    f"    if key not in {known} and not {self._function(additional)}(value):",
+                    "        return False",
+                ]
+        if "minProperties" in schema:
+            lines += [f"if len(data) < {schema['minProperties']!r}:", "    return False"]
+        if "maxProperties" in schema:
+            lines += [f"if len(data) > {schema['maxProperties']!r}:", "    return False"]
+        return lines
+
+
+def compile_json_schema(json_schema: Union[dict, bool]) -> str:
+    """Generate Python source code which validates instances against a JSON Schema
+
+    The source defines a ``validate`` function for the root schema and a ``validate_<name>``
+    function for each entry of ``$defs``. Each function takes an instance and returns whether
+    it is valid. Use :class:`CompiledJsonSchemaValidator` to load the source.
+
+    :param json_schema: The JSON Schema to compile
+    :return: Python source code
+    """
+    return _Compiler(json_schema).compile()
+
+
+class CompiledJsonSchemaValidator:
+    """A JSON Schema validator backed by functions generated by :func:`compile_json_schema`
+
+    ``is_valid`` only runs the generated functions. ``iter_errors`` returns nothing for valid
+    instances, and otherwise delegates to the wrapped ``jsonschema`` validator, so it reports
+    exactly the same errors as that validator would.
+
+    :param source: Source code generated by :func:`compile_json_schema` from the schema of
+        ``validator``
+    :param validator: A ``jsonschema`` validator for the same schema. It provides format
+        checking, detailed errors and validation of subschemas which were not compiled.
+    """
+
+    def __init__(self, source: str, validator: Validator) -> None:
+        self.validator = validator
+        self.schema = validator.schema
+        namespace = {
+            "json": json,
+            "re": re,
+            "_is_integer": _is_integer,
+            "_is_number": _is_number,
+            "_json_equal": _json_equal,
+            "_format_checker": validator.format_checker or FormatChecker(formats=()),
+        }
+        exec(compile(source, "<compiled json schema>", "exec"), namespace)
+        namespace["_fallbacks"] = [validator.evolve(schema=s) for s in namespace["_fallback_schemas"]]
+        self._validate = namespace["validate"]
+
+    def is_valid(self, instance: Any) -> bool:
+        """Whether the instance is valid against the schema"""
+        return self._validate(instance)
+
+    def iter_errors(self, instance: Any) -> Iterator[ValidationError]:
+        """Lazily yield errors for the instance, see :meth:`jsonschema.protocols.Validator.iter_errors`"""
+        if self._validate(instance):
+            return iter(())
+        return self.validator.iter_errors(instance)
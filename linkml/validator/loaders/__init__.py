@@ -8,20 +8,26 @@ instance from a source. Instances of these classes are passed to
 import os
 from typing import Union
 
+from linkml.validator.loaders.compression import split_compression_ext
 from linkml.validator.loaders.delimited_file_loader import CsvLoader, TsvLoader
-from linkml.validator.loaders.json_loader import JsonLoader
+from linkml.validator.loaders.json_loader import JsonLinesLoader, JsonLoader
 from linkml.validator.loaders.loader import Loader
 from linkml.validator.loaders.yaml_loader import YamlLoader
 
 
 def default_loader_for_file(file: Union[str, bytes, os.PathLike]) -> Loader:
-    _, ext = os.path.splitext(file)
-    if ext == ".csv":
+    ext, compression_ext = split_compression_ext(file)
+    if ext == ".json":
+        return JsonLoader(str(file))
+    elif ext in (".jsonl", ".ndjson"):
+        return JsonLinesLoader(file)
+    elif compression_ext:
+        # Only the JSON loaders read compressed files
+        pass
+    elif ext == ".csv":
         return CsvLoader(file, skip_empty_rows=True)
     elif ext == ".tsv":
         return TsvLoader(file, skip_empty_rows=True)
-    elif ext == ".json":
-        return JsonLoader(str(file))
     elif ext in (".yaml", ".yml"):
         return YamlLoader(file)
 
@@ -30,6 +36,7 @@ def default_loader_for_file(file: Union[str, bytes, os.PathLike]) -> Loader:
 
 __all__ = [
     "CsvLoader",
+    "JsonLinesLoader",
     "JsonLoader",
     "Loader",
     "TsvLoader",
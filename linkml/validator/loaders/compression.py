@@ -0,0 +1,55 @@
+"""
+Helpers for transparently reading compressed instance data files.
+"""
+
+import gzip
+import os
+from typing import TextIO, Union
+
+#: File extensions recognized as compressed, mapped to the name of the compression format
+COMPRESSION_EXTENSIONS = {
+    ".gz": "gzip",
+    ".zst": "zstd",
+    ".zstd": "zstd",
+}
+
+
+def split_compression_ext(file: Union[str, bytes, os.PathLike]) -> tuple[str, str]:
+    """Split a file name into its extension and its compression extension
+
+    For example ``data.jsonl.gz`` is split into ``(".jsonl", ".gz")`` and ``data.json``
+    into ``(".json", "")``.
+
+    :param file: Path-like object of the file
+    :return: Tuple of the file extension and the compression extension (or an empty string)
+    """
+    root, ext = os.path.splitext(os.fsdecode(file))
+    if ext.lower() in COMPRESSION_EXTENSIONS:
+        _, inner_ext = os.path.splitext(root)
+        return inner_ext, ext
+    return ext, ""
+
+
+def open_text(file: Union[str, bytes, os.PathLike]) -> TextIO:
+    """Open a file for reading as text, decompressing it based on its extension
+
+    Gzip compression is supported out of the box. Zstandard compression requires the
+    ``zstandard`` package to be installed.
+
+    :param file: Path-like object of the file to open
+    :return: A text stream over the (decompressed) contents of the file
+    """
+    _, compression_ext = split_compression_ext(file)
+    compression = COMPRESSION_EXTENSIONS.get(compression_ext.lower())
+    if compression == "gzip":
+        return gzip.open(file, "rt", encoding="utf-8")
+    if compression == "zstd":
+        try:
+            import zstandard
+        except ImportError:
+            raise ImportError(
+                f"Reading zstd-compressed file {os.fsdecode(file)} requires the zstandard package: "
+                "pip install zstandard"
+            ) from None
+        return zstandard.open(file, "rt", encoding="utf-8")
+    return open(file, encoding="utf-8")
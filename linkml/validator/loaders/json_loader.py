@@ -1,14 +1,114 @@
+import json
+import os
 from collections.abc import Iterator
-from typing import Any
+from typing import Any, TextIO
 
 from linkml_runtime.loaders import json_loader
 
+from linkml.validator.loaders.compression import open_text
 from linkml.validator.loaders.loader import Loader
 
+#: Number of characters read from the source at a time when streaming
+_CHUNK_SIZE = 1 << 16
+
+#: Number of characters at the end of the buffer in which a value or a decoding error may be
+#: caused by a token (number, literal or escape sequence) continuing in the next chunk
+_LOOKAHEAD = 32
+
+_decoder = json.JSONDecoder()
+
+
+def _iter_json_stream(stream: TextIO, chunk_size: int = _CHUNK_SIZE) -> Iterator[Any]:
+    """Incrementally decode a JSON document from a text stream
+
+    If the root of the document is an array, its elements are decoded and yielded one at a
+    time, so only the element currently being decoded is held in memory. Otherwise the root
+    value is decoded and yielded as a whole.
+
+    :param stream: Text stream positioned at the start of a JSON document
+    :param chunk_size: Number of characters to read from the stream at a time
+    :return: Iterator over decoded values
+    """
+    buffer = ""
+    pos = 0
+    eof = False
+
+    def fill(size: int) -> bool:
+        nonlocal buffer, pos, eof
+        if eof:
+            return False
+        chunk = stream.read(size)
+        if not chunk:
+            eof = True
+            return False
+        buffer = buffer[pos:] + chunk
+        pos = 0
+        return True
+
+    def skip_whitespace() -> str:
+        nonlocal pos
+        while True:
+            while pos < len(buffer) and buffer[pos] in " \t\n\r":
+                pos += 1
+            if pos < len(buffer):
+                return buffer[pos]
+            if not fill(chunk_size):
+                return ""
+
+    def decode_value() -> Any:
+        nonlocal pos
+        size = chunk_size
+        while True:
+            try:
+                value, end = _decoder.raw_decode(buffer, pos)
+                # A number at the end of the buffer may continue in the next chunk
+                if end < len(buffer) - _LOOKAHEAD or eof:
+                    pos = end
+                    return value
+            except json.JSONDecodeError as e:
+                # Only an unterminated string or an error at the end of the buffer may be fixed by
+                # reading more, so a malformed document is not read to the end
+                truncated = e.msg.startswith("Unterminated string") or e.pos >= len(buffer) - _LOOKAHEAD
+                if eof or not truncated:
+                    raise
+            # Grow reads geometrically so large values are not re-decoded too many times
+            fill(size)
+            size *= 2
+
+    first = skip_whitespace()
+    if first == "":
+        raise json.JSONDecodeError("Expecting value", buffer, pos)
+    if first != "[":
+        yield decode_value()
+        if skip_whitespace() != "":
+            raise json.JSONDecodeError("Extra data", buffer, pos)
+        return
+
+    pos += 1
+    if skip_whitespace() == "]":
+        pos += 1
+    else:
+        while True:
+            yield decode_value()
+            delimiter = skip_whitespace()
+            pos += 1
+            if delimiter == "]":
+                break
+            if delimiter != ",":
+                raise json.JSONDecodeError("Expecting ',' delimiter", buffer, pos - 1)
+            skip_whitespace()
+    if skip_whitespace() != "":
+        raise json.JSONDecodeError("Extra data", buffer, pos)
+
 
 class JsonLoader(Loader):
     """A loader for instances serialized as JSON
 
+    Local files are decoded incrementally, so a root-level array of any size can be
+    validated with bounded memory. Files ending in ``.gz`` or ``.zst`` are decompressed
+    transparently. As for other sources, JSON-LD keywords (keys starting with ``@``) and
+    empty values are removed from each instance.
+
     :param source: Path or URL to JSON source
     """
 
@@ -24,8 +124,39 @@ class JsonLoader(Loader):
         :return: Iterator over data instances
         :rtype: Iterator[Any]
         """
+        if isinstance(self.source, (str, bytes, os.PathLike)) and os.path.isfile(self.source):
+            with open_text(self.source) as source_file:
+                for instance in _iter_json_stream(source_file):
+                    yield json_loader.json_clean(instance)
+            return
+
         data = json_loader.load_as_dict(self.source)
         if isinstance(data, list):
             yield from data
         else:
             yield data
+
+
+class JsonLinesLoader(Loader):
+    """A loader for instances serialized as JSON Lines (also known as NDJSON)
+
+    Each non-blank line of the source is decoded as one instance, from which JSON-LD
+    keywords and empty values are removed as by :class:`JsonLoader`. Files ending in
+    ``.gz`` or ``.zst`` are decompressed transparently.
+
+    :param source: Path to JSON Lines source
+    """
+
+    def __init__(self, source) -> None:
+        super().__init__(source)
+
+    def iter_instances(self) -> Iterator[Any]:
+        """Lazily yield instances from JSON Lines source.
+
+        :return: Iterator over data instances
+        :rtype: Iterator[Any]
+        """
+        with open_text(self.source) as source_file:
+            for line in source_file:
+                if line.strip():
+                    yield json_loader.json_clean(json.loads(line))
@@ -4,9 +4,18 @@ on data instances. Instances of these classes should be provided when constructi
 :class:`linkml.validator.Validator` instance.
 """
 
+from linkml.validator.plugins.compiled_jsonschema_validation_plugin import CompiledJsonschemaValidationPlugin
 from linkml.validator.plugins.jsonschema_validation_plugin import JsonschemaValidationPlugin
+from linkml.validator.plugins.pandera_validation_plugin import PanderaValidationPlugin
 from linkml.validator.plugins.pydantic_validation_plugin import PydanticValidationPlugin
 from linkml.validator.plugins.recommended_slots_plugin import RecommendedSlotsPlugin
 from linkml.validator.plugins.validation_plugin import ValidationPlugin
 
-__all__ = ["JsonschemaValidationPlugin", "PydanticValidationPlugin", "RecommendedSlotsPlugin", "ValidationPlugin"]
+__all__ = [
+    "CompiledJsonschemaValidationPlugin",
+    "JsonschemaValidationPlugin",
+    "PanderaValidationPlugin",
+    "PydanticValidationPlugin",
+    "RecommendedSlotsPlugin",
+    "ValidationPlugin",
+]
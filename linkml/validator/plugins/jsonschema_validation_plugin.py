@@ -3,6 +3,7 @@ from collections.abc import Iterator
 from typing import Any, Optional
 
 from jsonschema.exceptions import best_match
+from jsonschema.protocols import Validator
 
 from linkml.validator.plugins.validation_plugin import ValidationPlugin
 from linkml.validator.report import Severity, ValidationResult
@@ -41,11 +42,37 @@ class JsonschemaValidationPlugin(ValidationPlugin):
         :return: Iterator over validation results
         :rtype: Iterator[ValidationResult]
         """
-        validator = context.json_schema_validator(
+        validator = self._validator(context)
+        yield from self._iter_results(validator, instance, context)
+
+    def process_batch(self, instances: list[Any], context: ValidationContext) -> Iterator[ValidationResult]:
+        """Perform JSON Schema validation on a batch of instances
+
+        Each instance is first checked with ``is_valid``. Detailed results are only
+        built for the instances which fail that check.
+
+        :param instances: The instances to validate
+        :param context: The validation context which provides a JSON Schema artifact
+        :return: Iterator over validation results
+        :rtype: Iterator[ValidationResult]
+        """
+        validator = self._validator(context)
+        for index, instance in enumerate(instances):
+            if validator.is_valid(instance):
+                continue
+            for result in self._iter_results(validator, instance, context):
+                result.instance_index = index
+                yield result
+
+    def _validator(self, context: ValidationContext) -> Validator:
+        return context.json_schema_validator(
             closed=self.closed,
             include_range_class_descendants=self.include_range_class_descendants,
             path_override=self.json_schema_path,
         )
+
+    @staticmethod
+    def _iter_results(validator: Validator, instance: Any, context: ValidationContext) -> Iterator[ValidationResult]:
         for error in validator.iter_errors(instance):
             error_context = [ctx.message for ctx in error.context]
             best_error = best_match([error])
@@ -0,0 +1,328 @@
+from collections.abc import Callable, Iterator
+from datetime import date, datetime, time
+from typing import Any, Optional
+
+from linkml.utils.induced_schema import induced_schema
+from linkml.validator.loaders import CsvLoader, Loader, TsvLoader
+from linkml.validator.plugins.validation_plugin import ValidationPlugin
+from linkml.validator.report import Severity, ValidationResult
+from linkml.validator.validation_context import ValidationContext
+
+
+def _column_type(dtype) -> tuple[tuple[type, ...], str]:
+    """Python types accepted for a column of the given Polars type, and the name used in messages"""
+    import polars as pl
+
+    if dtype.is_integer():
+        return (int,), "integer"
+    if dtype.is_float():
+        return (int, float), "number"
+    if dtype == pl.Boolean:
+        return (bool,), "boolean"
+    if dtype == pl.Datetime:
+        return (str, datetime), "datetime"
+    if dtype == pl.Date:
+        return (str, date), "date"
+    if dtype == pl.Time:
+        return (str, time), "time"
+    return (str,), "string"
+
+
+def _parse_column(column, dtype):
+    """Convert a column of strings read from a file to a Polars type, values which cannot be converted becoming null"""
+    import polars as pl
+
+    if dtype == pl.Boolean:
+        return column.str.to_lowercase().replace_strict(
+            {"true": True, "false": False}, default=None, return_dtype=pl.Boolean
+        )
+    # Other formats are parsed with fromisoformat, as for instances
+    if dtype == pl.Date:
+        return column.str.to_date("%Y-%m-%d", strict=False)
+    if dtype == pl.Datetime:
+        return column.str.to_datetime(strict=False).cast(dtype, strict=False)
+    if dtype == pl.Time:
+        return column.str.to_time("%H:%M:%S", strict=False)
+    return column.cast(dtype, strict=False)
+
+
+def _read_delimited_file(loader: Loader, batch_size: int) -> Iterator:
+    """Read a CSV or TSV file in data frames of string columns, as the loader would read its rows"""
+    import polars as pl
+
+    lazy = pl.scan_csv(loader.source, separator=loader.delimiter, infer_schema=False)
+    if hasattr(lazy, "collect_batches"):
+        frames = lazy.collect_batches(chunk_size=batch_size)
+    else:
+        # Older Polars versions
+        reader = pl.read_csv_batched(
+            loader.source, separator=loader.delimiter, infer_schema=False, batch_size=batch_size
+        )
+        frames = (frame for batch in iter(lambda: reader.next_batches(1), None) for frame in batch)
+    for frame in frames:
+        # Leading spaces are skipped and empty values are missing, as in the rows of the loader
+        values = {name: pl.col(name).str.strip_chars_start(" ") for name in frame.columns}
+        frame = frame.select(pl.when(value != "").then(value).alias(name.lstrip(" ")) for name, value in values.items())
+        # Polars reads blank lines as empty rows
+        yield frame.filter(~pl.all_horizontal(pl.all().is_null()))
+
+
+class PanderaValidationPlugin(ValidationPlugin):
+    """A validation plugin which validates tabular instances column by column using Pandera.
+
+    Instances are validated in batches (see the ``batch_size`` argument of
+    :class:`linkml.validator.Validator`). Each batch is converted into a Polars data frame
+    and checked against the Pandera data frame model generated from the schema by
+    :class:`linkml.generators.PanderaGenerator`, so that ranges, patterns and permissible
+    values are checked once per column rather than once per value. Failures are reported
+    against the instance (row) which caused them.
+
+    This plugin is intended for large tables such as CSV or TSV files, where every instance
+    is a flat record. The target class must therefore only have single-valued slots whose
+    range is a type or an enum. It requires the optional ``polars`` and ``pandera``
+    packages.
+
+    When it is the only plugin of a single process :class:`~linkml.validator.Validator`, the
+    files of a :class:`~linkml.validator.loaders.CsvLoader` or
+    :class:`~linkml.validator.loaders.TsvLoader` are read by Polars directly, batch by batch,
+    and their values are converted to the column types without going through Python objects.
+    Rows in which every value is empty are then skipped, and the ``instance`` of each result
+    is the row with its values as read from the file.
+
+    :param closed: If ``True``, values for slots which are not defined on the target class
+        are reported. Defaults to ``False``.
+    """
+
+    def __init__(self, *, closed: bool = False) -> None:
+        self.closed = closed
+        # Context for which the column types were last computed, and those types
+        self._context_columns: Optional[tuple[ValidationContext, dict]] = None
+
+    def __getstate__(self) -> dict:
+        # Worker processes compute the columns again from their own context in pre_process
+        state = self.__dict__.copy()
+        state["_context_columns"] = None
+        return state
+
+    def pre_process(self, context: ValidationContext) -> None:
+        """Check that the target class can be validated and compute the types of its columns
+
+        :param context: The validation context which provides a Pandera model artifact
+        :raises ValueError: If a slot of the target class is not a single-valued type or enum
+        """
+        self._columns(context)
+
+    def process(self, instance: Any, context: ValidationContext) -> Iterator[ValidationResult]:
+        """Perform Pandera validation on the provided instance
+
+        Prefer :meth:`process_batch`, which validates many instances with each data frame.
+
+        :param instance: The instance to validate
+        :param context: The validation context which provides a Pandera model artifact
+        :return: Iterator over validation results
+        :rtype: Iterator[ValidationResult]
+        """
+        for result in self.process_batch([instance], context):
+            result.instance_index = None
+            yield result
+
+    def process_batch(self, instances: list[Any], context: ValidationContext) -> Iterator[ValidationResult]:
+        """Perform Pandera validation on a batch of instances
+
+        :param instances: The instances to validate
+        :param context: The validation context which provides a Pandera model artifact
+        :return: Iterator over validation results
+        :rtype: Iterator[ValidationResult]
+        """
+        import polars as pl
+
+        columns = self._columns(context)
+        # Messages for each instance which has any
+        messages: dict[int, list[str]] = {}
+        # Cells which have already been reported because their value does not fit the column type
+        reported: set[tuple[int, str]] = set()
+
+        if self.closed:
+            for index, instance in enumerate(instances):
+                extra = instance.keys() - columns.keys()
+                if extra:
+                    names = ", ".join(repr(name) for name in sorted(extra))
+                    messages.setdefault(index, []).append(f"Additional properties are not allowed ({names} unexpected)")
+
+        series = []
+        for name, dtype in columns.items():
+            values = [instance.get(name) for instance in instances]
+            value_types, type_name = _column_type(dtype)
+            converted = values
+            # Values of the wrong Python type would otherwise be coerced by Polars (e.g. 1.5 to 1).
+            # Dates and times are parsed here because Polars cannot infer the format of every string.
+            if dtype.is_temporal() or any(type(v) not in value_types for v in values if v is not None):
+                converted = list(values)
+                for index, value in enumerate(values):
+                    if value is None:
+                        continue
+                    if type(value) not in value_types:
+                        messages.setdefault(index, []).append(f"{value!r} is not of type {type_name!r} in /{name}")
+                    elif isinstance(value, str) and dtype.is_temporal():
+                        try:
+                            converted[index] = value_types[1].fromisoformat(value)
+                            continue
+                        except ValueError:
+                            messages.setdefault(index, []).append(f"{value!r} is not a valid {type_name} in /{name}")
+                    else:
+                        continue
+                    reported.add((index, name))
+                    converted[index] = None
+            column = pl.Series(name, converted, dtype=dtype, strict=False)
+            # Strings which are not permissible values of an enum become null
+            if isinstance(dtype, pl.Enum) and column.null_count() > converted.count(None):
+                permissible = ", ".join(repr(c) for c in dtype.categories)
+                for index in column.is_null().arg_true():
+                    if converted[index] is not None:
+                        messages.setdefault(index, []).append(
+                            f"{values[index]!r} is not one of [{permissible}] in /{name}"
+                        )
+                        reported.add((index, name))
+            series.append(column)
+
+        self._check_frame(
+            pl.DataFrame(series), context, messages, reported, lambda index, name: instances[index].get(name)
+        )
+        yield from self._results(messages, context, 0, lambda index: instances[index])
+
+    def process_source(
+        self, loader: Loader, context: ValidationContext, batch_size: int
+    ) -> Optional[Iterator[ValidationResult]]:
+        """Read a CSV or TSV file directly with Polars, and validate it batch by batch
+
+        :param loader: The loader of the data source. Other loaders than
+            :class:`~linkml.validator.loaders.CsvLoader` and
+            :class:`~linkml.validator.loaders.TsvLoader`, and loaders which collect all
+            rows into a single instance, are not read directly.
+        :param context: The validation context which provides a Pandera model artifact
+        :param batch_size: Number of rows to validate at a time
+        :return: Iterator over validation results, or ``None`` if the source is not read directly
+        :rtype: Optional[Iterator[ValidationResult]]
+        """
+        if not isinstance(loader, (CsvLoader, TsvLoader)) or loader.index_slot_name is not None:
+            return None
+        return self._process_delimited_file(loader, context, batch_size)
+
+    def _process_delimited_file(
+        self, loader: Loader, context: ValidationContext, batch_size: int
+    ) -> Iterator[ValidationResult]:
+        import polars as pl
+
+        columns = self._columns(context)
+        start = 0
+        for frame in _read_delimited_file(loader, batch_size):
+            messages: dict[int, list[str]] = {}
+            reported: set[tuple[int, str]] = set()
+
+            if self.closed:
+                for name in sorted(frame.columns):
+                    if name not in columns:
+                        for index in frame.get_column(name).is_not_null().arg_true():
+                            messages.setdefault(index, []).append(name)
+                for index, names in messages.items():
+                    names = ", ".join(repr(name) for name in names)
+                    messages[index] = [f"Additional properties are not allowed ({names} unexpected)"]
+
+            series = []
+            for name, dtype in columns.items():
+                if name in frame.columns:
+                    values = frame.get_column(name)
+                else:
+                    values = pl.repeat(None, frame.height, dtype=pl.String, eager=True).alias(name)
+                column = _parse_column(values, dtype)
+                failed = column.is_null() & values.is_not_null()
+                if failed.any():
+                    value_types, type_name = _column_type(dtype)
+                    converted = column.to_list()
+                    for index in failed.arg_true():
+                        value = values[index]
+                        if isinstance(dtype, pl.Enum):
+                            permissible = ", ".join(repr(c) for c in dtype.categories)
+                            message = f"{value!r} is not one of [{permissible}] in /{name}"
+                        elif dtype.is_temporal():
+                            try:
+                                converted[index] = value_types[1].fromisoformat(value)
+                                continue
+                            except ValueError:
+                                message = f"{value!r} is not a valid {type_name} in /{name}"
+                        else:
+                            message = f"{value!r} is not of type {type_name!r} in /{name}"
+                        messages.setdefault(index, []).append(message)
+                        reported.add((index, name))
+                    column = pl.Series(name, converted, dtype=dtype, strict=False)
+                series.append(column)
+
+            parsed = pl.DataFrame(series)
+            self._check_frame(parsed, context, messages, reported, lambda index, name: parsed.get_column(name)[index])
+            yield from self._results(
+                messages,
+                context,
+                start,
+                lambda index: {k: v for k, v in frame.row(index, named=True).items() if v is not None},
+            )
+            start += frame.height
+
+    def _check_frame(
+        self,
+        frame,
+        context: ValidationContext,
+        messages: dict[int, list[str]],
+        reported: set[tuple[int, str]],
+        value: Callable[[int, str], Any],
+    ) -> None:
+        """Validate a data frame against the Pandera model, adding the failures of cells not reported yet"""
+        import pandera.errors
+
+        try:
+            self._model(context).validate(frame, lazy=True)
+        except pandera.errors.SchemaErrors as e:
+            for case in e.failure_cases.iter_rows(named=True):
+                indices = range(frame.height) if case["index"] is None else [case["index"]]
+                for index in indices:
+                    if (index, case["column"]) not in reported:
+                        messages.setdefault(index, []).append(self._message(case, value(index, case["column"])))
+
+    @staticmethod
+    def _results(
+        messages: dict[int, list[str]], context: ValidationContext, start: int, instance: Callable[[int], Any]
+    ) -> Iterator[ValidationResult]:
+        for index in sorted(messages):
+            for message in messages[index]:
+                yield ValidationResult(
+                    type="pandera validation",
+                    severity=Severity.ERROR,
+                    instance=instance(index),
+                    instance_index=start + index,
+                    instantiates=context.target_class,
+                    message=message,
+                )
+
+    @staticmethod
+    def _message(case: dict, value: Any) -> str:
+        if case["check"] == "not_nullable":
+            return f"{case['column']!r} is a required property"
+        return f"{value!r} failed check {case['check']} in /{case['column']}"
+
+    @staticmethod
+    def _model(context: ValidationContext):
+        return getattr(context.pandera_module(), context.target_class)
+
+    def _columns(self, context: ValidationContext) -> dict:
+        """Map of column names to Polars types of the target class, computed once per context"""
+        if self._context_columns is None or self._context_columns[0] is not context:
+            self._context_columns = (context, self._build_columns(context))
+        return self._context_columns[1]
+
+    def _build_columns(self, context: ValidationContext) -> dict:
+        for slot in induced_schema(context.schema_view).class_induced_slots(context.target_class):
+            if slot.multivalued or slot.range in context.schema_view.all_classes():
+                raise ValueError(
+                    f"Slot {slot.name!r} of class {context.target_class!r} is not a single-valued type or enum "
+                    "and cannot be validated by PanderaValidationPlugin"
+                )
+        return {name: column.dtype.type for name, column in self._model(context).to_schema().columns.items()}
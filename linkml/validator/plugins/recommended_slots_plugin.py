@@ -1,6 +1,7 @@
 from collections.abc import Iterator
 from typing import Optional
 
+from linkml.utils.induced_schema import induced_schema
 from linkml.validator.plugins.validation_plugin import ValidationPlugin
 from linkml.validator.report import Severity, ValidationResult
 from linkml.validator.validation_context import ValidationContext
@@ -17,7 +18,7 @@ class RecommendedSlotsPlugin(ValidationPlugin):
                 return
             if location is None:
                 location = []
-            for slot_def in context.schema_view.class_induced_slots(class_name):
+            for slot_def in induced_schema(context.schema_view).class_induced_slots(class_name):
                 slot_value = instance.get(slot_def.name, None)
                 if slot_def.recommended and slot_value is None:
                     loc = "/".join(location)
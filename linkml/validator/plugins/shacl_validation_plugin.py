@@ -5,7 +5,6 @@ from typing import Any, Optional
 import rdflib
 from linkml_runtime.dumpers import rdflib_dumper
 
-from linkml.generators import PythonGenerator, ShaclGenerator
 from linkml.validator.plugins.validation_plugin import ValidationPlugin
 from linkml.validator.report import Severity, ValidationResult
 from linkml.validator.validation_context import ValidationContext
@@ -35,21 +34,15 @@ class ShaclValidationPlugin(ValidationPlugin):
         self.closed = closed
         self.shacl_path = shacl_path
         self.raise_on_conversion_error = raise_on_conversion_error
-        self._loaded_graphs = {}
+        self._shacl_path_graph: Optional[rdflib.Graph] = None
 
     def _shacl_graph(self, context: ValidationContext) -> Optional[rdflib.Graph]:
-        g = rdflib.Graph()
         if self.shacl_path:
-            g.parse(str(self.shacl_path))
-        else:
-            schema_hash = hash(str(context._schema))
-            if schema_hash in self._loaded_graphs:
-                g = self._loaded_graphs[schema_hash]
-            else:
-                gen = ShaclGenerator(context._schema)
-                g = gen.as_graph()
-                self._loaded_graphs[schema_hash] = g
-        return g
+            if self._shacl_path_graph is None:
+                self._shacl_path_graph = rdflib.Graph()
+                self._shacl_path_graph.parse(str(self.shacl_path))
+            return self._shacl_path_graph
+        return context.shacl_graph()
 
     def process(self, instance: Any, context: ValidationContext) -> Iterator[ValidationResult]:
         """Perform SHACL Schema validation on the provided instance
@@ -59,42 +52,92 @@ class ShaclValidationPlugin(ValidationPlugin):
         :return: Iterator over validation results
         :rtype: Iterator[ValidationResult]
         """
+        for _, result in self._iter_results([instance], context):
+            yield result
+
+    def process_batch(self, instances: list[Any], context: ValidationContext) -> Iterator[ValidationResult]:
+        """Perform SHACL Schema validation on a batch of instances
+
+        All instances of the batch are converted into a single data graph, which is validated
+        with one SHACL run. Each result is mapped back to the instance that produced its
+        ``sh:focusNode``. The size of the batch is set by the ``batch_size`` of the
+        :class:`linkml.validator.Validator`.
+
+        :param instances: The instances to validate
+        :param context: The validation context which provides a SHACL artifact
+        :return: Iterator over validation results
+        :rtype: Iterator[ValidationResult]
+        """
+        for index, result in self._iter_results(instances, context):
+            result.instance_index = index
+            yield result
+
+    def _iter_results(self, instances: list[Any], context: ValidationContext) -> Iterator[tuple[int, ValidationResult]]:
         import pyshacl
 
+        # The shapes must be generated before the Python module, as generating the module
+        # modifies the schema
         shacl_graph = self._shacl_graph(context)
-        if isinstance(instance, dict):
-            pygen = PythonGenerator(context._schema)
-            mod = pygen.compile_module()
-            py_cls = getattr(mod, context._target_class)
-            if self.raise_on_conversion_error:
-                instance = py_cls(**instance)
-            else:
-                try:
+        data_graph = rdflib.Graph()
+        converted = {}
+        # Nodes of the data graph mapped to the instances which describe them (as a subject)
+        # or refer to them (as an object)
+        subject_owners: dict[rdflib.term.Node, list[int]] = {}
+        object_owners: dict[rdflib.term.Node, list[int]] = {}
+        for index, instance in enumerate(instances):
+            if isinstance(instance, dict):
+                py_cls = getattr(context.python_module(), context._target_class)
+                if self.raise_on_conversion_error:
                     instance = py_cls(**instance)
-                except (ValueError, TypeError):
-                    yield ValidationResult(
-                        type="shacl validation",
-                        severity=Severity.ERROR,
-                        instance=instance,
-                        instantiates=context.target_class,
-                        message="failed at class instantiation stage",
-                    )
-                    return
-        data_graph = rdflib_dumper.as_rdf_graph(instance, schemaview=context.schema_view)
-        validator = pyshacl.Validator(
+                else:
+                    try:
+                        instance = py_cls(**instance)
+                    except (ValueError, TypeError):
+                        yield (
+                            index,
+                            ValidationResult(
+                                type="shacl validation",
+                                severity=Severity.ERROR,
+                                instance=instance,
+                                instantiates=context.target_class,
+                                message="failed at class instantiation stage",
+                            ),
+                        )
+                        continue
+            converted[index] = instance
+            instance_graph = rdflib_dumper.as_rdf_graph(instance, schemaview=context.schema_view)
+            for s, _, o in instance_graph:
+                owners = subject_owners.setdefault(s, [])
+                if not owners or owners[-1] != index:
+                    owners.append(index)
+                if not isinstance(o, rdflib.Literal):
+                    owners = object_owners.setdefault(o, [])
+                    if not owners or owners[-1] != index:
+                        owners.append(index)
+            data_graph += instance_graph
+
+        if not converted:
+            return
+        conforms, report_graph, report_text = pyshacl.validate(
+            data_graph,
             shacl_graph=shacl_graph,
-            data_graph=data_graph,
-            inference="rdfs",
         )
-        conforms, report_graph, report_text = validator.run()
+        first_index = next(iter(converted))
         for s, _, o in report_graph.triples((None, SH.result, None)):
             msg = ""
             for p, o2 in report_graph.predicate_objects(o):
                 msg += f"{p} {o2}\n"
-            yield ValidationResult(
-                type="shacl validation",
-                severity=Severity.ERROR,
-                instance=instance,
-                instantiates=context.target_class,
-                message=f"{msg}",
-            )
+            focus_node = report_graph.value(o, SH.focusNode)
+            # Every focus node comes from the data graph, the fallback is only defensive
+            owners = subject_owners.get(focus_node) or object_owners.get(focus_node) or [first_index]
+            for index in owners:
+                yield (
+                    index,
+                    ValidationResult(
+                        type="shacl validation",
+                        severity=Severity.ERROR,
+                        instance=converted[index],
+                        instantiates=context.target_class,
+                        message=f"{msg}",
+                    ),
+                )
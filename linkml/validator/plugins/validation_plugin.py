@@ -1,6 +1,8 @@
 from abc import ABC, abstractmethod
 from collections.abc import Iterator
+from typing import Optional
 
+from linkml.validator.loaders import Loader
 from linkml.validator.report import ValidationResult
 from linkml.validator.validation_context import ValidationContext
 
@@ -8,7 +10,10 @@ from linkml.validator.validation_context import ValidationContext
 class ValidationPlugin(ABC):
     """Abstract base class for validation plugins.
 
-    Subclasses must implement a ``process`` method.
+    Subclasses must implement a ``process`` method. They may also override
+    ``process_batch`` to validate many instances more efficiently than one
+    ``process`` call per instance, and ``process_source`` to read some data
+    sources directly rather than through the instances of their loader.
     """
 
     def pre_process(self, context: ValidationContext) -> None:
@@ -42,3 +47,47 @@ class ValidationPlugin(ABC):
         :rtype: Iterator[ValidationResult]
         """
         pass
+
+    def process_batch(self, instances: list[dict], context: ValidationContext) -> Iterator[ValidationResult]:
+        """Lazily yield validation results for a batch of instances according
+        to the validation context.
+
+        The ``instance_index`` of each result must be set to the position of
+        its instance within ``instances``. Results for an instance must be
+        yielded in the same order that ``process`` would yield them. The
+        default implementation calls ``process`` on each instance in turn.
+
+        :param instances: The instances to validate
+        :param context: A `ValidationContext` instance which provides
+            access to the schema, target class, and artifacts generated
+            from the schema
+        :return: Iterator over validation results
+        :rtype: Iterator[ValidationResult]
+        """
+        for index, instance in enumerate(instances):
+            for result in self.process(instance, context):
+                result.instance_index = index
+                yield result
+
+    def process_source(
+        self, loader: Loader, context: ValidationContext, batch_size: int
+    ) -> Optional[Iterator[ValidationResult]]:
+        """Validate all the instances of a data source by reading it directly,
+        if the plugin supports it.
+
+        This is only called if the plugin is the only one, instances are
+        validated in batches in a single process, and the plugin overrides
+        ``process_batch``. The default implementation returns ``None``, in
+        which case the instances of the loader are passed to ``process_batch``.
+
+        :param loader: The loader of the data source
+        :param context: A `ValidationContext` instance which provides
+            access to the schema, target class, and artifacts generated
+            from the schema
+        :param batch_size: Number of instances to validate at a time
+        :return: Iterator over validation results, whose ``instance_index`` is
+            the position of the instance within the source, or ``None`` if the
+            plugin does not read this source directly
+        :rtype: Optional[Iterator[ValidationResult]]
+        """
+        return None
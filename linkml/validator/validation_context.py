@@ -1,26 +1,49 @@
+import hashlib
 import json
 import os
 from functools import lru_cache
+from types import ModuleType
 from typing import Optional
 
 import jsonschema
+import rdflib
 from jsonschema.protocols import Validator
 from linkml_runtime import SchemaView
 from linkml_runtime.linkml_model import SchemaDefinition
+from linkml_runtime.utils.compile_python import compile_python
 
-from linkml.generators import JsonSchemaGenerator, PydanticGenerator
+from linkml.utils.artifact_cache import ArtifactCache, schema_fingerprint
 from linkml.utils.datautils import infer_root_class
+from linkml.utils.module_cache import compile_module_cached
+from linkml.validator.jsonschema_compiler import CompiledJsonSchemaValidator, compile_json_schema
 
 
 class ValidationContext:
-    """Provides state that may be shared between validation plugins"""
+    """Provides state that may be shared between validation plugins
 
-    def __init__(self, schema: SchemaDefinition, target_class: Optional[str] = None) -> None:
+    :param schema: The schema to validate against
+    :param target_class: Name of the class within the schema to validate against. If
+        ``None``, the class will be inferred from the schema.
+    :param cache_dir: If provided, generated artifacts (JSON Schema, compiled JSON Schema
+        validators, Python, Pydantic and Pandera source code and SHACL shapes) are stored in
+        and reused from this directory across processes. Entries are keyed on the schema, its
+        import closure and the generator options.
+    """
+
+    def __init__(
+        self,
+        schema: SchemaDefinition,
+        target_class: Optional[str] = None,
+        *,
+        cache_dir: Optional[os.PathLike] = None,
+    ) -> None:
         # Since SchemaDefinition is not hashable, to make caching simpler we store the schema
         # in a "private" property and assume it never changes.
         self._schema = schema
         self._schema_view = SchemaView(self._schema)
         self._target_class = self._get_target_class(target_class)
+        self._artifact_cache = ArtifactCache(cache_dir) if cache_dir else None
+        self._fingerprint = None
 
     @property
     def schema_view(self):
@@ -43,28 +66,118 @@ class ValidationContext:
                 json_schema = json.load(json_schema_file)
         else:
             not_closed = not closed
-            jsonschema_gen = JsonSchemaGenerator(
-                schema=self._schema,
-                mergeimports=True,
+            cache_key = self._cache_key(
+                "jsonschema.json",
                 top_class=self._target_class,
                 not_closed=not_closed,
                 include_range_class_descendants=include_range_class_descendants,
+                deduplicate_properties=True,
             )
-            json_schema = jsonschema_gen.generate()
+            cached = self._artifact_cache.get(cache_key) if cache_key else None
+            if cached is not None:
+                json_schema = json.loads(cached)
+            else:
+                from linkml.generators.jsonschemagen import JsonSchemaGenerator
+
+                jsonschema_gen = JsonSchemaGenerator(
+                    schema=self._schema,
+                    mergeimports=True,
+                    top_class=self._target_class,
+                    not_closed=not_closed,
+                    include_range_class_descendants=include_range_class_descendants,
+                    deduplicate_properties=True,
+                )
+                json_schema = jsonschema_gen.generate()
+                if cache_key:
+                    self._artifact_cache.put(cache_key, json.dumps(json_schema))
 
         validator_cls = jsonschema.validators.validator_for(json_schema, default=jsonschema.Draft7Validator)
         return validator_cls(json_schema, format_checker=validator_cls.FORMAT_CHECKER)
 
+    @lru_cache
+    def compiled_json_schema_validator(
+        self,
+        *,
+        closed: bool,
+        include_range_class_descendants: bool,
+        path_override: Optional[os.PathLike] = None,
+    ) -> CompiledJsonSchemaValidator:
+        """JSON Schema validator whose valid-instance checks are compiled to Python functions
+
+        See :meth:`json_schema_validator` for the arguments. If a cache directory is configured,
+        the generated source code is cached there, keyed on the content of the JSON Schema.
+        """
+        validator = self.json_schema_validator(
+            closed=closed,
+            include_range_class_descendants=include_range_class_descendants,
+            path_override=path_override,
+        )
+        cache_key = None
+        if self._artifact_cache is not None:
+            json_schema_hash = hashlib.sha256(json.dumps(validator.schema, sort_keys=True).encode()).hexdigest()
+            cache_key = self._artifact_cache.key(json_schema_hash, "jsonschema_compiled.py")
+        source = self._artifact_cache.get(cache_key) if cache_key else None
+        if source is None:
+            source = compile_json_schema(validator.schema)
+            if cache_key:
+                self._artifact_cache.put(cache_key, source)
+        return CompiledJsonSchemaValidator(source, validator)
+
     def pydantic_model(self, *, closed: bool):
         module = self._pydantic_module(closed=closed)
         return module.__dict__[self._target_class]
 
     @lru_cache
     def _pydantic_module(self, *, closed: bool):
-        return PydanticGenerator(
-            self._schema,
-            extra_fields="forbid" if closed else "ignore" if closed is None else "allow",
-        ).compile_module()
+        extra_fields = "forbid" if closed else "ignore" if closed is None else "allow"
+        cache_key = self._cache_key("pydantic.py", extra_fields=extra_fields)
+        source = self._artifact_cache.get(cache_key) if cache_key else None
+        if source is None:
+            from linkml.generators.pydanticgen import PydanticGenerator
+
+            generator = PydanticGenerator(self._schema, extra_fields=extra_fields)
+            if not cache_key:
+                return generator.compile_module()
+            source = generator.serialize()
+            self._artifact_cache.put(cache_key, source)
+        return compile_python(source)
+
+    @lru_cache
+    def python_module(self) -> ModuleType:
+        """Module of Python dataclasses generated from the schema"""
+        from linkml.generators.pythongen import PythonGenerator
+
+        cache_dir = self._artifact_cache.directory if self._artifact_cache else None
+        return compile_module_cached(PythonGenerator(self._schema), cache_dir=cache_dir)
+
+    @lru_cache
+    def pandera_module(self) -> ModuleType:
+        """Module of Pandera (Polars) data frame models generated from the schema"""
+        from linkml.generators.panderagen import PanderaGenerator
+
+        cache_dir = self._artifact_cache.directory if self._artifact_cache else None
+        return compile_module_cached(PanderaGenerator(self._schema), cache_dir=cache_dir)
+
+    @lru_cache
+    def shacl_graph(self) -> rdflib.Graph:
+        """SHACL shapes graph generated from the schema"""
+        cache_key = self._cache_key("shacl.ttl")
+        cached = self._artifact_cache.get(cache_key) if cache_key else None
+        if cached is not None:
+            return rdflib.Graph().parse(data=cached, format="turtle")
+        from linkml.generators.shaclgen import ShaclGenerator
+
+        graph = ShaclGenerator(self._schema).as_graph()
+        if cache_key:
+            self._artifact_cache.put(cache_key, graph.serialize(format="turtle"))
+        return graph
+
+    def _cache_key(self, artifact: str, **options) -> Optional[str]:
+        if self._artifact_cache is None:
+            return None
+        if self._fingerprint is None:
+            self._fingerprint = schema_fingerprint(self._schema_view)
+        return self._artifact_cache.key(self._fingerprint, artifact, **options)
 
     def _get_target_class(self, target_class: Optional[str] = None) -> str:
         if target_class is None:
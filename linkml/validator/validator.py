@@ -1,5 +1,11 @@
-from collections.abc import Iterator
+import multiprocessing
+import multiprocessing.util
+import os
+from collections import deque
+from collections.abc import Iterable, Iterator
+from concurrent.futures import Future, ProcessPoolExecutor
 from functools import lru_cache
+from itertools import islice
 from pathlib import Path
 from typing import Any, Optional, TextIO, Union
 
@@ -23,6 +29,23 @@ class Validator:
         :class:`linkml.validator.plugins.ValidationPlugin`. Defaults to ``None``.
     :param strict: If ``True``, stop validating after the first validation problem
         is found. Defaults to ``False``.
+    :param workers: Number of worker processes used to validate instances. If greater
+        than ``1``, instances are sharded in batches across a process pool. Each worker
+        builds its own ``ValidationContext`` and calls ``pre_process`` on its copy of the
+        plugins once. Results are still yielded in ``instance_index`` order, but their
+        ``source`` is not carried back from the workers. Plugins must be picklable in
+        this mode. Defaults to ``1``.
+    :param batch_size: Number of instances passed to each plugin's ``process_batch``
+        at a time. When ``workers`` is greater than ``1`` this is also the number of
+        instances sent to a worker process at a time. Batches are only used if one of the
+        plugins overrides ``process_batch`` and ``strict`` is ``False``. Otherwise each
+        instance is passed to each plugin's ``process`` in turn, so that results are yielded
+        as soon as they are found and validation stops before later instances are processed.
+        In non-strict mode, a fatal result still stops validation, but only once its whole
+        batch has been processed. A single plugin may also read the source directly in batches
+        of this size, see ``ValidationPlugin.process_source``. Defaults to ``1000``.
+    :param cache_dir: If provided, artifacts generated from the schema are cached in this
+        directory and reused by later runs. See :class:`ValidationContext`. Defaults to ``None``.
     """
 
     def __init__(
@@ -31,6 +54,9 @@ class Validator:
         validation_plugins: Optional[list[ValidationPlugin]] = None,
         *,
         strict: bool = False,
+        workers: int = 1,
+        batch_size: int = 1000,
+        cache_dir: Optional[os.PathLike] = None,
     ) -> None:
         if isinstance(schema, Path):
             schema = str(schema)
@@ -42,6 +68,13 @@ class Validator:
             self._schema.source_file = schema
         self._validation_plugins = validation_plugins
         self.strict = strict
+        if workers < 1:
+            raise ValueError(f"workers must be a positive integer, got {workers}")
+        if batch_size < 1:
+            raise ValueError(f"batch_size must be a positive integer, got {batch_size}")
+        self.workers = workers
+        self.batch_size = batch_size
+        self.cache_dir = cache_dir
 
     def validate(self, instance: Any, target_class: Optional[str] = None) -> ValidationReport:
         """Validate the given instance
@@ -102,24 +135,178 @@ class Validator:
         for plugin in self._validation_plugins:
             plugin.pre_process(context)
 
-        has_failure = False
-        for index, instance in enumerate(loader.iter_instances()):
+        if self.workers > 1:
+            yield from self._iter_results_parallel(loader, context)
             for plugin in self._validation_plugins:
-                for result in plugin.process(instance, context):
-                    if result.severity == Severity.FATAL or (self.strict and result.severity == Severity.ERROR):
-                        has_failure = True
-                    result.instance_index = index
-                    yield result
-                    if has_failure:
-                        break
-                if has_failure:
-                    break
-            if has_failure:
+                plugin.post_process(context)
+            return
+
+        results = None
+        uses_batches = _uses_batches(self._validation_plugins, self.strict)
+        if uses_batches and len(self._validation_plugins) == 1:
+            results = self._validation_plugins[0].process_source(loader, context, self.batch_size)
+        if results is None:
+            # Without batches, instances are read from the loader one at a time
+            batches = _iter_batches(loader.iter_instances(), self.batch_size if uses_batches else 1)
+            results = (
+                result
+                for start, batch in batches
+                for result in _iter_batch_results(self._validation_plugins, context, start, batch, self.strict)
+            )
+        for result in results:
+            yield result
+            if _is_failure(result, self.strict):
                 break
 
         for plugin in self._validation_plugins:
             plugin.post_process(context)
 
+    def _iter_results_parallel(self, loader: Loader, context: ValidationContext) -> Iterator[ValidationResult]:
+        """Validate batches of instances across a pool of worker processes
+
+        Batches are submitted in order and their results are consumed in the same order, so
+        the overall sequence of results matches serial validation. At most two batches per
+        worker are in flight at once to keep memory bounded for large sources.
+
+        Each worker has its own copy of the plugins, whose ``pre_process`` and ``post_process``
+        hooks are called when the worker starts and when it exits. The plugins of the parent
+        process have their own pair of hooks called around the whole run.
+        """
+        batches = _iter_batches(loader.iter_instances(), self.batch_size)
+        max_pending = self.workers * 2
+        pending: deque[Future] = deque()
+        with ProcessPoolExecutor(
+            max_workers=self.workers,
+            mp_context=_worker_mp_context(),
+            initializer=_init_worker,
+            initargs=(self._schema, self._validation_plugins, context.target_class, self.strict, self.cache_dir),
+        ) as executor:
+            try:
+                for start, batch in batches:
+                    pending.append(executor.submit(_process_batch, start, batch))
+                    if len(pending) >= max_pending:
+                        results, has_failure = pending.popleft().result()
+                        yield from results
+                        if has_failure:
+                            return
+                while pending:
+                    results, has_failure = pending.popleft().result()
+                    yield from results
+                    if has_failure:
+                        return
+            finally:
+                for future in pending:
+                    future.cancel()
+
     @lru_cache
     def _context(self, target_class: Optional[str] = None) -> ValidationContext:
-        return ValidationContext(self._schema, target_class)
+        return ValidationContext(self._schema, target_class, cache_dir=self.cache_dir)
+
+
+def _iter_batches(instances: Iterable[Any], batch_size: int) -> Iterator[tuple[int, list[Any]]]:
+    iterator = iter(instances)
+    start = 0
+    while batch := list(islice(iterator, batch_size)):
+        yield start, batch
+        start += len(batch)
+
+
+def _uses_batches(plugins: list[ValidationPlugin], strict: bool) -> bool:
+    """Whether instances are passed to the plugins' ``process_batch`` rather than ``process``
+
+    In strict mode, validation must stop at the first error without processing later instances.
+    Otherwise, batches are only worth it if a plugin validates them more efficiently than the
+    default implementation of ``process_batch``.
+    """
+    return not strict and any(type(plugin).process_batch is not ValidationPlugin.process_batch for plugin in plugins)
+
+
+def _iter_batch_results(
+    plugins: list[ValidationPlugin], context: ValidationContext, start: int, batch: list[Any], strict: bool
+) -> Iterator[ValidationResult]:
+    """Run each plugin over a batch and yield the results in serial validation order
+
+    If batches are used (see :func:`_uses_batches`), every plugin sees the whole batch through
+    ``process_batch``. The results are then regrouped so they come out ordered by instance first
+    and by plugin second, exactly as if each instance had been passed to each plugin's
+    ``process`` in turn, which is what is done otherwise. The ``instance_index`` of each result
+    is made relative to the whole source.
+    """
+    if not _uses_batches(plugins, strict):
+        for offset, instance in enumerate(batch):
+            for plugin in plugins:
+                for result in plugin.process(instance, context):
+                    result.instance_index = start + offset
+                    yield result
+        return
+
+    by_instance: list[list[ValidationResult]] = [[] for _ in batch]
+    for plugin in plugins:
+        for result in plugin.process_batch(batch, context):
+            by_instance[result.instance_index].append(result)
+    for offset, results in enumerate(by_instance):
+        for result in results:
+            result.instance_index = start + offset
+            yield result
+
+
+def _is_failure(result: ValidationResult, strict: bool) -> bool:
+    """Whether validation should stop after this result"""
+    return result.severity == Severity.FATAL or (strict and result.severity == Severity.ERROR)
+
+
+def _worker_mp_context() -> multiprocessing.context.BaseContext:
+    """Start method of the worker processes
+
+    Workers are not forked from the parent process, which may already have run libraries that
+    are not fork-safe, such as Polars in the ``pre_process`` hook of
+    :class:`~linkml.validator.plugins.PanderaValidationPlugin`.
+    """
+    method = "forkserver" if "forkserver" in multiprocessing.get_all_start_methods() else "spawn"
+    return multiprocessing.get_context(method)
+
+
+# State owned by each worker process of a parallel validation run. It is populated once by
+# ``_init_worker`` so that the context and plugins are not rebuilt for every batch.
+_worker_state: dict[str, Any] = {}
+
+
+def _init_worker(
+    schema: SchemaDefinition,
+    plugins: list[ValidationPlugin],
+    target_class: str,
+    strict: bool,
+    cache_dir: Optional[os.PathLike],
+) -> None:
+    context = ValidationContext(schema, target_class, cache_dir=cache_dir)
+    for plugin in plugins:
+        plugin.pre_process(context)
+    _worker_state.update(context=context, plugins=plugins, strict=strict)
+    # Called as the worker process exits, once the pool is shut down
+    multiprocessing.util.Finalize(None, _finalize_worker, exitpriority=10)
+
+
+def _finalize_worker() -> None:
+    context = _worker_state["context"]
+    for plugin in _worker_state["plugins"]:
+        plugin.post_process(context)
+
+
+def _process_batch(start: int, batch: list[Any]) -> tuple[list[ValidationResult], bool]:
+    """Validate one batch of instances inside a worker process
+
+    :return: The results for the batch, and whether validation should stop after
+        them (a fatal result, or an error in strict mode).
+    """
+    context = _worker_state["context"]
+    plugins = _worker_state["plugins"]
+    strict = _worker_state["strict"]
+    results = []
+    for result in _iter_batch_results(plugins, context, start, batch, strict):
+        # The source usually references worker-local objects (e.g. a jsonschema
+        # validator) which cannot be sent back to the parent process.
+        result.source = None
+        results.append(result)
+        if _is_failure(result, strict):
+            return results, True
+    return results, False
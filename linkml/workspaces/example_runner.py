@@ -1,11 +1,15 @@
 """Iterate through all examples in a folder testing them for validity."""
 
 import glob
+import hashlib
 import json
 import logging
 import os
 import sys
-from collections.abc import Mapping
+import tempfile
+from collections.abc import Iterator, Mapping
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import ExitStack
 from dataclasses import dataclass, field
 from io import StringIO
 from pathlib import Path
@@ -16,16 +20,21 @@ import click
 import yaml
 from linkml_runtime import SchemaView
 from linkml_runtime.dumpers import json_dumper, rdflib_dumper, yaml_dumper
-from linkml_runtime.linkml_model import ElementName
+from linkml_runtime.linkml_model import ElementName, SchemaDefinition
 from linkml_runtime.utils.formatutils import camelcase
 
 from linkml._version import __version__
 from linkml.generators.pythongen import PythonGenerator
+from linkml.utils.artifact_cache import schema_fingerprint
 from linkml.utils.helpers import get_range_associated_slots
+from linkml.utils.module_cache import compile_module_cached
 from linkml.validator import Validator, _get_default_validator
 
 logger = logging.getLogger(__name__)
 
+#: File of the output directory in which the examples processed by earlier runs are recorded
+MANIFEST_FILE = ".linkml-examples.json"
+
 
 @dataclass
 class SummaryDocument:
@@ -87,6 +96,17 @@ class ExampleRunner:
 
     use_type_designators: bool = True
 
+    jobs: int = 1
+    """Number of processes processing examples at the same time."""
+
+    skip_unchanged: bool = False
+    """If true, then examples which have not changed since the last run, nor has the schema, are not processed again."""
+
+    cache_dir: Optional[Path] = None
+    """Directory in which the Python module and the JSON Schema of the schema are cached."""
+
+    _schema_fingerprint: Optional[str] = None
+
     @property
     def python_module(self) -> ModuleType:
         """
@@ -95,14 +115,16 @@ class ExampleRunner:
         :return:
         """
         if self._python_module is None:
-            # See: https://github.com/linkml/linkml/issues/1219
-            src = self.schemaview.schema.source_file
-            if not src:
-                src = self.schemaview.schema
-            pygen = PythonGenerator(src)
-            self._python_module = pygen.compile_module()
+            self._python_module = compile_module_cached(self._python_generator(), cache_dir=self.cache_dir)
         return self._python_module
 
+    def _python_generator(self) -> PythonGenerator:
+        # See: https://github.com/linkml/linkml/issues/1219
+        src = self.schemaview.schema.source_file
+        if not src:
+            src = self.schemaview.schema
+        return PythonGenerator(src)
+
     @property
     def validator(self) -> Validator:
         """
@@ -111,7 +133,7 @@ class ExampleRunner:
         :return:
         """
         if self._validator is None:
-            self._validator = _get_default_validator(self.schemaview.schema)
+            self._validator = _get_default_validator(self.schemaview.schema, cache_dir=self.cache_dir)
         return self._validator
 
     def process_examples(self):
@@ -160,9 +182,8 @@ class ExampleRunner:
         return all_inputs
 
     def process_examples_from_list(self, input_examples: list, input_format: str, counter_examples: bool = True):
-        sv = self.schemaview
-        validator = self.validator
         summary = self.summary
+        examples = []
         for input_example in input_examples:
             stem = Path(input_example).stem
             base = Path(self.output_directory) / stem
@@ -170,8 +191,6 @@ class ExampleRunner:
                 raise ValueError(f"Duplicate example: {base}")
             summary.inputs.append(str(stem))
             base.parent.mkdir(exist_ok=True, parents=True)
-            parts = stem.split("-")
-            tc = parts[0]
             with open(input_example) as file:
                 if input_format == "yaml":
                     input_dict = yaml.safe_load(file)
@@ -179,36 +198,140 @@ class ExampleRunner:
                     input_dict = json.load(file)
                 else:
                     raise NotImplementedError(f"Cannot handle format: {input_format}")
-                summary.add(f"## {stem}", "### Input", "```yaml", f"{yaml.dump(input_dict)}", "```")
-                success = True
-                try:
-                    report = validator.validate(input_dict, tc)
-                    if report.results:
-                        raise Exception(
-                            "\n".join(f"[{result.severity.value}] {result.message}" for result in report.results)
-                        )
-                    # json validation is incomplete: also try object instantiation
-                    self._load_from_dict(input_dict, target_class=tc)
-                except Exception as e:
-                    success = False
-                    if not counter_examples:
-                        raise ValueError(f"Example {input_example} failed validation:\n{e}")
-                if counter_examples:
-                    if success:
-                        raise ValueError(f"Counter example {input_example} succeeded validation")
-                    continue
-                obj = self._load_from_dict(input_dict, target_class=tc)
-                for fmt in self.output_formats:
-                    output_file = f"{base}.{fmt}"
-                    if fmt == "yaml":
-                        yaml_dumper.dump(obj, to_file=output_file)
-                    elif fmt == "json":
-                        json_dumper.dump(obj, to_file=output_file)
-                    elif fmt == "ttl":
-                        rdflib_dumper.dump(obj, to_file=output_file, schemaview=sv, prefix_map=self.prefix_map)
-                    else:
-                        raise NotImplementedError(f"Cannot output in format: {fmt}")
-                    summary.outputs.append(f"{stem}.{fmt}")
+            summary.add(f"## {stem}", "### Input", "```yaml", f"{yaml.dump(input_dict)}", "```")
+            examples.append((input_example, input_dict))
+
+        manifest_path = Path(self.output_directory) / MANIFEST_FILE
+        manifest = {}
+        stamps = {}
+        if self.skip_unchanged:
+            if manifest_path.is_file():
+                manifest = json.loads(manifest_path.read_text(encoding="utf-8"))
+            for input_example, _ in examples:
+                stamps[input_example] = self._example_stamp(input_example, input_format, counter_examples)
+        unchanged = {
+            input_example
+            for input_example, _ in examples
+            if input_example in manifest
+            and manifest[input_example]["stamp"] == stamps[input_example]
+            and all((Path(self.output_directory) / output).is_file() for output in manifest[input_example]["outputs"])
+        }
+        results = self._process_all([e for e in examples if e[0] not in unchanged], counter_examples)
+        try:
+            for input_example, _ in examples:
+                if input_example in unchanged:
+                    logger.info(f"Skipping unchanged example {input_example}")
+                    outputs = manifest[input_example]["outputs"]
+                else:
+                    outputs = next(results)
+                    if self.skip_unchanged:
+                        manifest[input_example] = {"stamp": stamps[input_example], "outputs": outputs}
+                summary.outputs.extend(outputs)
+        finally:
+            results.close()
+            if self.skip_unchanged:
+                manifest_path.write_text(json.dumps(manifest, indent=2, sort_keys=True), encoding="utf-8")
+
+    def _process_all(self, examples: list[tuple[str, Any]], counter_examples: bool) -> Iterator[list[str]]:
+        """
+        Process examples, in parallel if more than one job is requested.
+
+        :param examples: Paths and parsed contents of the examples
+        :param counter_examples: If true, the examples are expected to fail validation
+        :return: Names of the files written for each example, in the order of the examples
+        """
+        if self.jobs <= 1 or len(examples) <= 1:
+            for input_example, input_dict in examples:
+                yield self._process_example(input_example, input_dict, counter_examples)
+            return
+        with ExitStack() as stack:
+            cache_dir = self.cache_dir
+            if cache_dir is None:
+                cache_dir = stack.enter_context(tempfile.TemporaryDirectory())
+            # compiled once here, the workers load the module from the cache
+            compile_module_cached(self._python_generator(), cache_dir=cache_dir)
+            options = {
+                "output_directory": self.output_directory,
+                "output_formats": self.output_formats,
+                "prefix_map": self.prefix_map,
+                "expand_dicts": self.expand_dicts,
+                "use_type_designators": self.use_type_designators,
+                "cache_dir": cache_dir,
+            }
+            executor = stack.enter_context(
+                ProcessPoolExecutor(
+                    max_workers=min(self.jobs, len(examples)),
+                    initializer=_init_example_worker,
+                    initargs=(self.schemaview.schema, options),
+                )
+            )
+            yield from executor.map(
+                _process_example_in_worker,
+                [(input_example, input_dict, counter_examples) for input_example, input_dict in examples],
+            )
+
+    def _process_example(self, input_example: str, input_dict: Any, counter_examples: bool) -> list[str]:
+        """
+        Validate an example and write it in each of the output formats.
+
+        :param input_example: Path of the example
+        :param input_dict: Parsed contents of the example
+        :param counter_examples: If true, the example is expected to fail validation
+        :return: Names of the files written, relative to the output directory
+        """
+        stem = Path(input_example).stem
+        base = Path(self.output_directory) / stem
+        tc = stem.split("-")[0]
+        try:
+            report = self.validator.validate(input_dict, tc)
+            if report.results:
+                raise Exception("\n".join(f"[{result.severity.value}] {result.message}" for result in report.results))
+            # json validation is incomplete: also try object instantiation
+            obj = self._load_from_dict(input_dict, target_class=tc)
+        except Exception as e:
+            if not counter_examples:
+                raise ValueError(f"Example {input_example} failed validation:\n{e}")
+            return []
+        if counter_examples:
+            raise ValueError(f"Counter example {input_example} succeeded validation")
+        outputs = []
+        for fmt in self.output_formats:
+            output_file = f"{base}.{fmt}"
+            if fmt == "yaml":
+                yaml_dumper.dump(obj, to_file=output_file)
+            elif fmt == "json":
+                json_dumper.dump(obj, to_file=output_file)
+            elif fmt == "ttl":
+                rdflib_dumper.dump(obj, to_file=output_file, schemaview=self.schemaview, prefix_map=self.prefix_map)
+            else:
+                raise NotImplementedError(f"Cannot output in format: {fmt}")
+            outputs.append(f"{stem}.{fmt}")
+        return outputs
+
+    def _example_stamp(self, input_example: str, input_format: str, counter_examples: bool) -> str:
+        """
+        Hash of everything the outputs of an example depend on: the example, the schema and the options.
+
+        :param input_example: Path of the example
+        :param input_format: Format of the example
+        :param counter_examples: If true, the example is expected to fail validation
+        :return: Hex digest
+        """
+        if self._schema_fingerprint is None:
+            self._schema_fingerprint = schema_fingerprint(self.schemaview)
+        options = {
+            "schema": self._schema_fingerprint,
+            "version": __version__,
+            "input_format": input_format,
+            "counter_examples": counter_examples,
+            "output_formats": list(self.output_formats),
+            "prefix_map": dict(self.prefix_map) if self.prefix_map else None,
+            "expand_dicts": self.expand_dicts,
+            "use_type_designators": self.use_type_designators,
+        }
+        digest = hashlib.sha256(json.dumps(options, sort_keys=True).encode("utf-8"))
+        digest.update(Path(input_example).read_bytes())
+        return digest.hexdigest()
 
     def _load_from_dict(self, dict_obj: Any, target_class: Union[str, ElementName] = None) -> Any:
         """
@@ -275,6 +398,20 @@ class ExampleRunner:
             return dict_obj
 
 
+_worker_runner: Optional[ExampleRunner] = None
+
+
+def _init_example_worker(schema: SchemaDefinition, options: dict) -> None:
+    """Create the runner of a worker of :meth:`.ExampleRunner.process_examples_from_list`"""
+    global _worker_runner
+    _worker_runner = ExampleRunner(schemaview=SchemaView(schema), **options)
+
+
+def _process_example_in_worker(args: tuple[str, Any, bool]) -> list[str]:
+    """Process an example in a worker of :meth:`.ExampleRunner.process_examples_from_list`"""
+    return _worker_runner._process_example(*args)
+
+
 @click.command(name="examples")
 @click.option("--schema", "-s", required=True, help="Path to linkml schema yaml file")
 @click.option("--prefixes", "-P", help="Path to prefixes")
@@ -319,6 +456,20 @@ class ExampleRunner:
     show_default=True,
     help="If true use type_designators to deepen ranges",
 )
+@click.option(
+    "--jobs",
+    "-j",
+    default=1,
+    show_default=True,
+    type=click.IntRange(min=1),
+    help="Number of processes processing examples at the same time",
+)
+@click.option(
+    "--skip-unchanged/--no-skip-unchanged",
+    default=False,
+    show_default=True,
+    help="Do not process again the examples which, as well as the schema, have not changed since the last run",
+)
 @click.version_option(__version__, "-V", "--version")
 def cli(schema, prefixes, output: TextIO, **kwargs):
     """Process a folder of examples and a folder of counter examples.
@@ -1,6 +1,7 @@
 import csv
 
 import pytest
+from click.testing import CliRunner
 from linkml_runtime.dumpers import yaml_dumper
 from linkml_runtime.linkml_model import SlotDefinition
 from linkml_runtime.loaders import csv_loader, yaml_loader
@@ -8,7 +9,7 @@ from sqlalchemy.orm import sessionmaker
 
 from linkml.utils.schema_builder import SchemaBuilder
 from linkml.utils.schema_fixer import SchemaFixer
-from linkml.utils.sqlutils import SQLStore
+from linkml.utils.sqlutils import SQLStore, main
 from tests.utils.dict_comparator import compare_objs, compare_yaml
 
 
@@ -118,3 +119,77 @@ def test_csv_limit(tmp_outputs, diff, size):
     del mod
     # dispose engine to allow creating of a new engine of same name
     endpoint.engine.dispose()
+
+
+@pytest.mark.parametrize("batch_size", [1, 1000])
+def test_sqlite_store_bulk(person, person_python, tmp_outputs, batch_size):
+    """
+    tests that a bulk dump stores the same data as a regular dump
+    """
+    endpoint = SQLStore(person["schema"], database_path=tmp_outputs["db"], include_schema_in_database=False)
+    endpoint.compile()
+    endpoint.native_module = person_python
+    endpoint.db_exists(force=True)
+    container = yaml_loader.load(person["data"], target_class=person_python.Container)
+    endpoint.dump_bulk(container, batch_size=batch_size)
+
+    x = endpoint.load_all(target_class=person_python.Container)
+    assert len(x) == 1
+    yaml_dumper.dump(x[0], to_file=tmp_outputs["data"])
+    assert compare_yaml(person["data"], tmp_outputs["data"]) == ""
+    endpoint.engine.dispose()
+
+
+@pytest.mark.parametrize("batch_size", [0, -1])
+def test_bulk_batch_size_must_be_positive(person, tmp_outputs, batch_size):
+    endpoint = SQLStore(person["schema"], database_path=tmp_outputs["db"])
+    with pytest.raises(ValueError, match="batch_size must be a positive integer"):
+        endpoint.dump_bulk([], batch_size=batch_size)
+
+    result = CliRunner().invoke(
+        main,
+        ["dump", "--schema", person["schema"], "--db", tmp_outputs["db"], "--batch-size", str(batch_size), "x.yaml"],
+    )
+    assert result.exit_code == 2
+    assert "is not in the range x>=1" in result.output
+
+
+def test_bulk_autoincrement_keys(tmp_outputs):
+    """
+    tests that bulk dumps number new rows after the existing ones
+    """
+    b = SchemaBuilder()
+    b.add_class("Person", ["name"]).add_defaults()
+    schema = b.schema
+    SchemaFixer().add_container(schema)
+    endpoint = SQLStore(schema, database_path=tmp_outputs["db"])
+    endpoint.db_exists(force=True)
+    mod = endpoint.compile_native()
+    container = mod.Container(Person_index=[mod.Person(name=f"p{i}") for i in range(5)])
+    endpoint.dump(container)
+    endpoint.dump_bulk(container, batch_size=2)
+    containers = endpoint.load_all(target_class=mod.Container)
+    assert [[p.name for p in c.Person_index] for c in containers] == [[f"p{i}" for i in range(5)]] * 2
+    endpoint.engine.dispose()
+
+
+def test_iter_load(tmp_outputs):
+    """
+    tests that objects can be loaded lazily, in batches
+    """
+    b = SchemaBuilder()
+    b.add_class("Person", ["name", "aliases"]).add_defaults()
+    b.schema.slots["aliases"].multivalued = True
+    schema = b.schema
+    SchemaFixer().add_container(schema)
+    endpoint = SQLStore(schema, database_path=tmp_outputs["db"])
+    endpoint.db_exists(force=True)
+    mod = endpoint.compile_native()
+    people = [mod.Person(name=f"p{i}", aliases=[f"a{i}", f"b{i}"]) for i in range(5)]
+    endpoint.dump(mod.Container(Person_index=people))
+    objs = endpoint.iter_load(target_class=mod.Person, batch_size=2)
+    assert not isinstance(objs, list)
+    loaded = list(objs)
+    assert len(loaded) == 5
+    assert [compare_objs(p, obj) for p, obj in zip(people, loaded)] == [""] * 5
+    endpoint.engine.dispose()
@@ -13,10 +13,11 @@ from pathlib import Path
 
 import pytest
 import yaml
+from click.testing import CliRunner
 from linkml_runtime.utils.introspection import package_schemaview
 from linkml_runtime.utils.schemaview import SchemaView
 
-from linkml.generators.docgen import DocGenerator
+from linkml.generators.docgen import DocGenerator, cli
 
 logger = logging.getLogger(__name__)
 
@@ -1247,3 +1248,34 @@ def test_classrule_to_dict_view_method(input_path, tmp_path):
 
     # Test that elseconditions is None since it's not defined in the rule
     assert rule_dict["elseconditions"] is None
+
+
+def test_docgen_jobs(kitchen_sink_path, tmp_path):
+    """Pages rendered in several processes are the same as pages rendered in one"""
+    DocGenerator(kitchen_sink_path, mergeimports=True).serialize(directory=str(tmp_path / "serial"))
+    DocGenerator(kitchen_sink_path, mergeimports=True, jobs=2).serialize(directory=str(tmp_path / "parallel"))
+    serial = {p.relative_to(tmp_path / "serial"): p.read_text() for p in (tmp_path / "serial").rglob("*.md")}
+    parallel = {p.relative_to(tmp_path / "parallel"): p.read_text() for p in (tmp_path / "parallel").rglob("*.md")}
+    assert "Person.md" in {str(p) for p in serial}
+    assert parallel == serial
+
+
+def test_docgen_jobs_must_be_positive(kitchen_sink_path, tmp_path):
+    with pytest.raises(ValueError, match="jobs must be at least 1"):
+        DocGenerator(kitchen_sink_path, jobs=0)
+    result = CliRunner().invoke(cli, [kitchen_sink_path, "--directory", str(tmp_path), "--jobs", "0"])
+    assert result.exit_code == 2
+    assert "0 is not in the range x>=1" in result.output
+
+
+def test_docgen_unchanged_files_are_not_rewritten(kitchen_sink_path, tmp_path):
+    DocGenerator(kitchen_sink_path, mergeimports=True).serialize(directory=str(tmp_path))
+    person = tmp_path / "Person.md"
+    index = tmp_path / "index.md"
+    os.utime(person, ns=(0, 0))
+    index.write_text("outdated")
+    os.utime(index, ns=(0, 0))
+    DocGenerator(kitchen_sink_path, mergeimports=True).serialize(directory=str(tmp_path))
+    assert person.stat().st_mtime_ns == 0
+    assert index.stat().st_mtime_ns != 0
+    assert index.read_text() != "outdated"
@@ -64,6 +64,33 @@ def test_jsonschema_integration(kitchen_sink_path, input_path):
     jsonschema.validate(json_instance, kitchen_sink_json_schema)
 
 
+def test_deduplicate_properties(kitchen_sink_path, input_path):
+    """Repeated property subschemas are shared, and the schema still validates the same data"""
+    expected = json.loads(JsonSchemaGenerator(kitchen_sink_path, top_class="Dataset").serialize())
+    generator = JsonSchemaGenerator(kitchen_sink_path, top_class="Dataset", deduplicate_properties=True)
+    deduplicated = json.loads(generator.serialize())
+
+    shared = [name for name in deduplicated["$defs"] if name.endswith("__property")]
+    assert shared
+    assert len(json.dumps(deduplicated)) < len(json.dumps(expected))
+    for def_name, definition in deduplicated["$defs"].items():
+        for prop_name, prop in definition.get("properties", {}).items():
+            if "$ref" in prop and prop["$ref"].endswith("__property"):
+                shared_def = deduplicated["$defs"][prop["$ref"].split("/")[-1]]
+                assert shared_def == expected["$defs"][def_name]["properties"][prop_name]
+            else:
+                assert prop == expected["$defs"][def_name]["properties"][prop_name]
+
+    # dates are loaded from YAML as objects, but are strings in JSON
+    instance = json.loads(
+        json.dumps(yaml.safe_load(Path(input_path("kitchen_sink_inst_01.yaml")).read_text()), default=str)
+    )
+    jsonschema.validate(instance, deduplicated)
+    instance["persons"][0]["age_in_years"] = "not a number"
+    with pytest.raises(jsonschema.ValidationError):
+        jsonschema.validate(instance, deduplicated)
+
+
 def test_class_uri_any(kitchen_sink_path, subtests):
     """Test that class_ur: linkml:Any results in a JSON Schema with
     "additionalProperties": true.
@@ -1,7 +1,10 @@
+import io
+
 import pytest
 from linkml_runtime.linkml_model import SlotDefinition
 from rdflib import RDFS, SKOS, Graph, Literal, Namespace
 from rdflib.collection import Collection
+from rdflib.compare import isomorphic
 from rdflib.namespace import OWL, RDF
 
 from linkml.generators.owlgen import MetadataProfile, OwlSchemaGenerator
@@ -237,3 +240,15 @@ def test_definition_uris(
         for c in owl_classes:
             # check not using the default metadata profile
             assert list(g.objects(c, SKOS.definition)) == []
+
+
+@pytest.mark.parametrize("metaclasses,type_objects", [(False, False), (True, True)])
+def test_ntriples_stream(kitchen_sink_path, metaclasses, type_objects):
+    """Streaming N-Triples output contains the same triples as the graph"""
+    kwargs = {"metaclasses": metaclasses, "type_objects": type_objects}
+    expected = OwlSchemaGenerator(kitchen_sink_path, **kwargs).as_graph()
+    stream = io.StringIO()
+    OwlSchemaGenerator(kitchen_sink_path, format="nt", **kwargs).serialize_to(stream)
+    g = Graph().parse(data=stream.getvalue(), format="nt")
+    assert len(stream.getvalue().splitlines()) == len(expected)
+    assert isomorphic(g, expected)
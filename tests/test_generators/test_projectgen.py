@@ -1,4 +1,9 @@
-from linkml.generators.projectgen import ProjectConfiguration, ProjectGenerator
+import shutil
+
+from click.testing import CliRunner
+
+from linkml.generators import projectgen
+from linkml.generators.projectgen import MANIFEST_FILE, ProjectConfiguration, ProjectGenerator
 
 
 def test_projectgen(kitchen_sink_path, tmp_path):
@@ -23,3 +28,84 @@ def test_projectgen(kitchen_sink_path, tmp_path):
     # self.check_contains("Address.md", "docs", "index.md")
     check_contains("ks:Address", "docs", "Address.md")
     check_contains('"additionalProperties": false', "jsonschema", "kitchen_sink.schema.json")
+
+
+def test_projectgen_jobs(kitchen_sink_path, tmp_path):
+    """Generators run in parallel produce the same files as when run one after another"""
+    outputs = {}
+    for jobs in [1, 3]:
+        config = ProjectConfiguration()
+        config.directory = tmp_path / str(jobs)
+        config.includes = ["jsonschema", "python", "sqltable", "excel"]
+        config.jobs = jobs
+        ProjectGenerator().generate(kitchen_sink_path, config)
+        outputs[jobs] = sorted(p.relative_to(config.directory) for p in config.directory.rglob("*") if p.is_file())
+    assert outputs[3] == outputs[1]
+
+    def read(path):
+        return [line for line in path.read_text().splitlines() if "Generation date" not in line]
+
+    for path in outputs[1]:
+        if path.suffix != ".xlsx":
+            assert read(tmp_path / "3" / path) == read(tmp_path / "1" / path)
+
+
+def test_projectgen_jobs_must_be_positive(kitchen_sink_path, tmp_path):
+    result = CliRunner().invoke(projectgen.cli, [kitchen_sink_path, "--dir", str(tmp_path), "--jobs", "0"])
+    assert result.exit_code == 2
+    assert "0 is not in the range x>=1" in result.output
+
+
+def test_projectgen_jobs_from_config_file(kitchen_sink_path, tmp_path, monkeypatch):
+    configs = []
+    monkeypatch.setattr(ProjectGenerator, "generate", lambda self, schema, config: configs.append(config))
+    config_file = tmp_path / "config.yaml"
+    config_file.write_text("jobs: 3\n")
+    result = CliRunner().invoke(projectgen.cli, [kitchen_sink_path, "--config-file", str(config_file)])
+    assert result.exit_code == 0, result.output
+    result = CliRunner().invoke(projectgen.cli, [kitchen_sink_path, "--config-file", str(config_file), "-j", "2"])
+    assert result.exit_code == 0, result.output
+    result = CliRunner().invoke(projectgen.cli, [kitchen_sink_path])
+    assert result.exit_code == 0, result.output
+    assert [config.jobs for config in configs] == [3, 2, 1]
+
+
+def test_projectgen_incremental(input_path, tmp_path, monkeypatch):
+    """Only generators whose schema or arguments changed are run again"""
+    schema_path = tmp_path / "personinfo.yaml"
+    shutil.copy(input_path("personinfo.yaml"), schema_path)
+    runs = []
+    run_generator = projectgen._run_generator
+
+    def counting_run_generator(gen_cls, *args):
+        runs.append(gen_cls.__name__)
+        return run_generator(gen_cls, *args)
+
+    monkeypatch.setattr(projectgen, "_run_generator", counting_run_generator)
+
+    def generate(**generator_args):
+        runs.clear()
+        config = ProjectConfiguration()
+        config.directory = tmp_path / "project"
+        config.includes = ["jsonschema", "python", "markdown"]
+        config.generator_args.update(generator_args)
+        config.incremental = True
+        ProjectGenerator().generate(str(schema_path), config)
+        return sorted(runs)
+
+    assert generate() == ["JsonSchemaGenerator", "MarkdownGenerator", "PythonGenerator"]
+    assert (tmp_path / "project" / MANIFEST_FILE).exists()
+    assert generate() == []
+
+    assert generate(jsonschema={"top_class": "Container"}) == ["JsonSchemaGenerator"]
+    assert generate(jsonschema={"top_class": "Container"}) == []
+
+    (tmp_path / "project" / "personinfo.py").unlink()
+    assert generate(jsonschema={"top_class": "Container"}) == ["PythonGenerator"]
+
+    schema_path.write_text(schema_path.read_text().replace("A person (alive, dead", "A human (alive, dead"))
+    assert generate(jsonschema={"top_class": "Container"}) == [
+        "JsonSchemaGenerator",
+        "MarkdownGenerator",
+        "PythonGenerator",
+    ]
@@ -1,5 +1,6 @@
 import importlib
 import inspect
+import os
 import re
 import typing
 from collections.abc import Iterable, Sequence
@@ -2599,6 +2600,33 @@ def test_generate_split_directory(input_path, tmp_path):
     assert not (tmp_path / "__init__.py").exists()
 
 
+@pytest.mark.pydanticgen_split
+def test_generate_split_jobs(input_path, tmp_path):
+    """Imported schemas can be generated in several processes, with the same result"""
+    schema = input_path("split/main.yaml")
+    serial = PydanticGenerator.generate_split(schema, tmp_path / "serial" / "main.py")
+    parallel = PydanticGenerator.generate_split(schema, tmp_path / "parallel" / "main.py", jobs=2)
+
+    assert len(parallel) == len(serial) > 2
+    for serial_result, parallel_result in zip(serial, parallel):
+        assert parallel_result.module_import == serial_result.module_import
+        assert parallel_result.serialized_module == serial_result.serialized_module
+        assert parallel_result.path.read_text() == serial_result.serialized_module
+
+
+@pytest.mark.pydanticgen_split
+def test_generate_split_unchanged_modules_are_not_rewritten(input_path, tmp_path):
+    schema = input_path("split/main.yaml")
+    output_file = tmp_path / "main.py"
+    first = PydanticGenerator.generate_split(schema, output_file)
+    for result in first:
+        os.utime(result.path, ns=(0, 0))
+
+    second = PydanticGenerator.generate_split(schema, output_file)
+    assert [r.serialized_module for r in second] == [r.serialized_module for r in first]
+    assert all(r.path.stat().st_mtime_ns == 0 for r in second)
+
+
 @pytest.mark.parametrize(
     "test,expected", [("Schema 1", "schema_1"), ("SchemaOneTwo", "schema_one_two"), ("Schema! One", "schema__one")]
 )
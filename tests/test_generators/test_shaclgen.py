@@ -1,9 +1,11 @@
+import io
 from collections import Counter
 from typing import Any
 
 import rdflib
 from rdflib import RDF, SH, Literal, URIRef
 from rdflib.collection import Collection
+from rdflib.compare import isomorphic
 
 from linkml.generators.shacl.shacl_data_type import ShaclDataType
 from linkml.generators.shaclgen import ShaclGenerator
@@ -590,3 +592,13 @@ def test_exclude_imports(input_path):
     assert len(property_paths) == 2
     assert "https://example.org/extendedProperty" in property_paths
     assert "https://example.org/baseProperty" in property_paths
+
+
+def test_ntriples_stream(kitchen_sink_path):
+    """Streaming N-Triples output contains the same triples as the graph"""
+    expected = ShaclGenerator(kitchen_sink_path).as_graph()
+    stream = io.StringIO()
+    ShaclGenerator(kitchen_sink_path, format="nt").serialize_to(stream)
+    g = rdflib.Graph().parse(data=stream.getvalue(), format="nt")
+    assert len(stream.getvalue().splitlines()) == len(expected)
+    assert isomorphic(g, expected)
@@ -0,0 +1,10 @@
+import pytest
+
+
+@pytest.fixture(autouse=True, scope="session")
+def linkml_cache_dir(tmp_path_factory):
+    """Keep the artifacts cached by the linter out of the user's cache directory"""
+    with pytest.MonkeyPatch.context() as monkeypatch:
+        cache_dir = tmp_path_factory.mktemp("linkml_cache")
+        monkeypatch.setenv("LINKML_CACHE_DIR", str(cache_dir))
+        yield cache_dir
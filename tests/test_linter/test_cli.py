@@ -361,3 +361,22 @@ classes:
                 result.stdout,
             )
             self.assertNotIn("(standard_naming)", result.stdout)
+
+    def test_jobs_and_cache_dir(self):
+        with self.runner.isolated_filesystem():
+            Path("schemas").mkdir()
+            write_schema_file()
+            Path(SCHEMA_FILE).rename("schemas/first.yaml")
+            write_schema_file()
+            Path(SCHEMA_FILE).rename("schemas/second.yaml")
+
+            serial = self.runner.invoke(main, ["schemas"])
+            parallel = self.runner.invoke(main, ["--jobs", "2", "schemas"])
+            self.assertEqual(parallel.exit_code, 2)
+            self.assertEqual(parallel.stdout, serial.stdout)
+
+            for _ in range(2):
+                cached = self.runner.invoke(main, ["--cache-dir", "cache", "schemas"])
+                self.assertEqual(cached.exit_code, 2)
+                self.assertEqual(cached.stdout, serial.stdout)
+            self.assertTrue(any(Path("cache").iterdir()))
@@ -1,18 +1,19 @@
 import yaml
+from linkml_runtime import SchemaView
 
+from linkml.generators.jsonschemagen import JsonSchemaGenerator
 from linkml.linter.config.datamodel.config import RuleLevel
-from linkml.linter.linter import Linter
+from linkml.linter.linter import Linter, LinterProblem, check_rules, get_metamodel_validator
+from linkml.linter.rules import LinterRule
 from linkml.utils.schema_builder import SchemaBuilder
 
 
 def test_rule_level_error():
-    config = yaml.safe_load(
-        """
+    config = yaml.safe_load("""
 rules:
   no_empty_title:
     level: error
-"""
-    )
+""")
     builder = SchemaBuilder()
     builder.add_class("MyClass")
     builder.add_slot("my slot")
@@ -38,13 +39,11 @@ rules:
 
 
 def test_rule_level_warning():
-    config = yaml.safe_load(
-        """
+    config = yaml.safe_load("""
 rules:
   no_empty_title:
     level: warning
-"""
-    )
+""")
     builder = SchemaBuilder()
     builder.add_class("MyClass")
     builder.add_slot("my slot")
@@ -70,13 +69,11 @@ rules:
 
 
 def test_rule_level_disabled():
-    config = yaml.safe_load(
-        """
+    config = yaml.safe_load("""
 rules:
   no_empty_title:
     level: disabled
-"""
-    )
+""")
     builder = SchemaBuilder()
     builder.add_class("MyClass")
     builder.add_slot("my slot")
@@ -89,8 +86,7 @@ rules:
 
 
 def test_no_extends():
-    config = yaml.safe_load(
-        """
+    config = yaml.safe_load("""
 rules:
   canonical_prefixes:
     level: error
@@ -99,8 +95,7 @@ rules:
       - prefixcc
   no_empty_title:
     level: warning
-"""
-    )
+""")
     linter = Linter(config)
 
     # the level is changed by the custom rules
@@ -111,8 +106,7 @@ rules:
 
 
 def test_extends_recommended():
-    config = yaml.safe_load(
-        """
+    config = yaml.safe_load("""
 extends: recommended
 rules:
   canonical_prefixes:
@@ -122,8 +116,7 @@ rules:
       - prefixcc
   no_empty_title:
     level: warning
-"""
-    )
+""")
     linter = Linter(config)
 
     # this rule is in the recommended set, the level is changed by the custom rules
@@ -138,3 +131,142 @@ rules:
 
     # this is not in the recommended or custom rules and should come from the default
     assert str(linter.config.rules.tree_root_class.level) == RuleLevel.disabled.text
+
+
+CORE_SCHEMA = """
+id: http://example.org/core
+name: core
+classes:
+  Thing:
+    description: a thing
+"""
+
+MODULE_SCHEMA = """
+id: http://example.org/{name}
+name: {name}
+imports:
+  - core
+classes:
+  {name}_class:
+    is_a: Thing
+"""
+
+
+def _schema_files(tmp_path) -> list[str]:
+    (tmp_path / "core.yaml").write_text(CORE_SCHEMA)
+    paths = []
+    for name in ["one", "two", "three"]:
+        path = tmp_path / f"{name}.yaml"
+        path.write_text(MODULE_SCHEMA.format(name=name))
+        paths.append(str(path))
+    return paths
+
+
+def _messages(results) -> list[tuple[str, list[str]]]:
+    return [(path, [f"{p.level} {p.rule_name} {p.message}" for p in problems]) for path, problems in results]
+
+
+def test_lint_files_jobs(tmp_path):
+    paths = _schema_files(tmp_path)
+    linter = Linter({"extends": "recommended"})
+    expected = [(path, [f"{p.level} {p.rule_name} {p.message}" for p in linter.lint(path)]) for path in paths]
+    assert any(messages for _, messages in expected)
+    assert _messages(linter.lint_files(paths)) == expected
+    assert _messages(linter.lint_files(paths, jobs=2)) == expected
+
+
+def test_lint_files_cache(tmp_path, monkeypatch):
+    paths = _schema_files(tmp_path)
+    cache_dir = tmp_path / "cache"
+    linter = Linter({"extends": "recommended"})
+    expected = _messages(linter.lint_files(paths, cache_dir=cache_dir))
+
+    linted = []
+    lint = Linter.lint
+
+    def recording_lint(self, schema, **kwargs):
+        linted.append(schema)
+        return lint(self, schema, **kwargs)
+
+    monkeypatch.setattr(Linter, "lint", recording_lint)
+    assert _messages(linter.lint_files(paths, cache_dir=cache_dir)) == expected
+    assert linted == []
+
+    # a change to a file or the files it imports, or to the configuration, invalidates the results
+    (tmp_path / "one.yaml").write_text(MODULE_SCHEMA.format(name="one") + "    description: the first\n")
+    assert _messages(linter.lint_files(paths, cache_dir=cache_dir)) != expected
+    assert linted == [paths[0]]
+    (tmp_path / "core.yaml").write_text(CORE_SCHEMA.replace("a thing", "anything"))
+    list(linter.lint_files(paths, cache_dir=cache_dir))
+    assert linted == [paths[0], *paths]
+    list(
+        Linter({"extends": "recommended", "rules": {"standard_naming": {"level": "disabled"}}}).lint_files(
+            paths, cache_dir=cache_dir
+        )
+    )
+    assert len(linted) == 2 * len(paths) + 1
+
+
+class ClassCountingRule(LinterRule):
+    id = "class_counting"
+
+    def visit_schema(self, context):
+        self.visited = []
+        return ()
+
+    def visit_class(self, class_definition, context):
+        self.visited.append(class_definition.name)
+        yield LinterProblem(f"Visited class {class_definition.name}")
+
+    def end_schema(self, context):
+        yield LinterProblem(f"Visited {len(self.visited)} classes")
+
+
+class ImportedClassCountingRule(ClassCountingRule):
+    id = "imported_class_counting"
+    visit_imports = True
+
+
+class CheckingRule(LinterRule):
+    id = "checking"
+
+    def check(self, schema_view, fix=False):
+        yield LinterProblem("Checked")
+
+
+def test_check_rules(tmp_path):
+    path = _schema_files(tmp_path)[0]
+    local, imported, checking = ClassCountingRule(None), ImportedClassCountingRule(None), CheckingRule(None)
+    assert local.visits_elements("class") and not local.visits_elements("slot")
+    assert not checking.visits_elements()
+
+    problems = check_rules(SchemaView(path), [local, imported])
+    assert [p.message for p in problems[local]] == ["Visited class one_class", "Visited 1 classes"]
+    assert sorted(imported.visited) == ["Thing", "one_class"]
+    assert problems[imported][-1].message == "Visited 2 classes"
+
+    assert [p.message for p in local.check(SchemaView(path))] == ["Visited class one_class", "Visited 1 classes"]
+    assert [p.message for p in checking.check(SchemaView(path))] == ["Checked"]
+
+
+def test_metamodel_validator_is_cached(tmp_path, monkeypatch):
+    monkeypatch.setenv("LINKML_CACHE_DIR", str(tmp_path))
+    get_metamodel_validator.cache_clear()
+    schema = {"id": "http://example.org/test", "classes": {"Person": {"slots": "name"}}}
+    try:
+        messages = [e.message for e in get_metamodel_validator().iter_errors(schema)]
+        assert "'name' is a required property" in messages
+        assert sorted(p.name.split("-", 1)[1] for p in tmp_path.iterdir()) == [
+            "metamodel.schema.json",
+            "metamodel.schema_compiled.py",
+        ]
+
+        def fail(self):
+            raise AssertionError("the metamodel JSON Schema is generated again")
+
+        monkeypatch.setattr(JsonSchemaGenerator, "generate", fail)
+        get_metamodel_validator.cache_clear()
+        assert [e.message for e in get_metamodel_validator().iter_errors(schema)] == messages
+        assert get_metamodel_validator().is_valid({"id": "http://example.org/test", "name": "test"})
+    finally:
+        get_metamodel_validator.cache_clear()
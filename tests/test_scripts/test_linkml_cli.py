@@ -0,0 +1,77 @@
+import subprocess
+import sys
+
+import click
+import pytest
+from click.testing import CliRunner
+
+from linkml.cli.main import LazyGroup, dev, generate, linkml
+
+from ..conftest import KITCHEN_SINK_PATH
+
+
+def _imported_modules(code: str) -> set[str]:
+    """Modules imported by running the code in a new interpreter"""
+    result = subprocess.run(
+        [sys.executable, "-c", f"{code}\nimport sys\nprint('\\n'.join(sys.modules))"],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    return set(result.stdout.split())
+
+
+def test_commands_are_imported_when_used():
+    modules = _imported_modules("from linkml.cli.main import linkml")
+    assert not [m for m in modules if m.startswith(("linkml.generators.", "linkml.linter", "linkml.validator"))]
+
+    modules = _imported_modules(
+        "from click.testing import CliRunner\n"
+        "from linkml.cli.main import linkml\n"
+        f"CliRunner().invoke(linkml, ['generate', 'yaml', {KITCHEN_SINK_PATH!r}])"
+    )
+    assert "linkml.generators.yamlgen" in modules
+    assert "linkml.generators.owlgen" not in modules
+    assert "linkml.validator" not in modules
+
+
+@pytest.mark.parametrize("group,count", [(linkml, 8), (generate, 36), (dev, 1)])
+def test_every_command_resolves(group, count):
+    ctx = click.Context(group)
+    names = group.list_commands(ctx)
+    assert len(names) == count
+    for name in names:
+        assert isinstance(group.get_command(ctx, name), click.Command), name
+
+
+def test_help_lists_commands():
+    result = CliRunner().invoke(linkml, ["generate", "--help"])
+    assert result.exit_code == 0
+    assert "json-schema" in result.output
+    assert "Generate typescript interfaces and types" in result.output
+
+
+def test_invoke_lazy_command():
+    result = CliRunner().invoke(linkml, ["generate", "yaml", KITCHEN_SINK_PATH])
+    assert result.exit_code == 0, result.output
+    assert "name: kitchen_sink" in result.output
+
+    result = CliRunner().invoke(linkml, ["generate", "no-such-generator"])
+    assert result.exit_code != 0
+    assert "No such command 'no-such-generator'" in result.output
+
+
+def test_lazy_group_rejects_non_commands():
+    group = LazyGroup(lazy_subcommands={"version": "linkml._version:__version__"})
+    with pytest.raises(ValueError, match="is not a click command"):
+        group.get_command(click.Context(group), "version")
+
+
+@pytest.mark.parametrize("group", [linkml, generate, dev])
+def test_docs_list_every_command(group):
+    sphinx_click = pytest.importorskip("sphinx_click.ext")
+    ctx = click.Context(group)
+    # resolve a command first, which must not hide the other commands from the docs
+    group.get_command(ctx, group.list_commands(ctx)[0])
+    documented = [command.name for command in sphinx_click._filter_commands(ctx)]
+    assert sorted(documented) == sorted(group.get_command(ctx, name).name for name in group.list_commands(ctx))
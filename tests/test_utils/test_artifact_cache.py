@@ -0,0 +1,56 @@
+import os
+
+from linkml_runtime.linkml_model import ClassDefinition, SchemaDefinition
+
+from linkml.utils.artifact_cache import ArtifactCache, default_cache_dir, schema_fingerprint
+
+SCHEMA = SchemaDefinition(
+    id="testschema",
+    name="testschema",
+    classes=[ClassDefinition(name="MyClass")],
+)
+
+
+def test_schema_fingerprint():
+    assert schema_fingerprint(SCHEMA) == schema_fingerprint(SCHEMA)
+    other = SchemaDefinition(id="testschema", name="testschema", classes=[ClassDefinition(name="OtherClass")])
+    assert schema_fingerprint(SCHEMA) != schema_fingerprint(other)
+
+
+def test_key_depends_on_options(tmp_path):
+    cache = ArtifactCache(tmp_path)
+    fingerprint = schema_fingerprint(SCHEMA)
+    key = cache.key(fingerprint, "jsonschema.json", closed=True)
+    assert key.endswith("-jsonschema.json")
+    assert key == cache.key(fingerprint, "jsonschema.json", closed=True)
+    assert key != cache.key(fingerprint, "jsonschema.json", closed=False)
+
+
+def test_get_put(tmp_path):
+    cache = ArtifactCache(tmp_path / "cache")
+    assert cache.get("missing") is None
+    cache.put("entry", "content")
+    assert cache.get("entry") == "content"
+    assert not [p for p in (tmp_path / "cache").iterdir() if p.name.startswith(".tmp-")]
+
+
+def test_evict_least_recently_used(tmp_path):
+    cache = ArtifactCache(tmp_path, max_size=25)
+    cache.put("a", "x" * 10)
+    cache.put("b", "x" * 10)
+    os.utime(tmp_path / "a", (0, 0))
+    os.utime(tmp_path / "b", (1, 1))
+    # reading "a" makes it the most recently used entry
+    assert cache.get("a") is not None
+    cache.put("c", "x" * 10)
+    assert cache.get("b") is None
+    assert cache.get("a") is not None
+    assert cache.get("c") is not None
+
+
+def test_default_cache_dir(tmp_path, monkeypatch):
+    monkeypatch.delenv("LINKML_CACHE_DIR", raising=False)
+    monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path / "xdg"))
+    assert default_cache_dir() == tmp_path / "xdg" / "linkml"
+    monkeypatch.setenv("LINKML_CACHE_DIR", str(tmp_path / "linkml"))
+    assert default_cache_dir() == tmp_path / "linkml"
@@ -726,3 +726,48 @@ def test_meta_neighborhood():
     #                            slotrefs={'is_a', 'apply_to', 'mixins', 'owner'},
     #                            typerefs={'boolean', 'datetime', 'uri', 'string', 'uriorcurie', 'ncname'},
     #                            subsetrefs=set()), neighbor_refs)
+
+
+@dataclass
+class LineGenerator(Generator):
+    generatorname = os.path.basename(__file__)
+    generatorversion = "0.0.1"
+    valid_formats = ["txt"]
+
+    def visit_schema(self, **kwargs) -> str:
+        return f"schema: {self.schema.name}\n"
+
+    def visit_class(self, cls: ClassDefinition) -> str:
+        return f"class: {cls.name}\n"
+
+    def visit_slot(self, aliased_slot_name: str, slot: SlotDefinition) -> str:
+        return f"slot: {aliased_slot_name}\n"
+
+
+class RecordingStream(StringIO):
+    def __init__(self) -> None:
+        super().__init__()
+        self.writes = []
+
+    def write(self, s: str) -> int:
+        self.writes.append(s)
+        return super().write(s)
+
+
+def test_serialize_to_streams_visits(input_path):
+    gen = LineGenerator(str(input_path("generator1.yaml")))
+    stream = RecordingStream()
+    gen.serialize_to(stream)
+    assert stream.getvalue() == gen.serialize()
+    assert stream.writes[0] == "schema: generator1\n"
+    assert "slot: slot1\n" in stream.writes
+    assert "class: c1\n" in stream.writes
+
+
+def test_serialize_to_overridden_serialize(input_path):
+    from linkml.generators.jsonschemagen import JsonSchemaGenerator
+
+    schema = str(input_path("generator1.yaml"))
+    stream = StringIO()
+    JsonSchemaGenerator(schema).serialize_to(stream)
+    assert stream.getvalue() == JsonSchemaGenerator(schema).serialize()
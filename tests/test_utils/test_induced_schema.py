@@ -0,0 +1,79 @@
+import pytest
+from linkml_runtime import SchemaView
+from linkml_runtime.dumpers import json_dumper
+
+from linkml import LOCAL_METAMODEL_YAML_FILE
+from linkml.utils.induced_schema import InducedSchema, induced_schema
+from tests.conftest import KITCHEN_SINK_PATH
+
+SCHEMAS = [LOCAL_METAMODEL_YAML_FILE, KITCHEN_SINK_PATH]
+
+
+def metamodel_view() -> SchemaView:
+    return SchemaView(LOCAL_METAMODEL_YAML_FILE)
+
+
+def as_induced_by_schemaview(slot) -> dict:
+    expected = json_dumper.to_dict(slot)
+    # the one intended difference: identifiers and keys are only required once SchemaView has
+    # induced them, while the index makes them required up front (see induced_schema._complete)
+    if expected.get("identifier") or expected.get("key"):
+        expected["required"] = True
+    return expected
+
+
+@pytest.mark.parametrize("schema", SCHEMAS)
+def test_class_induced_slots_match_schemaview(schema):
+    expected_view = SchemaView(schema)
+    index = InducedSchema(SchemaView(schema))
+    for class_name in expected_view.all_classes():
+        expected = [as_induced_by_schemaview(s) for s in expected_view.class_induced_slots(class_name)]
+        assert [json_dumper.to_dict(s) for s in index.class_induced_slots(class_name)] == expected, class_name
+
+
+@pytest.mark.parametrize("schema", SCHEMAS)
+def test_induced_slot_match_schemaview(schema):
+    expected_view = SchemaView(schema)
+    index = InducedSchema(SchemaView(schema))
+    for slot_name in expected_view.all_slots():
+        expected = as_induced_by_schemaview(expected_view.induced_slot(slot_name))
+        assert json_dumper.to_dict(index.induced_slot(slot_name)) == expected, slot_name
+    with pytest.raises(ValueError, match="No such slot"):
+        index.induced_slot("no_such_slot", next(iter(expected_view.all_classes())))
+
+
+def test_induced_slot_owner():
+    index = InducedSchema(metamodel_view())
+    assert index.induced_slot("name", "class_definition").owner == "class_definition"
+
+
+def test_identifier_required_before_first_induction():
+    """The intended difference with SchemaView, which only makes identifiers required once induced"""
+    index = InducedSchema(SchemaView(KITCHEN_SINK_PATH))
+    assert index.induced_slot("id", "activity").required
+    # with SchemaView, the result depends on whether the slot was induced before
+    fresh_view = SchemaView(KITCHEN_SINK_PATH)
+    assert not fresh_view.induced_slot("id", "activity").required
+    assert fresh_view.induced_slot("id", "agent").required
+
+
+def test_induced_schema_is_shared():
+    sv = metamodel_view()
+    index = induced_schema(sv)
+    assert induced_schema(sv) is index
+    assert induced_schema(metamodel_view()) is not index
+    sv.set_modified()
+    assert induced_schema(sv) is not index
+
+
+@pytest.mark.parametrize("schema", SCHEMAS)
+def test_identifier_slot_match_schemaview(schema):
+    expected_view = SchemaView(schema)
+    index = InducedSchema(SchemaView(schema))
+    for class_name in expected_view.all_classes():
+        for use_key in (False, True):
+            expected = expected_view.get_identifier_slot(class_name, use_key=use_key)
+            actual = index.identifier_slot(class_name, use_key=use_key)
+            assert (actual and actual.name) == (expected and expected.name), class_name
+    if schema == LOCAL_METAMODEL_YAML_FILE:
+        assert index.identifier_slot("class_definition").name == "name"
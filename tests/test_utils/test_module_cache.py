@@ -0,0 +1,89 @@
+import os
+
+from linkml_runtime.linkml_model import ClassDefinition, SchemaDefinition, SlotDefinition
+
+from linkml.generators import PydanticGenerator, PythonGenerator
+from linkml.utils import module_cache
+from linkml.utils.artifact_cache import ArtifactCache
+from linkml.utils.module_cache import MODULE_CACHE_DIR_ENV, compile_module_cached
+
+
+def _schema(class_name: str = "Person") -> SchemaDefinition:
+    return SchemaDefinition(
+        id="https://example.org/module_cache",
+        name="module_cache",
+        prefixes={"linkml": "https://w3id.org/linkml/"},
+        imports=["linkml:types"],
+        default_range="string",
+        slots=[SlotDefinition(name="name")],
+        classes=[ClassDefinition(name=class_name, slots=["name"])],
+    )
+
+
+def test_memory_cache(monkeypatch):
+    monkeypatch.delenv(MODULE_CACHE_DIR_ENV, raising=False)
+    monkeypatch.setattr(module_cache, "_modules", {})
+    module = compile_module_cached(PythonGenerator(_schema()))
+    assert module is compile_module_cached(PythonGenerator(_schema()))
+    assert module.Person(name="x").name == "x"
+
+    other = compile_module_cached(PythonGenerator(_schema("Organization")))
+    assert other is not module
+    assert hasattr(other, "Organization")
+
+
+def test_options_are_part_of_key(monkeypatch):
+    monkeypatch.setattr(module_cache, "_modules", {})
+    closed = compile_module_cached(PydanticGenerator(_schema(), extra_fields="forbid"))
+    open_ = compile_module_cached(PydanticGenerator(_schema(), extra_fields="allow"))
+    assert closed is not open_
+    assert closed.Person.model_config["extra"] == "forbid"
+    assert open_.Person.model_config["extra"] == "allow"
+
+
+def test_disk_cache(monkeypatch, tmp_path):
+    monkeypatch.setattr(module_cache, "_modules", {})
+    module = compile_module_cached(PythonGenerator(_schema()), cache_dir=tmp_path)
+    sources = list(tmp_path.glob("*-pythongenerator.py"))
+    assert len(sources) == 1
+    assert module.__file__ == str(sources[0])
+
+    # a new process only has the on-disk cache
+    monkeypatch.setattr(module_cache, "_modules", {})
+    monkeypatch.setenv(MODULE_CACHE_DIR_ENV, str(tmp_path))
+    module = compile_module_cached(PythonGenerator(_schema()))
+    assert module.Person(name="x").name == "x"
+    assert list(tmp_path.glob("*-pythongenerator.py")) == sources
+    # the bytecode is written once, and does not depend on the modification time of the source
+    bytecode = list((tmp_path / "__pycache__").glob(f"{sources[0].stem}.*.pyc"))
+    assert len(bytecode) == 1
+    written = bytecode[0].stat().st_mtime_ns
+    os.utime(sources[0], (0, 0))
+    monkeypatch.setattr(module_cache, "_modules", {})
+    assert compile_module_cached(PythonGenerator(_schema())).Person(name="x").name == "x"
+    assert bytecode[0].stat().st_mtime_ns == written
+
+
+def test_disk_cache_evicts_bytecode(monkeypatch, tmp_path):
+    monkeypatch.setattr(module_cache, "_modules", {})
+    compile_module_cached(PythonGenerator(_schema()), cache_dir=tmp_path)
+    (source,) = tmp_path.glob("*.py")
+    (bytecode,) = (tmp_path / "__pycache__").glob("*.pyc")
+    cache = ArtifactCache(tmp_path, max_size=source.stat().st_size + bytecode.stat().st_size - 1)
+    cache.evict()
+    assert not source.exists()
+    assert not bytecode.exists()
+
+
+def test_memory_cache_is_bounded(monkeypatch):
+    monkeypatch.delenv(MODULE_CACHE_DIR_ENV, raising=False)
+    monkeypatch.setattr(module_cache, "_modules", {})
+    monkeypatch.setattr(module_cache, "MAX_MODULES", 2)
+    first = compile_module_cached(PythonGenerator(_schema("First")))
+    second = compile_module_cached(PythonGenerator(_schema("Second")))
+    # using the first module makes the second one the least recently used
+    assert compile_module_cached(PythonGenerator(_schema("First"))) is first
+    compile_module_cached(PythonGenerator(_schema("Third")))
+    assert len(module_cache._modules) == 2
+    assert compile_module_cached(PythonGenerator(_schema("First"))) is first
+    assert compile_module_cached(PythonGenerator(_schema("Second"))) is not second
@@ -0,0 +1,44 @@
+import json
+
+from click.testing import CliRunner
+from linkml_runtime import SchemaView
+
+from linkml.generators.csvgen import CsvGenerator
+from linkml.generators.jsonschemagen import JsonSchemaGenerator
+from linkml.generators.jsonschemagen import cli as jsonschema_cli
+from linkml.utils.profiling import profile_generation
+from tests.conftest import KITCHEN_SINK_PATH
+
+
+def test_profile_generation():
+    schema = KITCHEN_SINK_PATH
+    induced_slot = SchemaView.induced_slot
+    with profile_generation() as profile:
+        JsonSchemaGenerator(schema).serialize()
+        CsvGenerator(schema).serialize()
+
+    phases = profile.phases
+    assert phases["JsonSchemaGenerator.serialize"].calls == 1
+    assert phases["LifecycleMixin.before_generate_class"].calls > 1
+    assert phases["CsvGenerator.visit_class"].calls > 1
+    assert phases["SchemaView.class_ancestors"].calls > 1
+    assert phases["JsonSchemaGenerator.serialize"].seconds >= phases["InducedSchema.class_induced_slots"].seconds
+    # methods are restored once done
+    assert SchemaView.induced_slot is induced_slot
+
+    summary = profile.summary(limit=3).splitlines()
+    assert summary[0].split() == ["Phase", "Calls", "Total", "(s)", "Mean", "(ms)"]
+    assert len(summary) == 4
+    events = profile.trace()["traceEvents"]
+    assert sum(e["name"] == "CsvGenerator.visit_class" for e in events) == phases["CsvGenerator.visit_class"].calls
+    assert all(e["ph"] == "X" and e["dur"] >= 0 for e in events)
+
+
+def test_generator_cli_profile(tmp_path):
+    trace = tmp_path / "trace.json"
+    result = CliRunner(mix_stderr=False).invoke(jsonschema_cli, [KITCHEN_SINK_PATH, "--profile-trace", str(trace)])
+    assert result.exit_code == 0, result.stderr
+    assert '"Person"' in result.stdout
+    assert "JsonSchemaGenerator.serialize" in result.stderr
+    assert "JsonSchemaGenerator.serialize" not in result.stdout
+    assert json.loads(trace.read_text())["traceEvents"]
@@ -0,0 +1,132 @@
+import threading
+import time
+
+import pytest
+from click.testing import CliRunner
+from linkml_runtime import SchemaView
+
+from linkml.generators.jsonschemagen import cli as jsonschema_cli
+from linkml.utils import watch
+from linkml.utils.schema_cache import cached_schema_loading
+from linkml.utils.watch import watch_schema
+
+pytest.importorskip("watchdog")
+
+MAIN = """
+id: https://example.org/main
+name: main
+prefixes:
+  linkml: https://w3id.org/linkml/
+imports:
+  - linkml:types
+  - core
+default_range: string
+classes:
+  Person:
+    is_a: Thing
+"""
+
+CORE = """
+id: https://example.org/core
+name: core
+classes:
+  Thing:
+    attributes:
+      name: {}
+"""
+
+
+@pytest.fixture
+def schema_path(tmp_path):
+    (tmp_path / "core.yaml").write_text(CORE)
+    path = tmp_path / "main.yaml"
+    path.write_text(MAIN)
+    return path
+
+
+def _wait_for(condition, timeout=10.0):
+    deadline = time.monotonic() + timeout
+    while not condition():
+        if time.monotonic() > deadline:
+            raise AssertionError("timed out")
+        time.sleep(0.05)
+
+
+def test_unchanged_schemas_are_not_parsed_again(schema_path):
+    with cached_schema_loading() as cache:
+        first = SchemaView(str(schema_path))
+        first.imports_closure()
+        parsed = dict(cache.schemas)
+        second = SchemaView(str(schema_path))
+        second.imports_closure()
+        assert cache.schemas == parsed
+        assert cache.files == {schema_path.resolve(), (schema_path.parent / "core.yaml").resolve()}
+    # every SchemaView gets its own copy, as generators may modify it
+    assert first.schema is not second.schema
+    assert first.get_class("Thing") is not second.get_class("Thing")
+
+
+def test_recording_loaded_files(schema_path):
+    with cached_schema_loading() as cache:
+        SchemaView(str(schema_path)).imports_closure()
+        with cache.recording() as files:
+            SchemaView(str(schema_path.parent / "core.yaml")).imports_closure()
+        assert files == {(schema_path.parent / "core.yaml").resolve()}
+        assert len(cache.files) == 2
+
+
+def test_watch_schema_reruns_on_import_change(schema_path):
+    runs = []
+    stop = threading.Event()
+
+    def run():
+        runs.append(sorted(SchemaView(str(schema_path)).all_slots()))
+
+    thread = threading.Thread(
+        target=watch_schema, args=(schema_path, run), kwargs={"stop_event": stop, "debounce": 0.05}
+    )
+    thread.start()
+    try:
+        _wait_for(lambda: runs)
+        time.sleep(0.5)
+        (schema_path.parent / "core.yaml").write_text(CORE + "      age: {}\n")
+        _wait_for(lambda: len(runs) == 2)
+    finally:
+        stop.set()
+        thread.join(10)
+    assert runs == [["name"], ["age", "name"]]
+
+
+def test_watch_schema_survives_errors(schema_path):
+    runs = []
+    stop = threading.Event()
+
+    def run():
+        runs.append(None)
+        if len(runs) == 1:
+            raise ValueError("broken schema")
+        stop.set()
+
+    thread = threading.Thread(
+        target=watch_schema, args=(schema_path, run), kwargs={"stop_event": stop, "debounce": 0.05}
+    )
+    thread.start()
+    _wait_for(lambda: runs)
+    time.sleep(0.5)
+    schema_path.write_text(MAIN + "\n")
+    thread.join(10)
+    assert len(runs) == 2
+
+
+def test_generator_cli_watch(schema_path, monkeypatch):
+    calls = []
+
+    def fake_watch_schema(path, run):
+        calls.append(path)
+        run()
+
+    monkeypatch.setattr(watch, "watch_schema", fake_watch_schema)
+    result = CliRunner().invoke(jsonschema_cli, [str(schema_path), "--watch"])
+    assert result.exit_code == 0, result.output
+    assert calls == [str(schema_path)]
+    assert '"Person"' in result.output
@@ -185,3 +185,11 @@ def test_deprecated_arguments(csv_data_file, cli_runner):
     assert result.exception is None
     assert "Warning" in result.output
     assert "--include-range-class-descendants" in result.output
+
+
+def test_jobs(cli_runner, csv_data_file):
+    data_path = csv_data_file([VALID_PERSON_1, {"id": "id:3", "full_name": "Bad Age", "age": "old"}, VALID_PERSON_2])
+    result = cli_runner.invoke(cli, ["-s", PERSONINFO_SCHEMA, "-C", "Person", "--jobs", "2", data_path])
+    assert result.exit_code == 1
+    assert "[ERROR] [" in result.output
+    assert f"{data_path}/1]" in result.output
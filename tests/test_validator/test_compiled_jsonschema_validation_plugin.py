@@ -0,0 +1,103 @@
+import jsonschema
+import pytest
+from linkml_runtime.linkml_model import SchemaDefinition
+from linkml_runtime.loaders import yaml_loader
+
+from linkml.validator.jsonschema_compiler import CompiledJsonSchemaValidator, compile_json_schema
+from linkml.validator.plugins import CompiledJsonschemaValidationPlugin, JsonschemaValidationPlugin
+from linkml.validator.validation_context import ValidationContext
+
+INSTANCES = [
+    {"id": "1", "full_name": "Person One"},
+    {"id": "1", "full_name": "Person One", "phone": "555-CALL-NOW"},
+    {"id": "1", "full_name": "Person One", "whoops": "my bad"},
+    {"id": "1", "full_name": "Person One", "age_in_years": "old"},
+    {"full_name": "No Id"},
+]
+
+
+@pytest.mark.parametrize("closed", [True, False])
+@pytest.mark.parametrize("instance", INSTANCES)
+def test_same_results_as_jsonschema_plugin(validation_context, instance, closed):
+    expected = list(JsonschemaValidationPlugin(closed=closed).process(instance, validation_context))
+    actual = list(CompiledJsonschemaValidationPlugin(closed=closed).process(instance, validation_context))
+    assert [r.message for r in actual] == [r.message for r in expected]
+    assert [r.context for r in actual] == [r.context for r in expected]
+
+
+def test_process_batch(validation_context):
+    plugin = CompiledJsonschemaValidationPlugin(closed=True)
+    results = list(plugin.process_batch(INSTANCES, validation_context))
+    assert [r.instance_index for r in results] == [1, 2, 3, 4]
+
+
+def test_compiled_source_is_cached(input_path, tmp_path):
+    schema = yaml_loader.load(input_path("personinfo.yaml"), SchemaDefinition)
+    context = ValidationContext(schema, "Person", cache_dir=tmp_path)
+    context.compiled_json_schema_validator(closed=True, include_range_class_descendants=True)
+    assert list(tmp_path.glob("*-jsonschema_compiled.py"))
+
+    context = ValidationContext(schema, "Person", cache_dir=tmp_path)
+    validator = context.compiled_json_schema_validator(closed=True, include_range_class_descendants=True)
+    assert validator.is_valid(INSTANCES[0])
+    assert not validator.is_valid(INSTANCES[1])
+
+
+JSON_SCHEMA = {
+    "$schema": "https://json-schema.org/draft/2019-09/schema",
+    "$defs": {
+        "Node": {
+            "type": "object",
+            "additionalProperties": False,
+            "required": ["id"],
+            "properties": {
+                "id": {"type": "string", "pattern": "^N"},
+                "weight": {"type": ["number", "null"], "minimum": 0, "exclusiveMaximum": 1},
+                "kind": {"enum": ["a", 1, True]},
+                "children": {"type": "array", "items": {"$ref": "#/$defs/Node"}, "maxItems": 2},
+                "either": {"oneOf": [{"type": "integer"}, {"type": "number", "minimum": 5}]},
+                "unique": {"type": "array", "uniqueItems": True},
+            },
+            "if": {"required": ["weight"]},
+            "then": {"required": ["kind"]},
+        }
+    },
+    "$ref": "#/$defs/Node",
+}
+
+
+@pytest.mark.parametrize(
+    "instance",
+    [
+        {"id": "N1"},
+        {"id": "X1"},
+        {"id": 1},
+        {"id": "N1", "extra": 1},
+        {"id": "N1", "weight": 0.5, "kind": "a"},
+        {"id": "N1", "weight": 0.5},
+        {"id": "N1", "weight": 1, "kind": 1},
+        {"id": "N1", "weight": None, "kind": True},
+        {"id": "N1", "weight": 0, "kind": 1.0},
+        {"id": "N1", "weight": 0, "kind": False},
+        {"id": "N1", "children": [{"id": "N2"}, {"id": "N3", "children": [{"id": "Y"}]}]},
+        {"id": "N1", "children": [{"id": "N2"}, {"id": "N3"}, {"id": "N4"}]},
+        {"id": "N1", "either": 3},
+        {"id": "N1", "either": 6},
+        {"id": "N1", "either": 5.5},
+        {"id": "N1", "unique": [1, 2]},
+        {"id": "N1", "unique": [1, 1]},
+        [],
+        None,
+    ],
+)
+def test_compiled_agrees_with_jsonschema(instance):
+    validator = jsonschema.Draft201909Validator(JSON_SCHEMA)
+    compiled = CompiledJsonSchemaValidator(compile_json_schema(JSON_SCHEMA), validator)
+    assert compiled.is_valid(instance) == validator.is_valid(instance)
+    assert [e.message for e in compiled.iter_errors(instance)] == [e.message for e in validator.iter_errors(instance)]
+
+
+def test_one_function_per_def():
+    source = compile_json_schema(JSON_SCHEMA)
+    assert "def validate_Node(data):" in source
+    assert "def validate(data):" in source
@@ -0,0 +1,40 @@
+import subprocess
+import sys
+
+import pytest
+
+# Generators used by the validation context, imported when a plugin first needs them
+VALIDATOR_GENERATORS = {"jsonschemagen", "pydanticgen", "pythongen", "panderagen", "shaclgen"}
+
+
+def _import(module: str) -> tuple[float, set[str]]:
+    """Time to import a module in a new interpreter, and the modules it imports"""
+    code = (
+        "import sys, time\n"
+        "start = time.perf_counter()\n"
+        f"import {module}\n"
+        "print(time.perf_counter() - start)\n"
+        "print('\\n'.join(sys.modules))"
+    )
+    result = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True)
+    seconds, *modules = result.stdout.split()
+    return float(seconds), set(modules)
+
+
+def test_validator_does_not_import_generators():
+    _, modules = _import("linkml.validator")
+    generators = {m.split(".")[2] for m in modules if m.startswith("linkml.generators.")}
+    assert generators == set()
+    assert "sqlalchemy" not in modules
+    assert "jinja2" not in modules
+
+
+@pytest.mark.slow
+def test_validator_import_time():
+    """Importing the validator is quicker than importing it with the generators it uses"""
+    validator_seconds, _ = _import("linkml.validator")
+    eager_seconds, _ = _import(
+        ", ".join(["linkml.validator", *(f"linkml.generators.{g}" for g in VALIDATOR_GENERATORS)])
+    )
+    print(f"import linkml.validator: {validator_seconds:.3f}s, with its generators: {eager_seconds:.3f}s")
+    assert validator_seconds < eager_seconds
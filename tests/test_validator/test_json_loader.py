@@ -1,8 +1,16 @@
+import gzip
+import io
 import json
+from pathlib import Path
 
 import pytest
 
-from linkml.validator.loaders import JsonLoader
+from linkml.validator import Validator
+from linkml.validator.loaders import JsonLinesLoader, JsonLoader, default_loader_for_file
+from linkml.validator.loaders.json_loader import _iter_json_stream
+from linkml.validator.plugins import JsonschemaValidationPlugin
+
+PERSONINFO_SCHEMA = str(Path(__file__).parent / "input/personinfo.yaml")
 
 
 def test_load_object(tmp_file_factory):
@@ -31,3 +39,111 @@ def test_load_list_of_objects(tmp_file_factory):
     assert next(instances) == test_data[1]
     with pytest.raises(StopIteration):
         next(instances)
+
+
+def test_load_list_of_objects_across_chunks(tmp_file_factory):
+    test_data = [{"id": i, "name": "x" * (i % 7), "score": i * 1.5, "tags": [None, True]} for i in range(500)]
+    json_file = tmp_file_factory("data.json", json.dumps(test_data, indent=2))
+
+    with open(json_file) as stream:
+        assert list(_iter_json_stream(stream, chunk_size=7)) == test_data
+
+
+@pytest.mark.parametrize("contents", ["[]", " [ ] ", "12345", '"string"'])
+def test_load_scalar_and_empty_roots(tmp_file_factory, contents):
+    json_file = tmp_file_factory("data.json", contents)
+
+    with open(json_file) as stream:
+        instances = list(_iter_json_stream(stream, chunk_size=2))
+    expected = json.loads(contents)
+    assert instances == (expected if isinstance(expected, list) else [expected])
+
+
+@pytest.mark.parametrize("contents", ["", "[{}, {}", "[{} {}]", "[{}] []"])
+def test_load_invalid_json(tmp_file_factory, contents):
+    json_file = tmp_file_factory("data.json", contents)
+
+    loader = JsonLoader(json_file)
+    with pytest.raises(json.JSONDecodeError):
+        list(loader.iter_instances())
+
+
+def test_invalid_json_is_not_read_to_the_end():
+    class CountingStream(io.StringIO):
+        read_size = 0
+
+        def read(self, size=-1):
+            chunk = super().read(size)
+            self.read_size += len(chunk)
+            return chunk
+
+    stream = CountingStream('[{"id": 1}, {"id" 2}, ' + '{"id": 3}, ' * 100_000 + "{}]")
+    with pytest.raises(json.JSONDecodeError, match="Expecting ':' delimiter"):
+        list(_iter_json_stream(stream, chunk_size=64))
+    assert stream.read_size < 1024
+
+
+@pytest.mark.parametrize("chunk_size", [1, 2, 3, 5])
+def test_load_numbers_and_literals_across_chunks(chunk_size):
+    contents = '[1.5, -2e10, 3.25E-3, true, false, null, "\\u00e9\\n", 12345678901234567890]'
+    stream = io.StringIO(contents)
+    assert list(_iter_json_stream(stream, chunk_size=chunk_size)) == json.loads(contents)
+
+
+@pytest.mark.parametrize("filename", ["data.json", "data.jsonl"])
+def test_load_removes_jsonld_keys_and_empty_values(tmp_file_factory, filename):
+    test_data = [{"id": "p1", "name": None, "@type": "Person", "aliases": [], "address": {"street": "1 Main St"}}]
+    if filename.endswith(".jsonl"):
+        contents = "\n".join(json.dumps(d) for d in test_data)
+    else:
+        contents = json.dumps(test_data)
+    loader = default_loader_for_file(tmp_file_factory(filename, contents))
+    assert list(loader.iter_instances()) == [{"id": "p1", "address": {"street": "1 Main St"}}]
+
+
+def test_validate_jsonld_keys_and_null_values_closed(tmp_file_factory):
+    json_file = tmp_file_factory("data.json", '[{"id": "p1", "full_name": "A", "age": null, "@type": "Person"}]')
+    validator = Validator(PERSONINFO_SCHEMA, validation_plugins=[JsonschemaValidationPlugin(closed=True)])
+    report = validator.validate_source(JsonLoader(json_file), "Person")
+    assert report.results == []
+
+
+def test_load_gzip_compressed(tmp_path):
+    test_data = [{"id": 1}, {"id": 2}]
+    json_file = tmp_path / "data.json.gz"
+    with gzip.open(json_file, "wt") as file:
+        json.dump(test_data, file)
+
+    loader = default_loader_for_file(json_file)
+    assert isinstance(loader, JsonLoader)
+    assert list(loader.iter_instances()) == test_data
+
+
+@pytest.mark.parametrize("filename", ["data.jsonl", "data.ndjson"])
+def test_load_json_lines(tmp_file_factory, filename):
+    test_data = [{"id": 1}, {"id": 2}, {"id": 3}]
+    contents = "\n".join(json.dumps(d) for d in test_data) + "\n\n"
+    jsonl_file = tmp_file_factory(filename, contents)
+
+    loader = default_loader_for_file(jsonl_file)
+    assert isinstance(loader, JsonLinesLoader)
+    instances = loader.iter_instances()
+    assert next(instances) == test_data[0]
+    assert next(instances) == test_data[1]
+    assert next(instances) == test_data[2]
+    with pytest.raises(StopIteration):
+        next(instances)
+
+
+def test_load_json_lines_gzip_compressed(tmp_path):
+    test_data = [{"id": 1}, {"id": 2}]
+    jsonl_file = tmp_path / "data.jsonl.gz"
+    with gzip.open(jsonl_file, "wt") as file:
+        file.write("\n".join(json.dumps(d) for d in test_data))
+
+    assert list(default_loader_for_file(jsonl_file).iter_instances()) == test_data
+
+
+def test_compressed_unsupported_format():
+    with pytest.raises(ValueError):
+        default_loader_for_file("data.csv.gz")
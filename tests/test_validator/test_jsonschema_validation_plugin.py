@@ -27,6 +27,19 @@ def test_invalid_instance(validation_context):
         next(result_iter)
 
 
+def test_process_batch(validation_context):
+    plugin = JsonschemaValidationPlugin()
+    instances = [
+        {"id": "1", "full_name": "Person One"},
+        {"id": "2", "full_name": "Person Two", "phone": "555-CALL-NOW"},
+        {"id": "3", "full_name": "Person Three"},
+    ]
+    results = list(plugin.process_batch(instances, validation_context))
+    assert len(results) == 1
+    assert results[0].instance_index == 1
+    assert "'555-CALL-NOW' does not match" in results[0].message
+
+
 def test_invalid_instance_closed(validation_context):
     plugin = JsonschemaValidationPlugin(closed=True)
     instance = {
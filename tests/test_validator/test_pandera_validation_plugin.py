@@ -0,0 +1,140 @@
+import pytest
+from linkml_runtime.linkml_model import SchemaDefinition
+from linkml_runtime.loaders import yaml_loader
+
+from linkml.validator import Validator
+from linkml.validator.loaders import CsvLoader, TsvLoader
+from linkml.validator.plugins import PanderaValidationPlugin
+from linkml.validator.validation_context import ValidationContext
+
+pytest.importorskip("polars")
+pytest.importorskip("pandera.polars")
+
+SCHEMA = """
+id: https://w3id.org/linkml/examples/measurements
+name: measurements
+prefixes:
+  linkml: https://w3id.org/linkml/
+imports:
+  - linkml:types
+default_range: string
+classes:
+  Measurement:
+    attributes:
+      id:
+        identifier: true
+        range: integer
+      label:
+        required: true
+        pattern: "^[A-Z]"
+      value:
+        range: float
+        minimum_value: 0
+      unit:
+        range: Unit
+      taken:
+        range: date
+enums:
+  Unit:
+    permissible_values:
+      mm: {}
+      cm: {}
+"""
+
+
+@pytest.fixture(scope="module")
+def context() -> ValidationContext:
+    return ValidationContext(yaml_loader.load(SCHEMA, SchemaDefinition), "Measurement")
+
+
+def test_valid_batch(context):
+    instances = [
+        {"id": 1, "label": "A", "value": 1.5, "unit": "mm", "taken": "2024-01-01"},
+        {"id": 2, "label": "B", "value": 2},
+    ]
+    assert list(PanderaValidationPlugin().process_batch(instances, context)) == []
+
+
+def test_results_are_reported_per_row(context):
+    instances = [
+        {"id": 1, "label": "A"},
+        {"id": 2, "label": "b", "value": -1},
+        {"id": "three", "unit": "km", "taken": "yesterday"},
+        {"id": 4, "label": "D", "value": "heavy", "colour": "red"},
+    ]
+    results = list(PanderaValidationPlugin(closed=True).process_batch(instances, context))
+    assert [(r.instance_index, r.message) for r in results] == [
+        (1, "'b' failed check str_matches('^[A-Z]') in /label"),
+        (1, "-1 failed check greater_than_or_equal_to(0) in /value"),
+        (2, "'three' is not of type 'integer' in /id"),
+        (2, "'km' is not one of ['mm', 'cm'] in /unit"),
+        (2, "'yesterday' is not a valid date in /taken"),
+        (2, "'label' is a required property"),
+        (3, "Additional properties are not allowed ('colour' unexpected)"),
+        (3, "'heavy' is not of type 'number' in /value"),
+    ]
+    assert results[0].instance is instances[1]
+
+
+def test_nested_class_is_rejected(validation_context):
+    with pytest.raises(ValueError, match="cannot be validated by PanderaValidationPlugin"):
+        PanderaValidationPlugin().pre_process(validation_context)
+
+
+def test_columns_are_computed_once(context, monkeypatch):
+    plugin = PanderaValidationPlugin()
+    plugin.pre_process(context)
+    monkeypatch.setattr(plugin, "_build_columns", lambda context: pytest.fail("columns computed again"))
+    instances = [{"id": 1, "label": "A"}]
+    assert list(plugin.process_batch(instances, context)) == []
+    assert list(plugin.process_batch(instances, context)) == []
+
+
+def test_nested_class_is_rejected_before_starting_workers(validation_context):
+    validator = Validator(
+        validation_context.schema_view.schema, validation_plugins=[PanderaValidationPlugin()], workers=2
+    )
+    with pytest.raises(ValueError, match="cannot be validated by PanderaValidationPlugin"):
+        validator.validate({"id": "P:1"}, validation_context.target_class)
+
+
+@pytest.mark.parametrize("workers", [1, 2])
+def test_validate_csv(tmp_file_factory, workers):
+    rows = ["id,label,value,unit"] + [f"{i},L{i},{i / 2},mm" for i in range(250)] + ["250,l250,-1,mm"]
+    csv_file = tmp_file_factory("measurements.csv", "\n".join(rows) + "\n")
+    validator = Validator(
+        yaml_loader.load(SCHEMA, SchemaDefinition),
+        validation_plugins=[PanderaValidationPlugin()],
+        batch_size=100,
+        workers=workers,
+    )
+    report = validator.validate_source(CsvLoader(csv_file), "Measurement")
+    assert [(r.instance_index, r.instance["label"]) for r in report.results] == [(250, "l250"), (250, "l250")]
+
+
+def test_validate_tsv_without_instances(tmp_file_factory, monkeypatch):
+    rows = [
+        "id\tlabel\tvalue\tunit\ttaken\tcolour",
+        "1\tA\t1.5\tmm\t2024-01-01\t",
+        "",
+        "2\tb\t-1\t\t\t",
+        "three\t\theavy\tkm\tyesterday\tred",
+        "4\t D\t2\tcm\t 2024-01-02\t",
+    ]
+    tsv_file = tmp_file_factory("measurements.tsv", "\n".join(rows) + "\n")
+    plugin = PanderaValidationPlugin(closed=True)
+    # the file is read by Polars rather than by the loader
+    monkeypatch.setattr(plugin, "process_batch", lambda instances, context: pytest.fail("rows read by the loader"))
+    validator = Validator(yaml_loader.load(SCHEMA, SchemaDefinition), validation_plugins=[plugin], batch_size=2)
+    report = validator.validate_source(TsvLoader(tsv_file), "Measurement")
+    assert [(r.instance_index, r.message) for r in report.results] == [
+        (1, "'b' failed check str_matches('^[A-Z]') in /label"),
+        (1, "-1.0 failed check greater_than_or_equal_to(0) in /value"),
+        (2, "Additional properties are not allowed ('colour' unexpected)"),
+        (2, "'three' is not of type 'integer' in /id"),
+        (2, "'heavy' is not of type 'number' in /value"),
+        (2, "'km' is not one of ['mm', 'cm'] in /unit"),
+        (2, "'yesterday' is not a valid date in /taken"),
+        (2, "'label' is a required property"),
+    ]
+    assert report.results[0].instance == {"id": "2", "label": "b", "value": "-1"}
@@ -0,0 +1,34 @@
+import pytest
+
+from linkml.validator.plugins.shacl_validation_plugin import ShaclValidationPlugin
+
+pytest.importorskip("pyshacl")
+
+EX = "http://example.org/"
+
+INSTANCES = [
+    {"id": EX + "1", "full_name": "Person One"},
+    {"id": EX + "2"},
+    {"id": EX + "3", "full_name": "Person Three", "phone": "555-CALL-NOW"},
+    {"id": EX + "4", "full_name": "Person Four"},
+]
+
+
+def test_process_batch_matches_process(validation_context):
+    plugin = ShaclValidationPlugin()
+    expected = [
+        (index, result.message)
+        for index, instance in enumerate(INSTANCES)
+        for result in plugin.process(instance, validation_context)
+    ]
+    actual = [(result.instance_index, result.message) for result in plugin.process_batch(INSTANCES, validation_context)]
+    assert sorted(actual) == sorted(expected)
+
+
+def test_process_batch_maps_focus_nodes(validation_context):
+    plugin = ShaclValidationPlugin()
+    results = list(plugin.process_batch(INSTANCES, validation_context))
+    assert [r.instance_index for r in results if "failed at class instantiation stage" in r.message] == [1]
+    pattern_results = [r for r in results if "PatternConstraintComponent" in r.message]
+    assert [r.instance_index for r in pattern_results] == [2]
+    assert pattern_results[0].instance.id == EX + "3"
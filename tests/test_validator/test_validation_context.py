@@ -0,0 +1,27 @@
+from linkml_runtime.linkml_model import SchemaDefinition
+from linkml_runtime.loaders import yaml_loader
+
+from linkml.validator.validation_context import ValidationContext
+
+
+def test_artifact_cache(input_path, tmp_path):
+    schema = yaml_loader.load(input_path("personinfo.yaml"), SchemaDefinition)
+
+    context = ValidationContext(schema, "Person", cache_dir=tmp_path)
+    validator = context.json_schema_validator(closed=True, include_range_class_descendants=False)
+    context.pydantic_model(closed=True)
+    context.shacl_graph()
+    cached = sorted(p.name.split("-", 1)[1] for p in tmp_path.iterdir())
+    assert cached == ["jsonschema.json", "pydantic.py", "shacl.ttl"]
+
+    # generators may modify the schema they are given, so load a fresh copy as a new process would
+    schema = yaml_loader.load(input_path("personinfo.yaml"), SchemaDefinition)
+    second_context = ValidationContext(schema, "Person", cache_dir=tmp_path)
+    second_validator = second_context.json_schema_validator(closed=True, include_range_class_descendants=False)
+    assert second_validator.schema == validator.schema
+    assert second_context.pydantic_model(closed=True).__name__ == "Person"
+    assert len(second_context.shacl_graph()) == len(context.shacl_graph())
+    assert len(list(tmp_path.iterdir())) == 3
+
+    second_context.json_schema_validator(closed=False, include_range_class_descendants=False)
+    assert len(list(tmp_path.iterdir())) == 4
@@ -1,3 +1,4 @@
+import os
 from collections.abc import Iterable
 
 import pytest
@@ -174,3 +175,132 @@ classes:
 
     report = validator.validate({"an_attribute": "something"})
     assert report.results == []
+
+
+class FailOnOddIdValidationPlugin(ValidationPlugin):
+    def process(self, instance: dict, context: ValidationContext) -> Iterable[ValidationResult]:
+        if instance["id"] % 2:
+            yield ValidationResult(
+                type="fail on odd id",
+                severity=Severity.ERROR,
+                message=f"Odd id {instance['id']}",
+                instance=instance,
+                instantiates=context.target_class,
+            )
+
+
+def test_iter_results_from_source_parallel():
+    validator = Validator(SCHEMA, [FailOnOddIdValidationPlugin()], workers=3, batch_size=4)
+    loader = TestDataLoader(None, 50)
+    results = list(validator.iter_results_from_source(loader))
+    assert [r.instance_index for r in results] == list(range(1, 50, 2))
+    assert [r.message for r in results] == [f"Odd id {i}" for i in range(1, 50, 2)]
+    assert all(r.instantiates == "TreeRoot" for r in results)
+
+
+def test_iter_results_from_source_parallel_strict():
+    validator = Validator(SCHEMA, [FailOnOddIdValidationPlugin()], strict=True, workers=3, batch_size=4)
+    loader = TestDataLoader(None, 50)
+    results = list(validator.iter_results_from_source(loader))
+    assert len(results) == 1
+    assert results[0].instance_index == 1
+
+
+def test_iter_results_from_source_batched_order():
+    plugins = [FailOnOddIdValidationPlugin(), AcceptNothingValidationPlugin(1)]
+    validator = Validator(SCHEMA, plugins, batch_size=3)
+    loader = TestDataLoader(None, 7)
+    results = list(validator.iter_results_from_source(loader))
+    expected = []
+    for i in range(7):
+        if i % 2:
+            expected.append((i, "fail on odd id"))
+        expected.append((i, "accept nothing"))
+    assert [(r.instance_index, r.type) for r in results] == expected
+
+
+def test_iter_results_from_source_batched_strict():
+    validator = Validator(SCHEMA, [AcceptAnythingValidationPlugin(), FailOnOddIdValidationPlugin()], strict=True)
+    loader = TestDataLoader(None, 10)
+    results = list(validator.iter_results_from_source(loader))
+    assert len(results) == 1
+    assert results[0].instance_index == 1
+
+
+class RecordInstancesValidationPlugin(FailOnOddIdValidationPlugin):
+    """Records the id of each instance it processes, and validates instances in batches"""
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.ids = []
+
+    def process(self, instance: dict, context: ValidationContext) -> Iterable[ValidationResult]:
+        self.ids.append(instance["id"])
+        yield from super().process(instance, context)
+
+    def process_batch(self, instances: list[dict], context: ValidationContext) -> Iterable[ValidationResult]:
+        return super().process_batch(instances, context)
+
+
+def test_iter_results_from_source_strict_stops_before_later_instances():
+    plugin = RecordInstancesValidationPlugin()
+    validator = Validator(SCHEMA, [plugin], strict=True)
+    results = validator.iter_results_from_source(TestDataLoader(None, 10))
+    assert next(results).instance_index == 1
+    assert plugin.ids == [0, 1]
+    assert list(results) == []
+    assert plugin.ids == [0, 1]
+
+
+def test_iter_results_from_source_uses_batches():
+    plugin = RecordInstancesValidationPlugin()
+    validator = Validator(SCHEMA, [plugin], batch_size=4)
+    results = validator.iter_results_from_source(TestDataLoader(None, 10))
+    assert next(results).instance_index == 1
+    # the whole first batch is validated before its first result is yielded
+    assert plugin.ids == [0, 1, 2, 3]
+
+
+class RecordHooksValidationPlugin(ValidationPlugin):
+    """Appends the hooks called in each process to a file, as ``<pid> <hook>`` lines"""
+
+    def __init__(self, path) -> None:
+        super().__init__()
+        self.path = path
+
+    def _record(self, hook: str) -> None:
+        with open(self.path, "a") as file:
+            file.write(f"{os.getpid()} {hook}\n")
+
+    def pre_process(self, context: ValidationContext) -> None:
+        self._record("pre_process")
+
+    def process(self, instance: dict, context: ValidationContext) -> Iterable[ValidationResult]:
+        self._record("process")
+        return []
+
+    def post_process(self, context: ValidationContext) -> None:
+        self._record("post_process")
+
+
+@pytest.mark.parametrize("workers", [1, 2])
+def test_pre_and_post_process_are_paired(tmp_path, workers):
+    path = tmp_path / "hooks.txt"
+    validator = Validator(SCHEMA, [RecordHooksValidationPlugin(str(path))], workers=workers, batch_size=2)
+    assert list(validator.iter_results_from_source(TestDataLoader(None, 10))) == []
+
+    hooks_by_process = {}
+    for line in path.read_text().splitlines():
+        pid, hook = line.split()
+        hooks_by_process.setdefault(pid, []).append(hook)
+    assert len(hooks_by_process) >= workers
+    for hooks in hooks_by_process.values():
+        assert hooks[0] == "pre_process"
+        assert hooks[-1] == "post_process"
+        assert set(hooks[1:-1]) <= {"process"}
+    assert sum(hooks.count("process") for hooks in hooks_by_process.values()) == 10
+
+
+def test_invalid_workers():
+    with pytest.raises(ValueError):
+        Validator(SCHEMA, workers=0)
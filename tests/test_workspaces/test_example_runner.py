@@ -10,7 +10,7 @@ import pytest
 from linkml_runtime import SchemaView
 from prefixmaps.io.parser import load_multi_context
 
-from linkml.workspaces.example_runner import ExampleRunner
+from linkml.workspaces.example_runner import ExampleRunner, SummaryDocument
 
 
 @pytest.fixture
@@ -60,3 +60,48 @@ def test_example_runner_non_defaults(example_runner):
     assert "Container-002.ttl" in example_runner.summary.outputs
     assert "Container-001" not in md
     assert "Container-002" in md
+
+
+def test_example_runner_jobs(example_runner, tmp_path):
+    """Processing examples in parallel gives the same summary and outputs."""
+    example_runner.process_examples()
+    parallel_runner = ExampleRunner(
+        schemaview=example_runner.schemaview,
+        input_directory=example_runner.input_directory,
+        counter_example_input_directory=example_runner.counter_example_input_directory,
+        output_directory=tmp_path / "parallel",
+        prefix_map=example_runner.prefix_map,
+        jobs=2,
+    )
+    parallel_runner.process_examples()
+    assert str(parallel_runner.summary) == str(example_runner.summary)
+    assert parallel_runner.summary.outputs == example_runner.summary.outputs
+    for output in example_runner.summary.outputs:
+        assert (tmp_path / "parallel" / output).read_text() == (tmp_path / output).read_text()
+
+
+def test_example_runner_skip_unchanged(example_runner, tmp_path, monkeypatch):
+    """Examples are only processed again once they change."""
+    example_runner.skip_unchanged = True
+    example_runner.process_examples()
+    outputs = example_runner.summary.outputs
+    assert outputs
+
+    processed = []
+    process_example = ExampleRunner._process_example
+
+    def recording_process_example(self, input_example, *args):
+        processed.append(input_example)
+        return process_example(self, input_example, *args)
+
+    monkeypatch.setattr(ExampleRunner, "_process_example", recording_process_example)
+    example_runner.summary = SummaryDocument()
+    example_runner.process_examples()
+    assert processed == []
+    assert example_runner.summary.outputs == outputs
+
+    (tmp_path / outputs[0]).unlink()
+    example_runner.summary = SummaryDocument()
+    example_runner.process_examples()
+    assert len(processed) == 1
+    assert example_runner.summary.outputs == outputs